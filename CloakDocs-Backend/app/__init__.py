@@ -47,6 +47,10 @@ def create_app(test_config=None):
     # Uploads klasörünü oluştur
     os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
     
+    # Kurum sözlüğünü ilk istekten önce derle
+    from app.utils.institution_gazetteer import get_institution_gazetteer
+    get_institution_gazetteer()
+    
     # API nesnesi oluştur
     api = Api(
         app, 
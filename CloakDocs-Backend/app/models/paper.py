@@ -470,4 +470,102 @@ class Paper:
         except Exception as e:
             print(f"Makale revizyonları getirme hatası: {e}")
             traceback.print_exc()
-            return [] 
\ No newline at end of file
+            return []
+    
+    @staticmethod
+    def save_page_record(paper_id, options, detector_version, record):
+        """
+        Revizyonlarda artımlı tespit için makalenin sayfa parmak izlerini ve sayfa varlıklarını
+        kaydetme (aynı makale ve seçenekler için önceki kaydın üzerine yazılır)
+        """
+        try:
+            sql = """
+                INSERT INTO paper_page_records (paper_id, options, detector_version, record)
+                VALUES (%s, %s, %s, %s)
+                ON CONFLICT (paper_id, options) DO UPDATE
+                SET detector_version = EXCLUDED.detector_version,
+                    record = EXCLUDED.record,
+                    updated_at = CURRENT_TIMESTAMP
+                RETURNING id
+            """
+            
+            record_json = json.dumps(record, ensure_ascii=False)
+            result = query(sql, (paper_id, options, detector_version, record_json), one=True, commit=True)
+            return bool(result)
+        except Exception as e:
+            print(f"Sayfa kaydı kaydedilirken hata: {str(e)}")
+            traceback.print_exc()
+            return False
+    
+    @staticmethod
+    def get_page_record(paper_id, options, detector_version):
+        """
+        Makalenin sayfa parmak izlerini ve sayfa varlıklarını getirme. Farklı bir dedektör
+        sürümüyle oluşturulmuş kayıtlar kullanılmaz.
+        
+        Returns:
+            dict: build_page_record çıktısı veya kayıt yoksa None
+        """
+        try:
+            sql = """
+                SELECT record FROM paper_page_records
+                WHERE paper_id = %s AND options = %s AND detector_version = %s
+            """
+            
+            result = query(sql, (paper_id, options, detector_version), one=True)
+            if not result or not result.get('record'):
+                return None
+            return json.loads(result['record'])
+        except Exception as e:
+            print(f"Sayfa kaydı getirilirken hata: {str(e)}")
+            traceback.print_exc()
+            return None
+    
+    @staticmethod
+    def get_confirmed_entities(email, original_paper_id=None, exclude_paper_id=None):
+        """
+        Aynı gönderen e-postasına veya aynı orijinal makaleye (ve revizyonlarına) ait önceki
+        anonimleştirmelerde tespit edilen varlıkları getirir. exclude_paper_id verilirse o makalenin
+        kendi anonimleştirmeleri dahil edilmez (aynı makalenin tekrar işlenmesinde sonuç değişmez).
+        
+        Returns:
+            dict: {varlık_tipi: [metinler]} - en yeni anonimleştirmeden başlayarak, tekrarsız
+        """
+        confirmed = {
+            "author_name": [],
+            "contact_info": [],
+            "institution_info": []
+        }
+        
+        try:
+            sql = """
+                SELECT af.encrypted_examples
+                FROM anonymized_files af
+                JOIN papers p ON p.id = af.paper_id
+                WHERE (p.email = %s OR p.id = %s OR p.original_paper_id = %s)
+                  AND p.id IS DISTINCT FROM %s
+                ORDER BY af.created_at DESC
+                LIMIT 20
+            """
+            
+            results = query(sql, (email, original_paper_id, original_paper_id, exclude_paper_id))
+            
+            for result in results or []:
+                if not result.get('encrypted_examples'):
+                    continue
+                try:
+                    examples = json.loads(result['encrypted_examples'])
+                except (json.JSONDecodeError, TypeError):
+                    continue
+                
+                for entity_type, values in confirmed.items():
+                    for example in examples.get(entity_type, []):
+                        original = example.get("original") if isinstance(example, dict) else None
+                        if original and original not in values:
+                            values.append(original)
+            
+            return confirmed
+        except Exception as e:
+            print(f"Onaylı varlıklar getirilirken hata: {str(e)}")
+            traceback.print_exc()
+            return confirmed
@@ -8,11 +8,7 @@ import datetime
 import tempfile
 import shutil
 from pypdf import PdfReader, PdfWriter
-import nltk
-from nltk.tokenize import word_tokenize, sent_tokenize
 import re
-import spacy
-import importlib.util
 from pathlib import Path
 import logging
 import json
@@ -24,34 +20,6 @@ from app.utils.logger import log_paper_event, PaperEventType
 # Yeni eklenen import - Test modülü
 from app.utils.text_extractor_test import test_pdf_extraction
 
-# Check if scispacy is installed, if not, try to install it
-try:
-    import scispacy
-    HAVE_SCISPACY = True
-    logging.info("SciSpaCy is already installed.")
-except ImportError:
-    HAVE_SCISPACY = False
-    logging.warning("SciSpaCy is not installed. Will attempt to install it.")
-    try:
-        import subprocess
-        logging.info("Installing SciSpaCy...")
-        subprocess.run([sys.executable, "-m", "pip", "install", "scispacy"], check=True)
-        
-        # Try to install scientific model
-        logging.info("Installing scientific NLP model...")
-        subprocess.run([
-            sys.executable, "-m", "pip", "install", 
-            "https://s3-us-west-2.amazonaws.com/ai2-s2-scispacy/releases/v0.5.3/en_core_sci_md-0.5.3.tar.gz"
-        ], check=True)
-        
-        # Re-import after installation
-        import scispacy
-        HAVE_SCISPACY = True
-        logging.info("SciSpaCy installed successfully.")
-    except Exception as e:
-        logging.error(f"Failed to install SciSpaCy: {str(e)}")
-        HAVE_SCISPACY = False
-
 # PyMuPDF (fitz) kütüphanesini import et (eğer yüklü değilse: pip install pymupdf)
 try:
     import fitz  # PyMuPDF
@@ -60,57 +28,38 @@ except ImportError:
     HAVE_PYMUPDF = False
     logging.warning("PyMuPDF (fitz) kütüphanesi yüklü değil. Basit PDF anonimleştirme kullanılacak.")
 
-# Gerekli NLTK paketlerini indirme
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-
-# Load the Scientific NLP model if available, otherwise fall back to standard model
-try:
-    if HAVE_SCISPACY:
-        try:
-            # Try loading the scientific model first
-            nlp = spacy.load("en_core_sci_md")
-            logging.info("Loaded scientific NLP model (en_core_sci_md)")
-        except OSError:
-            # If the specific model isn't found, try downloading it
-            logging.warning("Scientific model not found, will attempt to download it...")
-            subprocess.run([
-                sys.executable, "-m", "pip", "install", 
-                "https://s3-us-west-2.amazonaws.com/ai2-s2-scispacy/releases/v0.5.3/en_core_sci_md-0.5.3.tar.gz"
-            ], check=True)
-            nlp = spacy.load("en_core_sci_md")
-            logging.info("Downloaded and loaded scientific NLP model (en_core_sci_md)")
-    else:
-        # Fall back to standard model if SciSpaCy isn't available
-        nlp = spacy.load("en_core_web_lg")  # Use large model for better entity recognition
-        logging.info("Loaded standard NLP model (en_core_web_lg)")
-except OSError:
-    # If all else fails, use the small model which is usually available
-    logging.warning("Preferred models not found. Downloading standard model...")
-    import subprocess
-    subprocess.run([sys.executable, "-m", "spacy", "download", "en_core_web_sm"])
-    nlp = spacy.load("en_core_web_sm")
-    logging.info("Loaded small standard NLP model (en_core_web_sm)")
-
 # Özel modülleri import et
-from app.utils.text_extractor import extract_text_from_pdf
-from app.utils.entity_detector import detect_entities
+from app.utils.text_extractor import section_text
+from app.utils.extraction_cache import get_extracted_text, get_layout_pages
+from app.utils.entity_detector import detect_entities, DETECTION_STAGES
+from app.utils.layout_templates import classify_layout_blocks_with_template
 from app.utils.anonymize_processor import anonymize_pdf, save_anonymized_file, resolve_file_path
+from app.utils.detection_cache import (
+    file_digest, get_cached_entities, store_entities,
+    get_page_record, store_page_record
+)
+from app.utils.revision_detection import detect_entities_for_revision, build_page_record
+from app.utils.identity_index import IdentityIndex
+from app.utils.pdf_document import ParsedPdf
+
+# Varlık tespiti için varsayılan süre bütçesi (milisaniye, 0 = sınırsız)
+ANONYMIZE_DEADLINE_MS = int(os.environ.get('ANONYMIZE_DEADLINE_MS', 0))
 
 # Namespace tanımlama
 api = Namespace('anonymize', description='Anonymization operations')
 
 # Modelleri tanımlama
 anonymize_model = api.model('AnonymizeOptions', {
-    'options': fields.List(fields.String, required=True, description='Anonymization options')
+    'options': fields.List(fields.String, required=True, description='Anonymization options'),
+    'deadline_ms': fields.Integer(required=False, description='Time budget for entity detection in milliseconds')
 })
 
 anonymize_response = api.model('AnonymizeResponse', {
     'success': fields.Boolean(description='Operation successful?'),
     'message': fields.String(description='Operation message'),
-    'anonymized_file_id': fields.Integer(description='Anonymized file ID')
+    'anonymized_file_id': fields.Integer(description='Anonymized file ID'),
+    'partial': fields.Boolean(description='Detection stopped early because the time budget ran out'),
+    'detection': fields.Raw(description='Detection stage report (completed/skipped stages, elapsed time)')
 })
 
 anonymized_files_response = api.model('AnonymizedFilesResponse', {
@@ -130,6 +79,9 @@ class AnonymizePaper(Resource):
         """
         Anonymize the paper and save the anonymized version
         """
+        # Metin çıkarımı, sayfa düzeni analizi ve anonimleştirme aynı ayrıştırılmış PDF'i kullanır
+        parsed_pdf = None
+        
         # Ana try-except bloğu
         try:
             # Check the paper
@@ -144,6 +96,15 @@ class AnonymizePaper(Resource):
             if not options:
                 return {'error': 'At least one anonymization option must be selected'}, 400
             
+            # Tespit süre bütçesi (istekte verilmezse ANONYMIZE_DEADLINE_MS, 0 = sınırsız)
+            requested_deadline = data.get('deadline_ms')
+            try:
+                deadline_ms = int(ANONYMIZE_DEADLINE_MS if requested_deadline is None else requested_deadline) or None
+            except (TypeError, ValueError):
+                return {'error': 'deadline_ms must be an integer'}, 400
+            if deadline_ms is not None and deadline_ms < 0:
+                return {'error': 'deadline_ms must not be negative'}, 400
+            
             # Check valid options
             valid_options = ['author_name', 'contact_info', 'institution_info']
             if not all(opt in valid_options for opt in options):
@@ -157,6 +118,8 @@ class AnonymizePaper(Resource):
                 print(f"File not found. Database path: {db_file_path}")
                 return {'error': 'Paper file not found'}, 404
             
+            parsed_pdf = ParsedPdf(file_path)
+            
             # Log the anonymization request
             paper_id = paper.get('id')
             user_email = request.environ.get('HTTP_X_USER_EMAIL', None)  # Kullanıcı email bilgisini headerdan al
@@ -180,37 +143,104 @@ class AnonymizePaper(Resource):
             anonymized_filename = f"anonymized_{tracking_number}{file_extension}"
             anonymized_path = os.path.join(anonymized_dir, anonymized_filename)
             
+            # Aynı dosya ve seçeneklerle tekrarlanan isteklerde önbellekteki sonuçları kullan
+            try:
+                file_hash = file_digest(file_path)
+            except Exception as digest_error:
+                logging.warning(f"Dosya özeti hesaplanamadı, önbellek kullanılmayacak: {str(digest_error)}")
+                file_hash = None
+            
             try:
-                # Extract text from PDF with improved section separation
-                extracted_text = extract_text_from_pdf(file_path)
-                main_content = extracted_text["sections"]["main_content"]
-                excluded_sections = extracted_text["sections"]["excluded_sections"]
-                first_page = extracted_text["sections"]["first_page"]
-                header_sections = extracted_text["sections"]["header_sections"]
+                # Extract text from PDF with improved section separation - aynı dosya herhangi bir uç
+                # noktada daha önce çıkarılmışsa sıkıştırılmış önbellekten okunur
+                extracted_text = get_extracted_text(parsed_pdf, file_hash)
+                
+                main_content = section_text(extracted_text, "main_content")
+                excluded_sections = section_text(extracted_text, "excluded_sections")
+                first_page = section_text(extracted_text, "first_page")
+                header_sections = section_text(extracted_text, "header_sections")
                 full_text = extracted_text["full_text"]
+                page_offsets = extracted_text.get("page_offsets", {}).get("main_content")
+                section_offsets = extracted_text.get("section_offsets")
                 
                 logging.info(f"PDF extracted. Main content: {len(main_content)} chars, First page: {len(first_page)} chars")
                 logging.info(f"Excluded sections: {len(excluded_sections)} chars, Header sections: {len(header_sections)} chars")
             except Exception as extract_error:
                 logging.error(f"PDF text extraction error: {str(extract_error)}")
                 return {'error': f'Error extracting text from PDF: {str(extract_error)}'}, 500
-                
+            
+            # Gönderen e-postası ve aynı gönderen/orijinal makale için daha önce tespit edilen varlıklardan
+            # kimlik indeksi oluştur - NER'den önce eşleştirilir
+            identity_index = None
             try:
-                # Detect entities with improved context-aware approach
-                entities = detect_entities(
-                    main_content, 
-                    options, 
-                    excluded_sections,
-                    first_page,
-                    header_sections
+                identity_index = IdentityIndex.build(
+                    paper.get('email'),
+                    Paper.get_confirmed_entities(paper.get('email'), paper.get('original_paper_id'), exclude_paper_id=paper_id)
                 )
-            except Exception as entity_error:
-                logging.error(f"Entity detection error: {str(entity_error)}")
-                return {'error': f'Error detecting entities in text: {str(entity_error)}'}, 500
+            except Exception as identity_error:
+                logging.warning(f"Kimlik indeksi oluşturulamadı: {str(identity_error)}")
+            identity_signature = identity_index.signature if identity_index else None
+            
+            detection_report = {}
+            entities = get_cached_entities(file_hash, options, identity_signature) if file_hash else None
+            if entities is not None:
+                detection_report = {"cached": True, "completed_stages": list(DETECTION_STAGES), "skipped_stages": [], "partial": False}
+                logging.info(f"Tespit edilen varlıklar önbellekten alındı, doğrudan sansürlemeye geçiliyor: {file_hash[:12]}")
+            else:
+                # Sayfa düzeni bloklarını sınıflandır - NER yalnızca ilgili bloklara uygulanır
+                layout_blocks = None
+                try:
+                    layout_blocks = classify_layout_blocks_with_template(get_layout_pages(parsed_pdf, file_hash))
+                except Exception as layout_error:
+                    logging.warning(f"Sayfa düzeni analizi yapılamadı, NER tüm metne uygulanacak: {str(layout_error)}")
+                
+                # Revizyonlarda orijinal makalenin sayfa kaydı varsa yalnızca değişen sayfalarda tespit yap
+                previous_record = None
+                if paper.get('is_revision') and paper.get('original_paper_id'):
+                    previous_record = get_page_record(paper.get('original_paper_id'), options)
+                
+                try:
+                    if previous_record:
+                        entities, changed_pages = detect_entities_for_revision(
+                            extracted_text, options, previous_record, layout_blocks=layout_blocks,
+                            deadline_ms=deadline_ms, stage_report=detection_report,
+                            identity_index=identity_index
+                        )
+                        logging.info(f"Revizyon için artımlı tespit yapıldı, değişen sayfalar: {[p + 1 for p in changed_pages]}")
+                    else:
+                        # Detect entities with improved context-aware approach
+                        entities = detect_entities(
+                            main_content, 
+                            options, 
+                            excluded_sections,
+                            first_page,
+                            header_sections,
+                            layout_blocks=layout_blocks,
+                            page_offsets=page_offsets,
+                            section_offsets=section_offsets,
+                            deadline_ms=deadline_ms,
+                            stage_report=detection_report,
+                            identity_index=identity_index
+                        )
+                except Exception as entity_error:
+                    logging.error(f"Entity detection error: {str(entity_error)}")
+                    return {'error': f'Error detecting entities in text: {str(entity_error)}'}, 500
+                
+                # Süre bütçesi dolduğu için kısmi kalan sonuçlar önbelleğe alınmaz
+                if file_hash and not detection_report.get("partial"):
+                    store_entities(file_hash, options, entities, identity_signature)
+            
+            # Sonraki revizyonlarda yeniden kullanılmak üzere sayfa parmak izlerini ve sayfa varlıklarını kaydet
+            if not detection_report.get("partial"):
+                try:
+                    store_page_record(paper_id, options, build_page_record(extracted_text, entities))
+                except Exception as record_error:
+                    logging.warning(f"Sayfa kaydı oluşturulamadı: {str(record_error)}")
             
             try:
                 # Anonymize the PDF
-                success, message = anonymize_pdf(file_path, anonymized_path, entities, excluded_sections)
+                success, message = anonymize_pdf(file_path, anonymized_path, entities, excluded_sections,
+                                                 parsed_pdf=parsed_pdf)
                 
                 if not success:
                     return {'error': message}, 500
@@ -265,13 +295,18 @@ class AnonymizePaper(Resource):
             return {
                 'success': True,
                 'message': 'Paper successfully anonymized',
-                'anonymized_file_id': anonymized_file_id
+                'anonymized_file_id': anonymized_file_id,
+                'partial': bool(detection_report.get('partial')),
+                'detection': detection_report
             }
             
         except Exception as e:
             logging.error(f"Anonymization error: {str(e)}")
             traceback.print_exc()  # Daha detaylı hata izleri
             return {'error': f'An error occurred while anonymizing the paper: {str(e)}'}, 500
+        finally:
+            if parsed_pdf is not None:
+                parsed_pdf.close()
 
 @api.route('/download/<string:tracking_number>')
 @api.doc(params={'tracking_number': 'Paper tracking number'})
@@ -11,6 +11,16 @@ import logging
 import base64
 from cryptography.hazmat.primitives.asymmetric import rsa, padding
 from cryptography.hazmat.primitives import hashes, serialization
+from app.utils.patterns import (
+    EXCLUDED_SECTION_RES, REFERENCE_SECTION_RE, REFERENCE_SECTION_MULTILINE_RE, SECTION_HEADER_MULTILINE_RE,
+    IEEE_BIOGRAPHY_PAGE_RES, IEEE_BIOGRAPHY_PARAGRAPH_RES,
+    CAPS_NAME_LINE_RE, PROPER_NAME_LINE_RE, IEEE_VOLUME_FOOTER_RE, PARAGRAPH_BREAK_RE,
+    BIOGRAPHY_PARAGRAPH_END_RE, search_any, count_matching_patterns
+)
+from app.utils.string_index import find_contained_strings
+from app.utils.running_headers import plan_running_redactions, remove_running_text, search_key
+from app.utils.text_normalizer import normalize_text, normalize_entity
+from app.utils.pdf_document import ParsedPdf
 
 # PyMuPDF (fitz) kütüphanesini import et
 try:
@@ -25,6 +35,53 @@ def rect_hash(rect):
     # Koordinatları yuvarlayarak aynı alanları yakala
     return tuple(round(v, 1) for v in [rect.x0, rect.y0, rect.x1, rect.y1])
 
+# Normalize edilmiş metinler için search_for bayrakları: varsayılan bayraklardan farklı olarak
+# TEXT_PRESERVE_LIGATURES içermez, böylece sayfadaki bitişik harfler ("ﬁ") açılarak aranır
+NORMALIZED_SEARCH_FLAGS = (
+    fitz.TEXT_DEHYPHENATE | fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP
+) if HAVE_PYMUPDF else 0
+
+# Normalize edilmiş metni sayfada ara (bitişik harfler açılmış)
+def search_normalized(page, text):
+    return page.search_for(text, flags=NORMALIZED_SEARCH_FLAGS)
+
+# Varlığın sayfadaki tüm konumları
+def search_entity(page, entity, page_text):
+    """
+    Normalize edilmiş varlığı sayfada ara.
+
+    search_for Unicode tire ve boşluk çeşitlerini (U+2010, U+00A0...) ASCII karşılıklarıyla
+    eşleştirmez. Bu nedenle varlığın normalize sayfa metnindeki geçişleri ofset haritasıyla ham
+    metne eşlenir; ham biçimler de varsayılan bayraklarla (bitişik harfler korunarak) aranır.
+
+    Args:
+        page: PyMuPDF sayfası
+        entity (str): normalize_entity ile normalize edilmiş varlık
+        page_text (NormalizedText): Sayfanın normalize metni ve ham metne ofset haritası
+
+    Returns:
+        list: Bulunan dikdörtgenler
+    """
+    rects = search_normalized(page, entity)
+    if not page_text.changed:
+        return rects
+
+    raw_forms = set()
+    start = page_text.text.find(entity)
+    while start != -1:
+        raw_form = " ".join(page_text.raw_slice(start, start + len(entity)).split())
+        if raw_form != entity:
+            raw_forms.add(raw_form)
+        start = page_text.text.find(entity, start + 1)
+
+    seen = {rect_hash(rect) for rect in rects}
+    for raw_form in raw_forms:
+        for rect in page.search_for(raw_form):
+            if rect_hash(rect) not in seen:
+                seen.add(rect_hash(rect))
+                rects.append(rect)
+    return rects
+
 # RSA anahtar çifti oluşturma
 def generate_rsa_key_pair():
     private_key = rsa.generate_private_key(
@@ -104,12 +161,15 @@ def load_rsa_keys(private_key_path="private_key.pem", public_key_path="public_ke
     
     return private_key, public_key
 
-def anonymize_pdf(input_path, output_path, entities, excluded_text=""):
+def anonymize_pdf(input_path, output_path, entities, excluded_text="", parsed_pdf=None):
     """
     Anonymize PDF file
     Mask detected entities in the PDF
     excluded_text: Text in excluded sections
+    parsed_pdf: İstek boyunca paylaşılan ParsedPdf (verilirse başlık, sayfa blokları ve açık fitz
+                belgesi yeniden kullanılır; sansürler bu belgeye uygulanır)
     """
+    parsed_pdf, owned = ParsedPdf.wrap(parsed_pdf or input_path)
     try:
         # Başlığı tespit et (ilk sayfadaki en büyük fontlu yazı)
         title_text = ""
@@ -117,39 +177,11 @@ def anonymize_pdf(input_path, output_path, entities, excluded_text=""):
         
         if HAVE_PYMUPDF:
             try:
-                doc_check = fitz.open(input_path)
-                # Sadece ilk sayfada başlık kontrolü yap
-                if len(doc_check) > 0:
-                    first_page = doc_check[0]
-                    # Sayfa metnini yapılandırılmış şekilde al
-                    blocks = first_page.get_text("dict")["blocks"]
-                    
-                    # Her metin bloğunu kontrol et
-                    for block in blocks:
-                        if "lines" in block:
-                            for line in block["lines"]:
-                                if "spans" in line:
-                                    for span in line["spans"]:
-                                        # Font boyutu kontrolü
-                                        curr_size = span.get("size", 0)
-                                        curr_text = span.get("text", "").strip()
-                                        
-                                        # Boş metin ya da tek karakter değilse ve font boyutu büyükse
-                                        if len(curr_text) > 5 and curr_size > title_font_size:
-                                            title_font_size = curr_size
-                                            title_text = curr_text
-                                            
-                                        # İlk sayfadaki en büyük 3 font boyutunu takip et
-                                        # ve benzer font boyutundaki metinleri birleştir
-                                        elif curr_size > title_font_size * 0.95 and curr_size <= title_font_size * 1.05 and len(curr_text) > 1:
-                                            title_text += " " + curr_text
+                title_text, title_font_size = parsed_pdf.title
                 
                 # Eğer başlık varsa, log kaydı oluştur
                 if title_text:
-                    title_text = title_text.strip()
                     logging.info(f"Tespit edilen makale başlığı (font: {title_font_size}): {title_text}")
-                
-                doc_check.close()
             except Exception as e:
                 logging.warning(f"Başlık tespiti sırasında hata: {str(e)}")
         
@@ -170,8 +202,8 @@ def anonymize_pdf(input_path, output_path, entities, excluded_text=""):
         # Tüm metinleri normalleştir
         for category in priority_order:
             for entity in entities[category]:
-                # Satır sonu karakterlerini boşluğa dönüştür
-                normalized_entity = entity.replace("\n", " ").strip()
+                # Satır sonlarını, bitişik harfleri ve Unicode çeşitlerini normalize et
+                normalized_entity = normalize_entity(entity)
                 
                 # Başlık içinde geçen metinleri maskeleme
                 if title_text and (normalized_entity in title_text or title_text in normalized_entity):
@@ -188,15 +220,6 @@ def anonymize_pdf(input_path, output_path, entities, excluded_text=""):
             'institution_info': []
         }
         
-        # Alt metinleri kontrol eden fonksiyon
-        def is_substring_of_any(text, text_list):
-            """Bir metnin diğer metinlerin alt metni (substring) olup olmadığını kontrol eder"""
-            for other_text in text_list:
-                # Eğer bu metin, diğer metnin içinde yer alıyorsa
-                if text != other_text and text in other_text:
-                    return True
-            return False
-        
         # Her kategori için benzer ve alt metinleri filtrele
         for category in priority_order:
             # Önce tüm metinleri uzunluğuna göre büyükten küçüğe sırala
@@ -204,13 +227,16 @@ def anonymize_pdf(input_path, output_path, entities, excluded_text=""):
             
             category_entities = []  # Bu kategorideki filtrelenmiş metinler
             
+            # Kategorideki başka bir (daha uzun) metnin içinde geçen metinler - tek otomat taramasıyla
+            contained_entities = find_contained_strings(entity for entity in sorted_entities if len(entity) >= 4)
+            
             for entity in sorted_entities:
                 # Minimum karakter uzunluğu kontrolü (çok kısa metinleri atla)
                 if len(entity) < 4:
                     continue
                 
-                # Eğer bu metin, zaten seçilmiş daha uzun bir metnin alt metni değilse ekle
-                if not is_substring_of_any(entity, category_entities):
+                # Eğer bu metin, daha uzun bir metnin alt metni değilse ekle
+                if entity not in contained_entities:
                     category_entities.append(entity)
             
             filtered_entities[category] = category_entities
@@ -269,8 +295,8 @@ def anonymize_pdf(input_path, output_path, entities, excluded_text=""):
         if HAVE_PYMUPDF:
             logging.info("PyMuPDF kullanılarak gelişmiş PDF anonimleştirmesi yapılıyor...")
             
-            # Open the PDF file
-            doc = fitz.open(input_path)
+            # İstek boyunca açık tutulan belge
+            doc = parsed_pdf.fitz_doc
             
             # Total replacement count
             total_replacements = {
@@ -281,60 +307,7 @@ def anonymize_pdf(input_path, output_path, entities, excluded_text=""):
             
             # For identifying excluded sections
             current_section_is_excluded = False
-            excluded_section_patterns = [
-                r"(?i)INTRODUCTION",
-                r"(?i)RELATED\s+WORKS?",
-                r"(?i)REFERENCES",
-                r"(?i)BIBLIOGRAPHY",
-                r"(?i)ACKNOWLEDGEMENTS?",
-                r"(?i)CITED\s+REFERENCES"
-            ]
-            
-            # Özellikle referanslar bölümünü tespit edecek daha kapsamlı desenler
-            reference_section_patterns = [
-                r"(?i)^\s*REFERENCES\s*$",
-                r"(?i)^\s*BIBLIOGRAPHY\s*$",
-                r"(?i)^\s*CITED\s+REFERENCES\s*$",
-                r"(?i)^\s*REFERANSLAR\s*$",
-                r"(?i)^\s*KAYNAKLAR\s*$",
-                r"(?i)^\s*KAYNAKÇA\s*$",
-                r"(?i)^\s*REFERENCES\s+AND\s+CITATIONS\s*$"
-            ]
-            
-            # IEEE formatı yazar biyografilerini tespit etmek için göstergeler
-            ieee_biography_indicators = [
-                r"received the .+ degree",
-                r"was born in",
-                r"is currently pursuing",
-                r"is currently a Research Scholar",
-                r"is currently a Professor",
-                r"is currently an Assistant Professor",
-                r"is currently an Associate Professor",
-                r"received the Ph\.D",
-                r"research interests include",
-                r"^[A-Z]{2,}(?:\s+[A-Z]{2,}){1,}\s*\(",
-                r"^[A-Z]{2,}(?:\s+[A-Z]{2,}){1,}\s*received",
-                # Yeni önerilen anahtar ifadeler
-                r"[Hh]is research interests are",
-                r"[Hh]er interests include",
-                r"[Hh]e is currently working on",
-                r"[Ss]he has authored over",
-                r"[Hh]e has published more than",
-                r"[Hh]e was with",
-                r"[Ss]he was with",
-                r"[Hh]e is affiliated with",
-                r"[Ss]he is affiliated with",
-                r"[Hh]e received his",
-                r"[Ss]he received her",
-                r"[Hh]e joined the",
-                r"[Ss]he joined the",
-                r"\b[A-Z][a-z]+ [A-Z][a-z]+\b.*received the .* degree",
-                r"has been a member of",
-                r"has been an? (IEEE|Associate|Senior) member",
-                r"has published (more than|over|about|approximately) \d+",
-                r"has co-authored (more than|over|about|approximately) \d+",
-                r"has served as an? (editor|reviewer|chair|co-chair)"
-            ]
+            # Bölüm başlığı ve biyografi göstergesi kalıpları app.utils.patterns içinde önceden derlenmiştir
             
             # Biyografi paragrafı analizinde gerekli minimum sayıda gösterge
             min_biography_indicators = 1
@@ -345,6 +318,13 @@ def anonymize_pdf(input_path, output_path, entities, excluded_text=""):
             # Sansürlenen yazar biyografi sayacı
             biography_counter = 0
             
+            # Kayan başlık/altbilgilerdeki varlıkların tüm sayfalardaki konumlarını tek seferde hesapla
+            try:
+                running_redactions, running_lines = plan_running_redactions(doc, replacements)
+            except Exception as e:
+                logging.warning(f"Kayan başlık/altbilgi tespiti yapılamadı: {str(e)}")
+                running_redactions, running_lines = {}, {}
+            
             # Process each page
             for page_num in range(len(doc)):
                 page = doc[page_num]
@@ -355,8 +335,33 @@ def anonymize_pdf(input_path, output_path, entities, excluded_text=""):
                 # Maskelenen pozisyonları takip etmek için küme - SAYFA BAŞINDA TANIMLA
                 masked_positions = set()
                 
-                # Get all text on the page
-                text = page.get_text()
+                # Get all text on the page - metin çıkarımında kullanılan sayfa metni (varsayılan arka uç
+                # PyMuPDF, search_for ile aynı dizeler); kalıplar normalize metinde çalışır, blok
+                # eşleştirmesi için paragraflar ofset haritasıyla ham metne geri eşlenir
+                page_text = normalize_text(parsed_pdf.page_text(page_num))
+                text = page_text.text
+                
+                # Kayan başlık/altbilgi sansürleri - sayfa referans veya hariç tutulan bölümde olsa da uygulanır
+                page_running_redactions = running_redactions.get(page_num, [])
+                for running in page_running_redactions:
+                    redact_annot = page.add_redact_annot(
+                        running.rect,
+                        text=replacements[running.entity],
+                        fontsize=max(6, min(running.size or 9, 9) * 0.85),
+                        fontname="helv",
+                        text_color=fitz.sRGB_to_pdf(running.color),
+                        fill=(1, 1, 1)
+                    )
+                    redactions.append(redact_annot)
+                    masked_positions.add(rect_hash(running.rect))
+                    total_replacements[entity_category[running.entity]] += 1
+                
+                # Yalnızca kayan öğelerde geçen varlıklar için sayfada ayrıca arama yapılmaz
+                running_only_entities = set()
+                if page_running_redactions:
+                    remaining_text = remove_running_text(text, running_lines.get(page_num, []))
+                    running_only_entities = {running.entity for running in page_running_redactions
+                                             if search_key(running.entity) not in remaining_text}
                 
                 # Sadece PDF'nin son sayfasında biyografi tespiti ve sansürleme işlemi yap
                 is_biography_page = False
@@ -366,19 +371,16 @@ def anonymize_pdf(input_path, output_path, entities, excluded_text=""):
                 
                 if is_last_page:
                     # IEEE formatı biyografi tespiti - büyük harfli isimle başlayan paragrafları kontrol et
-                    biography_indicators_found = 0
-                    for indicator in ieee_biography_indicators:
-                        if re.search(indicator, text, re.MULTILINE | re.IGNORECASE):
-                            biography_indicators_found += 1
+                    biography_indicators_found = count_matching_patterns(IEEE_BIOGRAPHY_PAGE_RES, text)
                         
                     # IEEE biyografi sayfası tespiti
                     is_biography_page = False
                     
                     # Metinde büyük harfle yazılmış yazar adlarını ara (IEEE biyografi stili)
-                    caps_names_matches = re.findall(r"^([A-Z]{2,}(?:\s+[A-Z]{2,})+)", text, re.MULTILINE)
+                    caps_names_matches = CAPS_NAME_LINE_RE.findall(text)
                     
                     # Alternatif Ad-Soyad tespiti (büyük harfle başlayan, boşlukla ayrılmış iki veya daha fazla kelime)
-                    name_format_matches = re.findall(r"^([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,})", text, re.MULTILINE)
+                    name_format_matches = PROPER_NAME_LINE_RE.findall(text)
                     
                     # Eğer sayfada en az 2 büyük harfli isim bulunursa ve en az 1 biyografi göstergesi varsa
                     if (len(caps_names_matches) >= 2 or len(name_format_matches) >= 2) and biography_indicators_found >= min_biography_indicators:
@@ -386,7 +388,7 @@ def anonymize_pdf(input_path, output_path, entities, excluded_text=""):
                         logging.info(f"Son sayfa (sayfa {page_num+1})'de IEEE formatı yazar biyografi sayfası tespit edildi ({len(caps_names_matches)} büyük isim, {len(name_format_matches)} normal isim, {biography_indicators_found} gösterge)")
                     
                     # "VOLUME X, YYYY NNNNN" formatını içeren sayfalar genellikle IEEE makalelerinin son sayfasıdır
-                    if re.search(r"VOLUME\s+\d+,\s+\d{4}\s+\d+", text):
+                    if IEEE_VOLUME_FOOTER_RE.search(text):
                         if biography_indicators_found >= min_biography_indicators:
                             is_biography_page = True
                             logging.info(f"Son sayfa (sayfa {page_num+1})'de IEEE formatı dergi bilgili son sayfa tespit edildi, biyografi içeriyor")
@@ -394,24 +396,19 @@ def anonymize_pdf(input_path, output_path, entities, excluded_text=""):
                     # Metin yapısı analizi yaparak alternatif paragraf tespiti
                     # Paragrafları ayır (iki newline veya satır aralığına göre)
                     if not is_biography_page:  # Eğer daha önce tespit edilmediyse paragraf analizi yap
-                        paragraphs = re.split(r'\n\s*\n', text)
+                        paragraphs = PARAGRAPH_BREAK_RE.split(text)
                         for para_idx, paragraph in enumerate(paragraphs):
                             # 100+ karakter içeriyor mu?
                             if len(paragraph.strip()) < 100:
                                 continue
                                 
                             # Anahtar kelimelerden en az 2'sini içeriyor mu?
-                            indicator_count = 0
-                            for indicator in ieee_biography_indicators:
-                                if re.search(indicator, paragraph, re.IGNORECASE):
-                                    indicator_count += 1
-                                    if indicator_count >= 2:
-                                        break
+                            indicator_count = count_matching_patterns(IEEE_BIOGRAPHY_PARAGRAPH_RES, paragraph, limit=2)
                             
                             # Büyük harfli isim içeriyor mu?
                             has_name = (
-                                re.search(r"^[A-Z]{2,}(?:\s+[A-Z]{2,})+", paragraph, re.MULTILINE) or 
-                                re.search(r"^[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,}", paragraph, re.MULTILINE)
+                                CAPS_NAME_LINE_RE.search(paragraph) or 
+                                PROPER_NAME_LINE_RE.search(paragraph)
                             )
                             
                             # Eğer anahtar kelime ve isim kriterleri karşılanıyorsa, bu bir biyografi olabilir
@@ -438,7 +435,7 @@ def anonymize_pdf(input_path, output_path, entities, excluded_text=""):
                                 paragraph_text = text[start_pos:]
                                 
                                 # Paragraf sonu - sonraki büyük harfli isim, boş satır veya sayfa sonu
-                                end_match = re.search(r"\n\s*\n|\n[A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)+|\Z", paragraph_text)
+                                end_match = BIOGRAPHY_PARAGRAPH_END_RE.search(paragraph_text)
                                 
                                 if end_match:
                                     end_pos = end_match.start()
@@ -446,26 +443,21 @@ def anonymize_pdf(input_path, output_path, entities, excluded_text=""):
                                     full_paragraph = paragraph_text[:end_pos].strip()
                                     
                                     # Biyografi göstergelerini kontrol et
-                                    is_biography = False
-                                    indicator_count = 0
-                                    for indicator in ieee_biography_indicators:
-                                        if re.search(indicator, full_paragraph, re.IGNORECASE):
-                                            indicator_count += 1
-                                            is_biography = True
-                                            if indicator_count >= 2:
-                                                break
+                                    indicator_count = count_matching_patterns(IEEE_BIOGRAPHY_PARAGRAPH_RES, full_paragraph, limit=2)
+                                    is_biography = indicator_count > 0
                                     
                                     # Eğer gösterge varsa ve yeterince uzunsa biyografi olarak kabul et
                                     if is_biography and len(full_paragraph) > 75:  # Min uzunluk kontrolü
-                                        biography_paragraphs.append((start_pos, start_pos + end_pos, full_paragraph))
+                                        raw_paragraph = page_text.raw_slice(start_pos, start_pos + end_pos).strip()
+                                        biography_paragraphs.append((start_pos, start_pos + end_pos, full_paragraph, raw_paragraph))
                         
                         # Tespit edilen biyografi paragraflarını sansürle
-                        for start_pos, end_pos, paragraph in biography_paragraphs:
+                        for start_pos, end_pos, paragraph, raw_paragraph in biography_paragraphs:
                             logging.info(f"Son sayfada yazar biyografi paragrafı tespit edildi: {paragraph[:50]}...")
                             
                             # Paragraf sansürleme stratejisi:
                             # 1. Önce sayfanın blok yapısını alarak daha doğru konum tespiti yapalım
-                            blocks = page.get_text("dict")["blocks"]
+                            blocks = parsed_pdf.page_blocks(page_num)
                             paragraph_blocks = []
                             
                             # Paragrafa ait blokları bul
@@ -479,9 +471,10 @@ def anonymize_pdf(input_path, output_path, entities, excluded_text=""):
                                     
                                     # Eğer blok metni paragrafın bir parçasını içeriyorsa
                                     # veya paragraf bloğun bir parçasını içeriyorsa, bu bloğu işaretle
-                                    if (block_text in paragraph) or any(
+                                    # (blok metni ham olduğu için paragrafın ham karşılığıyla karşılaştırılır)
+                                    if (block_text in raw_paragraph) or any(
                                         phrase in block_text 
-                                        for phrase in re.findall(r".{20,}", paragraph) 
+                                        for phrase in re.findall(r".{20,}", raw_paragraph) 
                                         if len(phrase) > 20
                                     ):
                                         paragraph_blocks.append(block)
@@ -530,7 +523,7 @@ def anonymize_pdf(input_path, output_path, entities, excluded_text=""):
                             for i in range(0, len(paragraph), 50):
                                 chunk = paragraph[i:i+50]
                                 if len(chunk) > 10:  # Çok kısa parçaları atla
-                                    chunk_instances = page.search_for(chunk)
+                                    chunk_instances = search_normalized(page, chunk)
                                     paragraph_rects.extend(chunk_instances)
                             
                             if paragraph_rects:
@@ -598,7 +591,7 @@ def anonymize_pdf(input_path, output_path, entities, excluded_text=""):
                                 phrase_rects = []
                                 for phrase in key_phrases:
                                     if len(phrase) > 10:  # Çok kısa ifadeleri atla
-                                        found_rects = page.search_for(phrase)
+                                        found_rects = search_normalized(page, phrase)
                                         phrase_rects.extend(found_rects)
                                 
                                 if phrase_rects:
@@ -642,41 +635,33 @@ def anonymize_pdf(input_path, output_path, entities, excluded_text=""):
                                     logging.info(f"Son sayfada yazar biyografisi {biography_counter} hassas yöntemle sansürlendi.")
                 
                 # Referans bölümünü doğrudan kontrol et
-                for pattern in reference_section_patterns:
-                    if re.search(pattern, text, re.MULTILINE):
-                        current_section_is_excluded = True
-                        references_section_found = True
-                        logging.info(f"Sayfa {page_num+1}'de referans bölümü tespit edildi, anonimleştirme yapılmayacak")
-                        break
+                if REFERENCE_SECTION_MULTILINE_RE.search(text):
+                    current_section_is_excluded = True
+                    references_section_found = True
+                    logging.info(f"Sayfa {page_num+1}'de referans bölümü tespit edildi, anonimleştirme yapılmayacak")
                 
                 # Eğer bu sayfada referans bölümünde olduğumuzu tespit ettiysek, bu sayfayı işlemeye gerek yok
                 if references_section_found and not is_biography_page:
+                    if redactions:
+                        page.apply_redactions()
                     continue
                 
                 # Check if this page is in an excluded section
                 # Find section headers
-                section_headers = re.findall(r"(?i)^\s*(?:\d+\.)*\s*([A-Za-z\s]+)$", text, re.MULTILINE)
+                section_headers = SECTION_HEADER_MULTILINE_RE.findall(text)
                 
                 for header in section_headers:
                     header = header.strip().upper()
                     # Is this a reference section header?
-                    is_reference_section = False
-                    for pattern in reference_section_patterns:
-                        if re.search(pattern, header, re.IGNORECASE):
-                            current_section_is_excluded = True
-                            references_section_found = True
-                            is_reference_section = True
-                            break
-                    
-                    if is_reference_section:
+                    if REFERENCE_SECTION_RE.search(header):
+                        current_section_is_excluded = True
+                        references_section_found = True
                         logging.info(f"Sayfa {page_num+1}'de '{header}' başlığında referans bölümü tespit edildi")
                         break
                     
                     # Is this header an excluded section?
-                    for pattern in excluded_section_patterns:
-                        if re.search(pattern, header):
-                            current_section_is_excluded = True
-                            break
+                    if search_any(EXCLUDED_SECTION_RES, header):
+                        current_section_is_excluded = True
                     else:
                         # If not an excluded section header, it might be a normal section header
                         # If this is a "normal" section header, we're no longer in an excluded section
@@ -686,6 +671,8 @@ def anonymize_pdf(input_path, output_path, entities, excluded_text=""):
                 # If this page is in an excluded section, skip processing
                 if current_section_is_excluded and not is_biography_page:
                     logging.info(f"Sayfa {page_num+1} hariç tutulan bir bölümde, anonimleştirme atlanıyor")
+                    if redactions:
+                        page.apply_redactions()
                     continue
                 
                 # Redaksiyon listesini sayfa başında boş olarak tanımladığımız için burada tekrar tanımlama
@@ -703,11 +690,15 @@ def anonymize_pdf(input_path, output_path, entities, excluded_text=""):
                     # Eğer bu metin başlık ise ya da başlık içinde geçiyorsa atla
                     if title_text and (original in title_text or title_text in original):
                         continue
+                    
+                    # Sayfadaki tüm geçişleri kayan başlık/altbilgide ve zaten sansürlendi
+                    if original in running_only_entities:
+                        continue
                         
                     # Search in the page
                     try:
                         # Tüm metni bul
-                        text_instances = page.search_for(original)
+                        text_instances = search_entity(page, original, page_text)
                         
                         # Mask each found text instance
                         for inst in text_instances:
@@ -719,7 +710,9 @@ def anonymize_pdf(input_path, output_path, entities, excluded_text=""):
                                 
                             # Aynı pozisyonda maskeleme yapılmışsa atla
                             inst_hash = rect_hash(inst)
-                            if inst_hash in masked_positions:
+                            if inst_hash in masked_positions or any(
+                                inst.intersects(running.rect) for running in page_running_redactions
+                            ):
                                 logging.debug(f"Bu pozisyonda zaten maskeleme yapılmış, atlıyorum: {original}")
                                 continue
                                 
@@ -733,13 +726,7 @@ def anonymize_pdf(input_path, output_path, entities, excluded_text=""):
                             context_text = page.get_text("text", clip=context_rect)
                             
                             # Is there an excluded section heading around this text segment?
-                            skip_this_instance = False
-                            for pattern in excluded_section_patterns:
-                                if re.search(pattern, context_text, re.IGNORECASE):
-                                    skip_this_instance = True
-                                    break
-                            
-                            if skip_this_instance:
+                            if search_any(EXCLUDED_SECTION_RES, context_text):
                                 continue
                             
                             # Orijinal metin alanından font bilgisi al
@@ -793,7 +780,6 @@ def anonymize_pdf(input_path, output_path, entities, excluded_text=""):
             
             # Save changes
             doc.save(output_path)
-            doc.close()
             
             logging.info(f"PDF anonimleştirildi: {sum(total_replacements.values())} toplam değişiklik yapıldı")
             for entity_type, count in total_replacements.items():
@@ -804,7 +790,7 @@ def anonymize_pdf(input_path, output_path, entities, excluded_text=""):
             logging.info("Temel PDF işleme kullanılıyor (PyMuPDF mevcut değil)...")
             
             # PDF reading process
-            reader = PdfReader(input_path)
+            reader = parsed_pdf.reader
             writer = PdfWriter()
             
             # Process and copy each page
@@ -833,6 +819,9 @@ def anonymize_pdf(input_path, output_path, entities, excluded_text=""):
     except Exception as e:
         logging.error(f"PDF anonimleştirme hatası: {str(e)}")
         return False, f"PDF anonimleştirme hatası: {str(e)}"
+    finally:
+        if owned:
+            parsed_pdf.close()
 
 
 def save_anonymized_file(paper_id, file_path, filename, entities=None, options=None):
@@ -850,20 +839,11 @@ def save_anonymized_file(paper_id, file_path, filename, entities=None, options=N
         for entity_type in entities:
             normalized_entities[entity_type] = []
             for example in entities[entity_type]:
-                # Satır sonu karakterlerini boşluğa dönüştür
-                normalized_example = example.replace("\n", " ").strip()
+                # Satır sonlarını, bitişik harfleri ve Unicode çeşitlerini normalize et
+                normalized_example = normalize_entity(example)
                 if normalized_example:  # Boş string değilse ekle
                     normalized_entities[entity_type].append(normalized_example)
     
-    # Alt metinleri kontrol eden fonksiyon
-    def is_substring_of_any(text, text_list):
-        """Bir metnin diğer metinlerin alt metni (substring) olup olmadığını kontrol eder"""
-        for other_text in text_list:
-            # Eğer bu metin, diğer metnin içinde yer alıyorsa
-            if text != other_text and text in other_text:
-                return True
-        return False
-    
     # Çakışan metinleri tespit et ve benzer metinleri filtrele
     filtered_entities = {}
     total_removed = 0
@@ -881,14 +861,17 @@ def save_anonymized_file(paper_id, file_path, filename, entities=None, options=N
         category_entities = []  # Bu kategorideki filtrelenmiş metinler
         removed_count = 0  # Filtrelenen metin sayısı
         
+        # Kategorideki başka bir (daha uzun) metnin içinde geçen metinler - tek otomat taramasıyla
+        contained_entities = find_contained_strings(entity for entity in sorted_entities if len(entity) >= 4)
+        
         for entity in sorted_entities:
             # Minimum karakter uzunluğu kontrolü (çok kısa metinleri atla)
             if len(entity) < 4:
                 removed_count += 1
                 continue
             
-            # Eğer bu metin, zaten seçilmiş daha uzun bir metnin alt metni değilse ekle
-            if not is_substring_of_any(entity, category_entities):
+            # Eğer bu metin, daha uzun bir metnin alt metni değilse ekle
+            if entity not in contained_entities:
                 category_entities.append(entity)
             else:
                 removed_count += 1
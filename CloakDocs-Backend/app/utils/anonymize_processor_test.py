@@ -0,0 +1,68 @@
+import os
+import sys
+
+# Proje kök dizinini path'e ekle
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+root_dir = os.path.dirname(parent_dir)
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+import fitz  # PyMuPDF
+
+# Kendi modüllerimizi import et
+from app.utils.anonymize_processor import anonymize_pdf, search_normalized
+from app.utils.text_normalizer import normalize_entity
+
+# Bitişik harf (U+FB01) ve Unicode tire (U+2010) içeren varlıklar
+LIGATURE_INSTITUTION = "Department of Scientiﬁc Research"
+HYPHEN_AUTHOR = "Jean‐Pierre Dupont"
+
+
+def build_pdf(path, lines):
+    """
+    Satırları ham Unicode karakterleriyle yazan tek sayfalık PDF oluştur. Yerleşik CJK yedek
+    yazı tipi hem bitişik harf hem de U+2010 glifini içerir; başlık daha büyük puntoyla yazılır.
+    """
+    with fitz.open() as doc:
+        page = doc.new_page()
+        page.insert_font(fontname="F0", fontbuffer=fitz.Font("cjk").buffer)
+        page.insert_text((72, 72), "Signal Processing With Deep Networks", fontname="F0", fontsize=18)
+        page.insert_text((72, 110), "\n".join(lines), fontname="F0", fontsize=10)
+        doc.save(path)
+
+
+def anonymize_lines(tmp_path, lines, entities):
+    """Satırlardan PDF oluştur, anonimleştir ve çıktı dosyasının yolunu döndür"""
+    input_path = str(tmp_path / "input.pdf")
+    output_path = str(tmp_path / "output.pdf")
+    build_pdf(input_path, lines)
+
+    success, message = anonymize_pdf(input_path, output_path, entities)
+    assert success, message
+    return output_path
+
+
+def test_ligature_entity_is_redacted(tmp_path):
+    """Metin çıkarımında "fi" olarak normalize edilen bitişik harfli kurum adı sansürlenir"""
+    output_path = anonymize_lines(
+        tmp_path,
+        ["Jane Roe", LIGATURE_INSTITUTION, "Ankara, Turkey"],
+        {"author_name": [], "contact_info": [], "institution_info": [normalize_entity(LIGATURE_INSTITUTION)]}
+    )
+    with fitz.open(output_path) as doc:
+        assert not search_normalized(doc[0], "Scientific Research")
+        assert doc[0].search_for("Ankara")
+
+
+def test_unicode_hyphen_entity_is_redacted(tmp_path):
+    """Metin çıkarımında ASCII tireye çevrilen U+2010 tireli yazar adı sansürlenir"""
+    output_path = anonymize_lines(
+        tmp_path,
+        [HYPHEN_AUTHOR, "Ankara University", "Ankara, Turkey"],
+        {"author_name": [normalize_entity(HYPHEN_AUTHOR)], "contact_info": [], "institution_info": []}
+    )
+    with fitz.open(output_path) as doc:
+        page_text = doc[0].get_text()
+        assert "Dupont" not in page_text and "Pierre" not in page_text
+        assert doc[0].search_for("Ankara University")
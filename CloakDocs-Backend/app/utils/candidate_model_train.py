@@ -0,0 +1,163 @@
+import os
+import sys
+import json
+import pickle
+import argparse
+import numpy as np
+
+# Proje kök dizinini path'e ekle
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+root_dir = os.path.dirname(parent_dir)
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+# Kendi modüllerimizi import et
+from app.utils.indexed_document import IndexedDocument
+from app.utils.entity_detector import collect_candidates, parse_text_regions, NER_ENTITY_TYPES
+from app.utils.candidate_scoring import CandidateTable, FEATURE_NAMES, CANDIDATE_MODEL_THRESHOLD
+
+ENTITY_TYPES = ('author_name', 'contact_info', 'institution_info')
+
+
+def load_corpus(corpus_path):
+    """
+    Etiketli derlemi yükle. Her satır bir JSON nesnesidir:
+    {"pdf_path": "..."} veya {"main_content": "...", "first_page": "...", "header_sections": "..."}
+    ve {"entities": {"author_name": [...], "contact_info": [...], "institution_info": [...]}}
+    """
+    documents = []
+    with open(corpus_path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                documents.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                print(f"UYARI: {line_number}. satır okunamadı: {str(e)}")
+    return documents
+
+
+def get_regions(record, corpus_dir):
+    """Kayıttaki bölge metinlerini döndür (pdf_path verilmişse PDF'den çıkar)"""
+    if record.get("pdf_path"):
+        from app.utils.text_extractor import extract_text_from_pdf, section_text
+        pdf_path = record["pdf_path"]
+        if not os.path.isabs(pdf_path):
+            pdf_path = os.path.join(corpus_dir, pdf_path)
+        extracted_text = extract_text_from_pdf(pdf_path)
+        return tuple(section_text(extracted_text, name) for name in ("main_content", "first_page", "header_sections"))
+    return record.get("main_content", ""), record.get("first_page", ""), record.get("header_sections", "")
+
+
+def build_training_rows(records, corpus_dir, use_ner=True):
+    """
+    Her belge için adayları topla ve özellik matrislerini altın etiketlerle eşleştir.
+
+    Returns:
+        dict: {varlık_tipi: (özellik listesi, etiket listesi)}
+    """
+    rows = {entity_type: ([], []) for entity_type in ENTITY_TYPES}
+
+    for index, record in enumerate(records, start=1):
+        main_content, first_page, header_sections = get_regions(record, corpus_dir)
+        if not main_content or len(main_content) < 10:
+            print(f"[{index}/{len(records)}] Atlandı: ana içerik boş")
+            continue
+
+        documents = {
+            "header": IndexedDocument(header_sections),
+            "first_page": IndexedDocument(first_page),
+            "main_content": IndexedDocument(main_content)
+        }
+
+        parsed_regions = {}
+        if use_ner:
+            parsed_regions = parse_text_regions([
+                ("header", header_sections),
+                ("first_page", first_page),
+                ("main_content", main_content)
+            ])
+
+        gold = record.get("entities", {})
+        for entity_type in ENTITY_TYPES:
+            candidates = {entity_type: {}}
+            collect_candidates(documents, candidates, entity_type,
+                               parsed_regions if entity_type in NER_ENTITY_TYPES else None)
+
+            table = CandidateTable.from_candidates(candidates[entity_type])
+            if not len(table):
+                continue
+
+            gold_entities = set(gold.get(entity_type, []))
+            features, labels = rows[entity_type]
+            features.append(table.feature_matrix(documents))
+            labels.append(np.array([entity in gold_entities for entity in table.entities], dtype=np.int8))
+
+        print(f"[{index}/{len(records)}] İşlendi")
+
+    return rows
+
+
+def train_candidate_models(corpus_path, output_path, threshold=CANDIDATE_MODEL_THRESHOLD, use_ner=True):
+    """
+    Her varlık tipi için lojistik regresyon modeli eğit ve CANDIDATE_MODEL_PATH ile
+    yüklenebilecek pickle dosyasına kaydet.
+    """
+    from sklearn.linear_model import LogisticRegression
+
+    print(f"Derlem yükleniyor: {corpus_path}")
+
+    if not os.path.exists(corpus_path):
+        print(f"HATA: {corpus_path} dosyası bulunamadı!")
+        return False
+
+    records = load_corpus(corpus_path)
+    if not records:
+        print("HATA: Derlemde kayıt bulunamadı!")
+        return False
+
+    rows = build_training_rows(records, os.path.dirname(os.path.abspath(corpus_path)), use_ner)
+
+    models = {}
+    for entity_type, (features, labels) in rows.items():
+        if not features:
+            print(f"{entity_type}: aday bulunamadı, model eğitilmedi")
+            continue
+
+        X = np.vstack(features)
+        y = np.concatenate(labels)
+        if len(np.unique(y)) < 2:
+            print(f"{entity_type}: etiketler tek sınıflı ({len(y)} aday), model eğitilmedi")
+            continue
+
+        model = LogisticRegression(class_weight="balanced", max_iter=1000)
+        model.fit(X, y)
+        models[entity_type] = model
+
+        accuracy = float(np.mean((model.predict_proba(X)[:, 1] >= threshold) == y))
+        print(f"{entity_type}: {len(y)} aday, {int(y.sum())} pozitif, eğitim doğruluğu: {accuracy:.3f}")
+
+    if not models:
+        print("HATA: Hiçbir varlık tipi için model eğitilemedi!")
+        return False
+
+    with open(output_path, "wb") as f:
+        pickle.dump({"feature_names": list(FEATURE_NAMES), "models": models, "threshold": threshold}, f)
+    print(f"Model kaydedildi: {output_path}")
+    print(f"Kullanmak için: CANDIDATE_MODEL_PATH={os.path.abspath(output_path)}")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Aday puanlama modeli eğitim aracı")
+    parser.add_argument("corpus_path", help="Etiketli derlem (JSONL) dosyasının yolu")
+    parser.add_argument("--output", "-o", default="candidate_model.pkl", help="Model dosyasının yolu")
+    parser.add_argument("--threshold", type=float, default=CANDIDATE_MODEL_THRESHOLD,
+                        help="Adayı tutmak için minimum olasılık (varsayılan: 0.5)")
+    parser.add_argument("--no-ner", action="store_true", help="Adayları yalnızca regex ile topla")
+
+    args = parser.parse_args()
+
+    train_candidate_models(args.corpus_path, args.output, args.threshold, use_ner=not args.no_ner)
@@ -0,0 +1,271 @@
+import os
+import pickle
+import logging
+import threading
+import numpy as np
+from app.utils.string_index import StringIndex
+from app.utils.interval_index import IntervalIndex
+from app.utils.patterns import (
+    AUTHOR_CONTEXT_RES, CONTEXT_INDICATOR_RE, IEEE_MEMBERSHIP_CONTEXT_RE, EMAIL_RE, PERSON_NAME_FORMAT_RE
+)
+
+# Aday bağlamları - özellik matrisinde tek-sıcak (one-hot) sütunlar olarak yer alır
+CANDIDATE_CONTEXTS = ("header", "first_page", "main_content")
+
+# Özellik matrisinin sütunları (sıra, eğitilmiş modellerle uyumlu olmalıdır)
+FEATURE_NAMES = (
+    "heuristic_score",
+    "context_header",
+    "context_first_page",
+    "context_main_content",
+    "length",
+    "token_count",
+    "title_case",
+    "all_caps",
+    "has_digit",
+    "has_at",
+    "occurrences",
+    "indicator_nearby",
+    "ieee_membership_nearby",
+    "email_nearby",
+)
+
+# Yazar bağlam ifadelerinin çevresinde puan artırılan pencere genişliği (karakter)
+AUTHOR_CONTEXT_WINDOW = 200
+# Güçlü yazar bağlam ifadeleri daha yüksek artış alır
+STRONG_AUTHOR_PHRASES = ("corresponding author", "author:", "authors:")
+
+# Özellik çıkarımında kullanılan bağlam penceresi genişliği (karakter)
+FEATURE_WINDOW = 100
+
+# Opsiyonel scikit-learn modeli: CANDIDATE_MODEL_PATH ile verilen pickle dosyası
+# {"feature_names": [...], "models": {varlık_tipi: tahminci}, "threshold": 0.5}
+CANDIDATE_MODEL_PATH = os.environ.get('CANDIDATE_MODEL_PATH', '')
+CANDIDATE_MODEL_THRESHOLD = float(os.environ.get('CANDIDATE_MODEL_THRESHOLD', 0.5))
+
+# Sezgisel puanlamada adayın tutulması için gereken minimum puan
+CANDIDATE_MIN_SCORE = 1
+
+_model_bundle = None
+_model_loaded = False
+_model_lock = threading.Lock()
+
+
+def build_author_context_windows(text, window_size=AUTHOR_CONTEXT_WINDOW):
+    """
+    Yazar bağlam ifadelerinin çevresindeki pencereleri indeksle.
+
+    Returns:
+        tuple: (IntervalIndex, pencere ağırlıkları listesi)
+    """
+    windows = []
+    weights = []
+    for phrase in AUTHOR_CONTEXT_RES:
+        for match in phrase.finditer(text):
+            windows.append((max(0, match.start() - window_size), min(len(text), match.end() + window_size)))
+            weights.append(2.0 if match.group().lower() in STRONG_AUTHOR_PHRASES else 1.0)
+    return IntervalIndex(windows), weights
+
+
+def author_context_boosts(document, entity_texts, window_size=AUTHOR_CONTEXT_WINDOW):
+    """
+    Yazar bağlam ifadelerinin çevresindeki pencerelerde geçen adayların puan artışlarını hesapla.
+
+    Tüm adayların geçişleri tek bir otomat taramasıyla bulunur ve her geçiş, pencerelerin sıralı
+    uç nokta indeksinde sorgulanır; bir aday, en az bir geçişini tamamen içeren her pencere için
+    o pencerenin ağırlığı kadar puan alır. Pencereler belge başına bir kez oluşturulur.
+
+    Args:
+        document (IndexedDocument): Pencerelerin alındığı belge
+        entity_texts (list): Aday metinleri
+        window_size (int): İfadenin önünde ve arkasında alınan karakter sayısı
+
+    Returns:
+        numpy.ndarray: Her aday için toplam puan artışı
+    """
+    boosts = np.zeros(len(entity_texts), dtype=np.float64)
+    if not entity_texts or not document.text:
+        return boosts
+
+    windows, weights = document.derived(("author_context_windows", window_size),
+                                        lambda text: build_author_context_windows(text, window_size))
+    if not weights:
+        return boosts
+
+    occurrences = StringIndex(entity_texts).find_all(document.text)
+    for index, entity in enumerate(entity_texts):
+        if not entity:
+            # Boş metin her pencerede "geçer"
+            boosts[index] = sum(weights)
+            continue
+
+        hit_windows = set()
+        for position in occurrences.get(entity, ()):
+            hit_windows.update(windows.containing(position, position + len(entity)))
+            if len(hit_windows) == len(weights):
+                break
+        boosts[index] = sum(weights[window] for window in hit_windows)
+
+    return boosts
+
+
+class CandidateTable:
+    """
+    Aday varlıkların dizi tabanlı gösterimi.
+
+    entities, contexts ve scores aynı satır sırasını paylaşır (candidates sözlüğünün ekleme sırası);
+    özellik çıkarımı ve filtreleme satırlar üzerinde vektörel olarak yapılır.
+    """
+
+    def __init__(self, entities, contexts, scores):
+        self.entities = list(entities)
+        self.contexts = np.asarray(contexts, dtype=object)
+        self.scores = np.asarray(scores, dtype=np.float64)
+
+    @classmethod
+    def from_candidates(cls, candidates):
+        """{(varlık, bağlam): puan} sözlüğünden tablo oluştur"""
+        keys = list(candidates.keys())
+        return cls(
+            [key[0] for key in keys],
+            [key[1] for key in keys],
+            [candidates[key] for key in keys]
+        )
+
+    def __len__(self):
+        return len(self.entities)
+
+    def context_mask(self, context):
+        """Belirli bir bağlamdaki satırlar için boolean maske"""
+        return self.contexts == context
+
+    def feature_matrix(self, documents):
+        """
+        Adaylar için özellik matrisini oluştur (satır: aday, sütun: FEATURE_NAMES).
+
+        Args:
+            documents (dict): {bağlam: IndexedDocument} - adayın geçtiği bölge metni
+
+        Returns:
+            numpy.ndarray: (aday sayısı, len(FEATURE_NAMES)) boyutlu matris
+        """
+        count = len(self.entities)
+        features = np.zeros((count, len(FEATURE_NAMES)), dtype=np.float64)
+        if not count:
+            return features
+
+        features[:, 0] = self.scores
+        for column, context in enumerate(CANDIDATE_CONTEXTS, start=1):
+            features[:, column] = self.context_mask(context)
+
+        features[:, 4] = [len(entity) for entity in self.entities]
+        features[:, 5] = [len(entity.split()) for entity in self.entities]
+        features[:, 6] = [PERSON_NAME_FORMAT_RE.match(entity) is not None for entity in self.entities]
+        features[:, 7] = [entity.isupper() for entity in self.entities]
+        features[:, 8] = [any(char.isdigit() for char in entity) for entity in self.entities]
+        features[:, 9] = ['@' in entity for entity in self.entities]
+
+        # Bağlama dayalı özellikler: her bölge için adayların geçişleri tek taramada bulunur,
+        # ipucu konumları sıralı dizilerde ikili arama ile sorgulanır
+        for context in CANDIDATE_CONTEXTS:
+            document = documents.get(context)
+            rows = np.flatnonzero(self.context_mask(context))
+            if document is None or not document.text or not len(rows):
+                continue
+
+            row_entities = [self.entities[row] for row in rows]
+            occurrences = StringIndex(row_entities).find_all(document.text)
+
+            first_positions = np.array([occurrences[e][0] if e in occurrences else -1 for e in row_entities])
+            features[rows, 10] = [len(occurrences.get(e, ())) for e in row_entities]
+
+            found = first_positions >= 0
+            lengths = np.array([len(e) for e in row_entities])
+            window_starts = np.maximum(0, first_positions - FEATURE_WINDOW)
+            window_ends = first_positions + lengths + FEATURE_WINDOW
+
+            for column, pattern in ((11, CONTEXT_INDICATOR_RE), (12, IEEE_MEMBERSHIP_CONTEXT_RE), (13, EMAIL_RE)):
+                # finditer eşleşmeleri örtüşmez; başlangıçlar ve bitişler birlikte sıralıdır
+                spans = np.array([m.span() for m in pattern.finditer(document.text)], dtype=np.int64).reshape(-1, 2)
+                if not len(spans):
+                    continue
+                first_inside = np.searchsorted(spans[:, 0], window_starts, side="left")
+                last_inside = np.searchsorted(spans[:, 1], window_ends, side="right")
+                features[rows, column] = found & (last_inside > first_inside)
+
+        return features
+
+
+def get_candidate_model_bundle():
+    """CANDIDATE_MODEL_PATH ile verilen model paketini bir kez yükle (yoksa veya hatalıysa None)"""
+    global _model_bundle, _model_loaded
+
+    with _model_lock:
+        if _model_loaded:
+            return _model_bundle
+        _model_loaded = True
+
+        if not CANDIDATE_MODEL_PATH:
+            return None
+
+        try:
+            with open(CANDIDATE_MODEL_PATH, "rb") as f:
+                bundle = pickle.load(f)
+            if tuple(bundle.get("feature_names", ())) != FEATURE_NAMES:
+                logging.warning("Aday puanlama modelinin özellikleri güncel değil, sezgisel puanlama kullanılacak")
+                return None
+            _model_bundle = bundle
+            logging.info(f"Aday puanlama modeli yüklendi: {CANDIDATE_MODEL_PATH} ({', '.join(bundle['models'])})")
+        except Exception as e:
+            logging.error(f"Aday puanlama modeli yüklenemedi ({CANDIDATE_MODEL_PATH}): {str(e)}")
+
+        return _model_bundle
+
+
+def heuristic_keep_mask(table, entity_type, min_score=CANDIDATE_MIN_SCORE):
+    """
+    Sezgisel puanlara göre tutulacak adaylar.
+    Yazar adları için başlık ve ilk sayfa adayları her zaman, diğerleri min_score + 1 ile tutulur.
+    """
+    if entity_type == 'author_name':
+        return (table.scores >= min_score + 1) | table.context_mask("header") | table.context_mask("first_page")
+    return table.scores >= min_score
+
+
+def select_candidates(entity_type, candidates, documents=None, min_score=CANDIDATE_MIN_SCORE):
+    """
+    Adayları tek bir vektörel geçişte puanla, filtrele ve puana göre sırala.
+
+    Model yüklenmemişse sezgisel puanlar ve eşikler kullanılır; model varsa adayın gerçek
+    bir varlık olma olasılığı puan olarak kullanılır.
+
+    Args:
+        entity_type (str): Varlık tipi
+        candidates (dict): {(varlık, bağlam): puan}
+        documents (dict, optional): {bağlam: IndexedDocument} - model özellikleri için
+        min_score (int): Sezgisel puanlama için minimum puan
+
+    Returns:
+        list: Puana göre azalan sırada varlık metinleri
+    """
+    table = CandidateTable.from_candidates(candidates)
+    if not len(table):
+        return []
+
+    scores = table.scores
+    keep = heuristic_keep_mask(table, entity_type, min_score)
+
+    bundle = get_candidate_model_bundle()
+    model = bundle["models"].get(entity_type) if bundle else None
+    if model is not None and documents is not None:
+        try:
+            scores = model.predict_proba(table.feature_matrix(documents))[:, 1]
+            keep = scores >= bundle.get("threshold", CANDIDATE_MODEL_THRESHOLD)
+        except Exception as e:
+            logging.error(f"Aday puanlama modeli çalıştırılamadı, sezgisel puanlama kullanılıyor: {str(e)}")
+            scores = table.scores
+            keep = heuristic_keep_mask(table, entity_type, min_score)
+
+    kept_rows = np.flatnonzero(keep)
+    order = np.argsort(-scores[kept_rows], kind="stable")
+    return [table.entities[row] for row in kept_rows[order]]
@@ -0,0 +1,288 @@
+import os
+import json
+import hashlib
+import logging
+import threading
+import tempfile
+from collections import OrderedDict
+from app.utils.candidate_scoring import CANDIDATE_MODEL_PATH
+from app.utils.nlp_models import get_model_signature, package_version
+from app.utils.extraction_backends import backend_order
+
+# Tespit sonuçlarını etkileyen bir değişiklik yapıldığında (regex, puanlama, filtreleme,
+# metin çıkarımı) artırılmalıdır; eski önbellek kayıtları bu sayede kullanılmaz.
+DETECTOR_VERSION = "8"
+
+# Önbellek ayarları - ortam değişkenleri ile yapılandırılabilir
+DETECTION_CACHE_ENABLED = os.environ.get('DETECTION_CACHE_ENABLED', 'true').lower() == 'true'
+DETECTION_CACHE_DIR = os.environ.get(
+    'DETECTION_CACHE_DIR',
+    os.path.join(os.environ.get('UPLOAD_FOLDER', os.path.join(os.getcwd(), 'uploads')), '.cache', 'detection')
+)
+DETECTION_CACHE_MAX_BYTES = int(os.environ.get('DETECTION_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+DETECTION_CACHE_MEMORY_ITEMS = int(os.environ.get('DETECTION_CACHE_MEMORY_ITEMS', 32))
+
+# Dosya özeti hesaplanırken okunan blok boyutu
+DIGEST_BLOCK_SIZE = 1024 * 1024
+
+# Metin çıkarım arka ucu -> sürümü önbellek imzasına eklenen paket
+EXTRACTION_BACKEND_PACKAGES = {"pymupdf": "PyMuPDF", "pypdf": "pypdf", "pdfminer": "pdfminer.six"}
+
+_cache = None
+_cache_lock = threading.Lock()
+_runtime_signature = None
+
+
+def file_digest(file_path):
+    """
+    Dosya içeriğinin SHA-256 özetini hesapla.
+
+    Args:
+        file_path (str): Dosya yolu
+
+    Returns:
+        str: Onaltılık SHA-256 özeti
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(DIGEST_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def get_detector_version():
+    """
+    Önbellek anahtarına eklenen sürüm damgası.
+    Aday puanlama modeli kullanılıyorsa model dosyası da damgaya dahil edilir.
+    """
+    version = DETECTOR_VERSION
+    if CANDIDATE_MODEL_PATH and os.path.exists(CANDIDATE_MODEL_PATH):
+        version += f"+model:{os.path.basename(CANDIDATE_MODEL_PATH)}:{int(os.path.getmtime(CANDIDATE_MODEL_PATH))}"
+    return version
+
+
+def get_runtime_signature():
+    """
+    Tespit sonucunu etkileyen çalışma ortamı girdileri: spaCy ve kullanılan modelin paket sürümü,
+    metin çıkarım arka uçlarının sırası ve sürümleri. Farklı model veya arka uç yapılandırmasıyla
+    çalışan süreçler birbirlerinin önbellek kayıtlarını kullanmaz.
+
+    Model yüklenmeden paket bilgilerinden hesaplanır ve süreç başına bir kez oluşturulur.
+    """
+    global _runtime_signature
+    if _runtime_signature is None:
+        backends = ",".join(f"{name}@{package_version(EXTRACTION_BACKEND_PACKAGES[name])}" for name in backend_order())
+        _runtime_signature = f"spacy@{package_version('spacy')}:{get_model_signature()}|extraction:{backends}"
+    return _runtime_signature
+
+
+def make_cache_key(kind, digest, options=None, variant=None):
+    """
+    İçerik adresli önbellek anahtarı oluştur.
+
+    Args:
+        kind (str): Kayıt türü ("entities" veya "pages")
+        digest (str): PDF dosyasının SHA-256 özeti (sayfa kayıtlarında makale kimliği)
+        options (list, optional): Anonimleştirme seçenekleri (sıradan bağımsız)
+        variant (str, optional): Sonucu etkileyen ek girdilerin özeti (ör. kimlik indeksi imzası)
+
+    Returns:
+        str: Dosya adı olarak kullanılabilen anahtar
+    """
+    parts = [kind, digest, get_detector_version(), get_runtime_signature()]
+    if options is not None:
+        parts.append(",".join(sorted(set(options))))
+    if variant:
+        parts.append(variant)
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+class DetectionCache:
+    """
+    İki katmanlı tespit önbelleği.
+
+    Bellekteki LRU katmanı son kullanılan kayıtları JSON metni olarak tutar (her okuma yeni bir
+    nesne döndürür, çağıranların değişiklikleri önbelleğe yansımaz); disk katmanı JSON dosyalarından
+    oluşur ve toplam boyut sınırı aşıldığında en uzun süredir kullanılmayan (mtime) dosyalar silinir.
+    """
+
+    def __init__(self, cache_dir=DETECTION_CACHE_DIR, max_bytes=DETECTION_CACHE_MAX_BYTES,
+                 memory_items=DETECTION_CACHE_MEMORY_ITEMS):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.memory_items = memory_items
+        self._memory = OrderedDict()
+        self._lock = threading.RLock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _remember(self, key, value):
+        """Serileştirilmiş kaydı bellek katmanına ekle ve sınırı aşan en eski kayıtları çıkar"""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        """Kaydı döndür (yoksa None). Disk katmanından okunan kayıtlar bellek katmanına alınır."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return json.loads(self._memory[key])
+
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = f.read()
+            value = json.loads(payload)
+            # Son kullanım zamanını güncelle (LRU silme sırası için)
+            os.utime(path, None)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.warning(f"Önbellek kaydı okunamadı, yok sayılıyor ({key}): {str(e)}")
+            return None
+
+        with self._lock:
+            self._remember(key, payload)
+        return value
+
+    def put(self, key, value):
+        """Kaydı her iki katmana yaz; disk yazımı atomiktir"""
+        try:
+            payload = json.dumps(value, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            logging.warning(f"Önbellek kaydı serileştirilemedi ({key}): {str(e)}")
+            return
+
+        with self._lock:
+            self._remember(key, payload)
+
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, self._path(key))
+        except Exception as e:
+            logging.warning(f"Önbellek kaydı yazılamadı ({key}): {str(e)}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        self.evict()
+
+    def evict(self):
+        """Toplam disk boyutu sınırı aşıldıysa en uzun süredir kullanılmayan kayıtları sil"""
+        with self._lock:
+            entries = []
+            total = 0
+            for name in os.listdir(self.cache_dir):
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            if total <= self.max_bytes:
+                return
+
+            removed = 0
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                    removed += 1
+                except OSError:
+                    continue
+                self._memory.pop(os.path.basename(path)[:-len(".json")], None)
+
+            logging.info(f"Tespit önbelleğinden {removed} kayıt silindi (boyut sınırı: {self.max_bytes} bayt)")
+
+    def clear(self):
+        """Tüm kayıtları sil"""
+        with self._lock:
+            self._memory.clear()
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(".json"):
+                    try:
+                        os.remove(os.path.join(self.cache_dir, name))
+                    except OSError:
+                        pass
+
+
+def get_detection_cache():
+    """Süreç genelindeki önbelleği döndür (devre dışıysa veya oluşturulamazsa None)"""
+    global _cache
+
+    if not DETECTION_CACHE_ENABLED:
+        return None
+
+    with _cache_lock:
+        if _cache is None:
+            try:
+                _cache = DetectionCache()
+            except Exception as e:
+                logging.error(f"Tespit önbelleği oluşturulamadı ({DETECTION_CACHE_DIR}): {str(e)}")
+                return None
+        return _cache
+
+
+def get_cached_entities(digest, options, variant=None):
+    """PDF özeti ve seçenekler için önbellekteki tespit edilen varlıkları döndür"""
+    cache = get_detection_cache()
+    return cache.get(make_cache_key("entities", digest, options, variant)) if cache else None
+
+
+def store_entities(digest, options, entities, variant=None):
+    """Tespit edilen varlıkları önbelleğe yaz"""
+    cache = get_detection_cache()
+    if cache:
+        cache.put(make_cache_key("entities", digest, options, variant), entities)
+
+
+def page_record_options(options):
+    """Sayfa kaydının seçenek anahtarı (sıradan bağımsız)"""
+    return ",".join(sorted(set(options or [])))
+
+
+def page_record_version():
+    """Veritabanındaki sayfa kaydının sürümü: dedektör sürümü ve çalışma ortamı imzası"""
+    return f"{get_detector_version()}|{get_runtime_signature()}"
+
+
+def get_page_record(paper_id, options):
+    """
+    Makalenin son tespitinde kaydedilen sayfa parmak izlerini ve sayfa varlıklarını döndür.
+    Kayıtlar veritabanında makaleyle birlikte saklanır; disk önbelleği yalnızca hızlandırıcıdır.
+    Önbellekte olmayan kayıt veritabanından okunur ve önbelleğe yazılır.
+    """
+    from app.models.paper import Paper
+
+    cache = get_detection_cache()
+    key = make_cache_key("pages", f"paper:{paper_id}", options)
+    record = cache.get(key) if cache else None
+    if record is None:
+        record = Paper.get_page_record(paper_id, page_record_options(options), page_record_version())
+        if record is not None and cache:
+            cache.put(key, record)
+    return record
+
+
+def store_page_record(paper_id, options, record):
+    """Makalenin sayfa parmak izlerini ve sayfa varlıklarını veritabanına ve önbelleğe yaz"""
+    from app.models.paper import Paper
+
+    if not Paper.save_page_record(paper_id, page_record_options(options), page_record_version(), record):
+        logging.warning(f"Sayfa kaydı veritabanına yazılamadı (makale: {paper_id})")
+    cache = get_detection_cache()
+    if cache:
+        cache.put(make_cache_key("pages", f"paper:{paper_id}", options), record)
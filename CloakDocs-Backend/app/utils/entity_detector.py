@@ -1,71 +1,25 @@
+import os
 import re
+import time
+import atexit
 import logging
-import nltk
-from nltk.tokenize import word_tokenize, sent_tokenize
-import spacy
-import importlib.util
-import sys
-import subprocess
-
-# Gerekli NLTK paketlerini indirme
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-
-# Check if scispacy is installed, if not, try to install it
-try:
-    import scispacy
-    HAVE_SCISPACY = True
-    logging.info("SciSpaCy is already installed.")
-except ImportError:
-    HAVE_SCISPACY = False
-    logging.warning("SciSpaCy is not installed. Will attempt to install it.")
-    try:
-        logging.info("Installing SciSpaCy...")
-        subprocess.run([sys.executable, "-m", "pip", "install", "scispacy"], check=True)
-        
-        # Try to install scientific model
-        logging.info("Installing scientific NLP model...")
-        subprocess.run([
-            sys.executable, "-m", "pip", "install", 
-            "https://s3-us-west-2.amazonaws.com/ai2-s2-scispacy/releases/v0.5.3/en_core_sci_md-0.5.3.tar.gz"
-        ], check=True)
-        
-        # Re-import after installation
-        import scispacy
-        HAVE_SCISPACY = True
-        logging.info("SciSpaCy installed successfully.")
-    except Exception as e:
-        logging.error(f"Failed to install SciSpaCy: {str(e)}")
-        HAVE_SCISPACY = False
-
-# Load the Scientific NLP model if available, otherwise fall back to standard model
-try:
-    if HAVE_SCISPACY:
-        try:
-            # Try loading the scientific model first
-            nlp = spacy.load("en_core_sci_md")
-            logging.info("Loaded scientific NLP model (en_core_sci_md)")
-        except OSError:
-            # If the specific model isn't found, try downloading it
-            logging.warning("Scientific model not found, will attempt to download it...")
-            subprocess.run([
-                sys.executable, "-m", "pip", "install", 
-                "https://s3-us-west-2.amazonaws.com/ai2-s2-scispacy/releases/v0.5.3/en_core_sci_md-0.5.3.tar.gz"
-            ], check=True)
-            nlp = spacy.load("en_core_sci_md")
-            logging.info("Downloaded and loaded scientific NLP model (en_core_sci_md)")
-    else:
-        # Fall back to standard model if SciSpaCy isn't available
-        nlp = spacy.load("en_core_web_lg")  # Use large model for better entity recognition
-        logging.info("Loaded standard NLP model (en_core_web_lg)")
-except OSError:
-    # If all else fails, use the small model which is usually available
-    logging.warning("Preferred models not found. Downloading standard model...")
-    subprocess.run([sys.executable, "-m", "spacy", "download", "en_core_web_sm"])
-    nlp = spacy.load("en_core_web_sm")
-    logging.info("Loaded small standard NLP model (en_core_web_sm)")
+import threading
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from app.utils.nlp_models import get_nlp
+from app.utils.layout_classifier import get_roi_text
+from app.utils.string_index import StringIndex
+from app.utils.indexed_document import IndexedDocument
+from app.utils.interval_index import IntervalIndex
+from app.utils.candidate_scoring import CANDIDATE_MIN_SCORE, author_context_boosts, select_candidates
+from app.utils.identity_index import has_high_confidence_author_match, seed_identity_candidates
+from app.utils.institution_gazetteer import find_institutions
+from app.utils.patterns import (
+    AUTHOR_CONTEXT_RES,
+    SINGLE_NAME_LINE_RE, MULTI_NAME_LINE_RE, INITIAL_NAME_LINE_RE, AFFILIATION_LINE_RE, EMAIL_LINE_RE,
+    PHONE_RES, PHONE_LABEL_RE, EMAIL_RE, ORCID_RE, INSTITUTION_RES, INSTITUTION_CONTEXT_RE, AUTHOR_BLOCK_END_RE,
+    IEEE_BIOGRAPHY_PAGE_RES, IEEE_MEMBER_AUTHOR_RE, IEEE_AUTHOR_LIST_RES, count_matching_patterns
+)
 
 # Yazar isimlerinde kullanılabilen ünvan ve nitelikleri tanımla
 ACADEMIC_TITLES = [
@@ -90,16 +44,71 @@ ACADEMIC_TITLES = [
 # Ünvan regex'i - isimlerden önce gelebilecek tüm ünvanlar
 TITLE_REGEX = r"(?:{})\s+".format("|".join(ACADEMIC_TITLES))
 
-def detect_entities(text, options=None, excluded_text="", first_page_text="", header_sections=""):
+# NER sonuçlarını kullanan varlık tipleri (iletişim bilgileri yalnızca regex ile tespit edilir)
+NER_ENTITY_TYPES = ('author_name', 'institution_info')
+
+
+# nlp.pipe ayarları - ortam değişkenleri ile yapılandırılabilir
+NER_BATCH_SIZE = int(os.environ.get('NER_BATCH_SIZE', 8))
+NER_N_PROCESS = int(os.environ.get('NER_N_PROCESS', 1))
+
+# Büyük metin parçalama ve paralel NER ayarları
+NER_CHUNK_THRESHOLD = int(os.environ.get('NER_CHUNK_THRESHOLD', 500000))  # bu boyutun üzerindeki metinler parçalanır
+NER_CHUNK_SIZE = int(os.environ.get('NER_CHUNK_SIZE', 250000))
+NER_CHUNK_OVERLAP = int(os.environ.get('NER_CHUNK_OVERLAP', 2000))
+NER_PARALLEL_THRESHOLD = int(os.environ.get('NER_PARALLEL_THRESHOLD', 500000))
+NER_WORKERS = int(os.environ.get('NER_WORKERS', min(4, os.cpu_count() or 1)))
+
+# NER sonuçlarının süreçler arasında taşınabilen hafif gösterimi (ofsetler bölge metnine göre)
+NerSpan = namedtuple('NerSpan', ['text', 'label_', 'start_char', 'end_char'])
+
+# Süre bütçeli tespitte bölgelerin işlenme sırası (öncelik sırasıyla)
+DETECTION_STAGES = ("header", "first_page", "biography", "body")
+
+# İletişim bilgisi taramasında ana içerikteki konumları aranan bölgeler
+CONTACT_REGIONS = ("header", "first_page")
+
+# Telefon numarası bağlamında aranan göstergeler
+PHONE_INDICATORS = ['phone', 'tel', 'telefon', 'iletişim', 'contact', 'call', 'telephone', 'number', 'numara']
+
+# Süreç havuzu ilk büyük belgede oluşturulur
+_ner_pool = None
+_ner_pool_lock = threading.Lock()
+
+def detect_entities(text, options=None, excluded_text="", first_page_text="", header_sections="",
+                    layout_blocks=None, page_offsets=None, section_offsets=None, deadline_ms=None,
+                    stage_report=None, identity_index=None):
     """
     Detect personal information in text using a heuristic approach
     options: ['author_name', 'contact_info', 'institution_info']
     excluded_text: Text in excluded sections
     first_page_text: Text from the first page for prioritized author detection
     header_sections: Text from header areas likely containing author information
+    layout_blocks: layout_classifier.classify_layout_blocks çıktısı. Verilirse ana içerikte NER
+                   yalnızca yazar/kurum/dipnot/biyografi bloklarına ve yazar bağlam ifadelerinin
+                   çevresine uygulanır; regex taraması yine tüm metinde yapılır.
+    page_offsets, section_offsets: text_extractor'ın ana içerik için döndürdüğü sayfa ve bölüm
+                   başlangıç pozisyonları (IndexedDocument konum sorguları için, opsiyonel)
+    deadline_ms: Tespit için süre bütçesi (milisaniye). Verilirse bölgeler öncelik sırasıyla
+                   (DETECTION_STAGES) işlenir ve süre dolduğunda kalan aşamalar ve varlık tipleri
+                   atlanır; o ana kadar bulunan adaylarla kısmi sonuç döndürülür. None veya 0
+                   sınırsızdır; negatif değerler ValueError verir.
+    stage_report: Verilirse (dict) tamamlanan/atlanan aşamalar, kısmi sonuç bayrağı ve geçen
+                   süre bu sözlüğe yazılır.
+    identity_index: identity_index.IdentityIndex (gönderen e-postası ve önceden onaylanmış varlıklar).
+                   NER'den önce eşleştirilir; eşleşmeler aday olarak eklenir ve beklenen tüm yazarlar
+                   başlık/ilk sayfada yüksek güvenle eşleştiyse ana içerikte NER çalıştırılmaz.
     
     Her bir varlık tipi (yazar adı, iletişim bilgisi, kurum bilgisi) birbirinden bağımsız olarak tespit edilir.
     """
+    if deadline_ms is not None and deadline_ms < 0:
+        raise ValueError(f"deadline_ms negatif olamaz: {deadline_ms}")
+    
+    started = time.monotonic()
+    deadline = started + deadline_ms / 1000.0 if deadline_ms else None
+    report = stage_report if stage_report is not None else {}
+    report.update({"deadline_ms": deadline_ms, "completed_stages": [], "skipped_stages": [], "partial": False})
+    
     if options is None:
         options = ['author_name', 'contact_info', 'institution_info']
     
@@ -115,35 +124,95 @@ def detect_entities(text, options=None, excluded_text="", first_page_text="", he
     if not active_options:
         return entities
     
-    # Keywords ve INDEX TERMS bölümlerini belirleme - bunlar sansürlemeye dahil edilmeyecek
-    keywords_sections = []
-    index_terms_sections = []
+    # Her metin bölgesi için satır, sayfa, bölüm ve anahtar kelime indekslerini bir kez oluştur
+    document = IndexedDocument(text, page_offsets, section_offsets)
+    first_page_document = IndexedDocument(first_page_text)
+    header_document = IndexedDocument(header_sections)
+    
+    # Keywords ve INDEX TERMS bölümleri sansürlemeye dahil edilmeyecek
+    excluded_text = add_keyword_sections_to_excluded_text(document, excluded_text)
+    
+    # Bölge belgeleri (aday toplama ve aday puanlama modeli özellikleri için)
+    documents = {"header": header_document, "first_page": first_page_document, "main_content": document}
+    
+    # Gönderen kimliği eşleşmeleri - beklenen tüm yazarlar başlık/ilk sayfada kesin olarak bulunduysa
+    # ana içerik NER'i atlanır
+    identity_matches = identity_index.match(documents, active_options) if identity_index else []
+    skip_main_ner = bool(identity_index) and has_high_confidence_author_match(identity_matches, identity_index)
+    if identity_index:
+        report["identity"] = {"matches": len(identity_matches), "main_ner_skipped": skip_main_ner}
+        if skip_main_ner:
+            logging.info("Beklenen tüm yazarlar başlık/ilk sayfada bulundu, ana içerikte NER atlanıyor")
+    
+    use_ner = text and len(text) >= 10 and any(opt in NER_ENTITY_TYPES for opt in active_options)
+    main_ner_text = text
+    if use_ner and layout_blocks and not skip_main_ner:
+        main_ner_text = build_ner_focus_text(text, layout_blocks) or text
+    
+    # Her varlık tipi için ayrı candidates sözlüğü - birbirlerini etkilemelerini önler
+    candidates_by_type = {entity_type: {entity_type: {}} for entity_type in active_options}  # {entity: score} formatında
+    
+    # Boş veya çok kısa metinde aday toplanmaz
+    if text and len(text) >= 10:
+        if deadline is None:
+            # Her metin bölgesini yalnızca bir kez ayrıştır - tüm varlık tipleri aynı Doc nesnelerini kullanır
+            parsed_regions = {}
+            if use_ner:
+                parsed_regions = parse_text_regions([
+                    ("header", header_sections),
+                    ("first_page", first_page_text),
+                    ("main_content", "" if skip_main_ner else main_ner_text)
+                ])
+            
+            for entity_type in active_options:
+                collect_candidates(documents, candidates_by_type[entity_type], entity_type, parsed_regions)
+            report["completed_stages"] = list(DETECTION_STAGES)
+        else:
+            collect_candidates_within_deadline(documents, candidates_by_type, active_options, deadline, report,
+                                               ner_texts={"header": header_sections,
+                                                          "first_page": first_page_text,
+                                                          "main_content": "" if skip_main_ner else main_ner_text}
+                                               if use_ner else {})
     
-    # INDEX TERMS bölümlerini özel olarak bul
-    index_patterns = [
-        r'INDEX\s+TERMS[\s\:\-]+.*?(?=\n\n|\Z)',  # INDEX TERMS: ile başlayan bölüm
-        r'INDEX\s+TERMS.*?\n(.*?)(?=\n\n|\Z)',  # INDEX TERMS sonrası içerik
-        r'(?:^|\n)INDEX\s+TERMS[^\n]*\n((?:[^\n]+[\n]?){1,5})',  # INDEX TERMS kısmı ve sonraki 5 satır
-    ]
+    for entity_type in active_options:
+        seed_identity_candidates(candidates_by_type[entity_type], entity_type, identity_matches)
+        
+        # Filtreleme ve sıralama tek vektörel geçişte yapılır (yazar adları için başlık/ilk sayfa
+        # adayları her zaman tutulur); CANDIDATE_MODEL_PATH verilmişse eğitilmiş model kullanılır
+        entities[entity_type] = select_candidates(entity_type, candidates_by_type[entity_type][entity_type], documents)
     
-    for pattern in index_patterns:
-        for match in re.finditer(pattern, text, re.IGNORECASE | re.DOTALL):
-            if match.group(0):
-                index_terms_sections.append(match.group(0))
-                logging.info(f"INDEX TERMS bölümü tespit edildi: {match.group(0)[:50]}...")
-    
-    # KEYWORDS bölümlerini özel olarak bul
-    keywords_patterns = [
-        r'KEYWORDS[\s\:\-]+.*?(?=\n\n|\Z)',  # KEYWORDS: ile başlayan bölüm
-        r'KEYWORDS.*?\n(.*?)(?=\n\n|\Z)',  # KEYWORDS sonrası içerik
-        r'(?:^|\n)KEYWORDS[^\n]*\n((?:[^\n]+[\n]?){1,5})',  # KEYWORDS kısmı ve sonraki 5 satır
-    ]
+    # Son filtreleme ve normalizasyon
+    entities = normalize_and_filter_entities(entities, document, excluded_text)
+    
+    # Sonuçları logla
+    log_entity_stats(entities)
+    
+    report["elapsed_ms"] = int((time.monotonic() - started) * 1000)
+    if report["partial"]:
+        logging.warning(f"Tespit süre bütçesi ({deadline_ms} ms) doldu, kısmi sonuç döndürülüyor. "
+                        f"Tamamlanan aşamalar: {report['completed_stages']}, atlanan: {report['skipped_stages']}")
+    
+    return entities
+
+
+def add_keyword_sections_to_excluded_text(document, excluded_text):
+    """
+    INDEX TERMS ve KEYWORDS bölümlerini hariç tutulan metne ekle.
+    
+    Args:
+        document (IndexedDocument): Ana içerik
+        excluded_text (str): Hariç tutulan bölümlerin metni
+        
+    Returns:
+        str: Anahtar kelime/terim bölümleri eklenmiş hariç tutulan metin
+    """
+    index_terms_sections = document.keyword_sections("index_terms")
+    keywords_sections = document.keyword_sections("keywords")
     
-    for pattern in keywords_patterns:
-        for match in re.finditer(pattern, text, re.IGNORECASE | re.DOTALL):
-            if match.group(0):
-                keywords_sections.append(match.group(0))
-                logging.info(f"KEYWORDS bölümü tespit edildi: {match.group(0)[:50]}...")
+    for section in index_terms_sections:
+        logging.info(f"INDEX TERMS bölümü tespit edildi: {section[:50]}...")
+    for section in keywords_sections:
+        logging.info(f"KEYWORDS bölümü tespit edildi: {section[:50]}...")
     
     # Tüm bu bölümleri excluded_text'e ekle
     if index_terms_sections or keywords_sections:
@@ -151,95 +220,384 @@ def detect_entities(text, options=None, excluded_text="", first_page_text="", he
         excluded_text = (excluded_text + "\n" + "\n".join(all_excluded_sections)) if excluded_text else "\n".join(all_excluded_sections)
         logging.info(f"Toplam {len(all_excluded_sections)} anahtar kelime/terim bölümü sansürleme dışında bırakıldı")
     
-    # Her varlık tipi için ayrı ayrı işlem yaparak birbirlerini etkilemelerini önle
-    for entity_type in active_options:
-        # Her varlık tipi için ayrı candidates sözlüğü oluştur
-        candidates = {entity_type: {}}  # {entity: score} formatında
+    return excluded_text
+
+
+def collect_candidates(documents, candidates, entity_type, parsed_regions=None):
+    """
+    Başlık, ilk sayfa ve ana içerik bölgelerinden tek bir varlık tipinin adaylarını topla.
+    
+    Args:
+        documents (dict): {"header", "first_page", "main_content"} -> IndexedDocument
+        candidates (dict): {entity_type: {(varlık, bağlam): puan}} - yerinde güncellenir
+        entity_type (str): Varlık tipi
+        parsed_regions (dict, optional): parse_text_regions çıktısı
+    """
+    parsed_regions = parsed_regions or {}
+    
+    # İletişim bilgileri yalnızca regex ile bulunur - üç bölge tek taramada işlenir
+    if entity_type == 'contact_info':
+        extract_contact_entities(documents, candidates)
+        return
+    
+    # Header bölümlerinden varlık tespiti (yüksek öncelikli)
+    if documents["header"]:
+        process_text_for_single_entity_type(documents["header"], candidates, entity_type, 
+                                           context="header", first_page=True,
+                                           ner_spans=parsed_regions.get("header", []))
+    
+    # İlk sayfadan varlık tespiti (orta öncelik)
+    if documents["first_page"]:
+        process_text_for_single_entity_type(documents["first_page"], candidates, entity_type, 
+                                           context="first_page", first_page=True,
+                                           ner_spans=parsed_regions.get("first_page", []))
+    
+    # Ana içerikten varlık tespiti (normal öncelik)
+    process_text_for_single_entity_type(documents["main_content"], candidates, entity_type, 
+                                      context="main_content", first_page=False,
+                                      ner_spans=parsed_regions.get("main_content", []))
+
+
+def get_biography_page_document(document):
+    """
+    Ana içeriğin son sayfası biyografi göstergeleri içeriyorsa o sayfanın IndexedDocument'ını döndür.
+    IEEE makalelerinde yazar biyografileri son sayfada yer alır (anonymize_processor ile aynı varsayım).
+    Son sayfa, ana içeriğe metin katan son sayfadır: referans başlığından sonraki sayfaların
+    ofsetleri de kaydedildiğinden (boş aralıklar) bu sayfalar atlanır.
+    """
+    page_start = next((start for start in reversed(document.page_starts) if document.text[start:].strip()), None)
+    if page_start is None:
+        return None
+    
+    page_text = document.text[page_start:]
+    if count_matching_patterns(IEEE_BIOGRAPHY_PAGE_RES, page_text, limit=1) == 0:
+        return None
+    return IndexedDocument(page_text)
+
+
+def collect_candidates_within_deadline(documents, candidates_by_type, active_options, deadline, report, ner_texts=None):
+    """
+    Adayları süre bütçesi içinde, bölgelerin öncelik sırasıyla topla.
+    
+    Aşamalar: başlık, ilk sayfa, son sayfadaki biyografiler, ana içerik. Süre her aşamadan önce
+    ve aşama içinde NER ayrıştırmasından sonra ve her varlık tipinden önce kontrol edilir; süre
+    dolmuşsa kalan varlık tipleri ve aşamalar atlanır ve rapor kısmi olarak işaretlenir (yarıda
+    kalan aşama interrupted_stage, atlanan tipleri skipped_entity_types olarak yazılır).
+    Ana içerik aşaması biyografi sayfasını da kapsadığından, bir varlık tipi ana içerikte
+    işlenmeden önce o tipin biyografi aşaması adayları geri alınır; böylece süre yetiştiğinde
+    sonuç bütçesiz tespitle aynıdır.
+    NER, her aşamada yalnızca o aşamanın bölgesi için çalıştırılır. İletişim bilgileri yalnızca
+    regex ile bulunduğundan üç bölge için de başlık aşamasında tek taramada toplanır.
+    
+    Args:
+        documents (dict): {"header", "first_page", "main_content"} -> IndexedDocument
+        candidates_by_type (dict): {varlık_tipi: {varlık_tipi: {(varlık, bağlam): puan}}} - yerinde güncellenir
+        active_options (list): İşlenecek varlık tipleri
+        deadline (float): time.monotonic() cinsinden son zaman
+        report (dict): Aşama raporu - yerinde güncellenir
+        ner_texts (dict, optional): {bölge: NER uygulanacak metin}; boşsa NER çalıştırılmaz
+    """
+    ner_texts = ner_texts or {}
+    biography_document = get_biography_page_document(documents["main_content"])
+    snapshot = None
+    
+    for stage in DETECTION_STAGES:
+        if time.monotonic() >= deadline:
+            index = DETECTION_STAGES.index(stage)
+            report["skipped_stages"] = list(DETECTION_STAGES[index:])
+            report["partial"] = True
+            return
+        
+        if stage == "header" and 'contact_info' in active_options:
+            extract_contact_entities(documents, candidates_by_type['contact_info'])
+        
+        if stage == "biography":
+            if biography_document:
+                # Ana içerik aşamasına geçilirse geri alınmak üzere mevcut adayları sakla
+                snapshot = {entity_type: dict(candidates[entity_type])
+                            for entity_type, candidates in candidates_by_type.items()}
+                for entity_type in active_options:
+                    if entity_type == 'contact_info':
+                        continue
+                    process_text_for_single_entity_type(biography_document, candidates_by_type[entity_type], entity_type,
+                                                        context="main_content", first_page=False)
+            report["completed_stages"].append(stage)
+            continue
         
-        # Boş veya çok büyük metni kontrol et
-        if not text or len(text) < 10:
+        region = "main_content" if stage == "body" else stage
+        region_document = documents[region]
+        if not region_document and region != "main_content":
+            report["completed_stages"].append(stage)
             continue
         
-        # Header bölümlerinden varlık tespiti (yüksek öncelikli)
-        if header_sections:
-            process_text_for_single_entity_type(header_sections, candidates, entity_type, 
-                                               context="header", first_page=True)
+        parsed = parse_text_regions([(region, ner_texts[region])]) if ner_texts.get(region) else {}
+        entity_types = [entity_type for entity_type in active_options if entity_type != 'contact_info']
+        for index, entity_type in enumerate(entity_types):
+            if time.monotonic() >= deadline:
+                report["interrupted_stage"] = stage
+                report["skipped_entity_types"] = entity_types[index:]
+                report["skipped_stages"] = list(DETECTION_STAGES[DETECTION_STAGES.index(stage) + 1:])
+                report["partial"] = True
+                return
+            
+            if stage == "body" and snapshot is not None:
+                candidates_by_type[entity_type][entity_type] = snapshot[entity_type]
+            process_text_for_single_entity_type(region_document, candidates_by_type[entity_type], entity_type,
+                                                context=region, first_page=(region != "main_content"),
+                                                ner_spans=parsed.get(region, []))
+        report["completed_stages"].append(stage)
+
+
+def split_text_into_chunks(text, chunk_size=None, overlap=None):
+    """
+    Büyük metni satır/cümle sınırlarına göre örtüşen parçalara böl.
+    
+    Parça sonları mümkünse son satır sonu veya cümle sonuna çekilir; bir sonraki parça
+    overlap karakter geriden (bir satır başından) başlar, böylece parça sınırında kalan
+    varlıklar en az bir parçada bütün olarak görülür.
+    
+    Returns:
+        list: (başlangıç_ofseti, parça_metni) çiftleri
+    """
+    chunk_size = chunk_size or NER_CHUNK_SIZE
+    overlap = NER_CHUNK_OVERLAP if overlap is None else overlap
+    
+    if len(text) <= NER_CHUNK_THRESHOLD:
+        return [(0, text)]
+    
+    logging.info(f"Büyük metin tespit edildi ({len(text)} karakter), örtüşen parçalar halinde işleniyor")
+    
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = min(len(text), start + chunk_size)
         
-        # İlk sayfadan varlık tespiti (orta öncelik)
-        if first_page_text:
-            process_text_for_single_entity_type(first_page_text, candidates, entity_type, 
-                                               context="first_page", first_page=True)
+        if end < len(text):
+            # Parçayı son satır sonunda, yoksa son cümle sonunda bitir
+            min_end = start + chunk_size // 2
+            boundary = text.rfind("\n", min_end, end)
+            if boundary == -1:
+                boundary = text.rfind(". ", min_end, end)
+            if boundary != -1:
+                end = boundary + 1
         
-        # Ana içerikten varlık tespiti (normal öncelik)
-        process_text_for_single_entity_type(text, candidates, entity_type, 
-                                          context="main_content", first_page=False)
+        chunks.append((start, text[start:end]))
         
-        # Varlık tipine özgü minimum puanları belirle
-        min_score = 1  # Varsayılan minimum puan
+        if end >= len(text):
+            break
         
-        # Varlık tipine göre özelleştirilmiş filtreler uygula
-        if entity_type == 'author_name':
-            filtered_candidates = {k: v for k, v in candidates[entity_type].items() 
-                                if (v >= min_score + 1 or 
-                                    ('header' in k[1] or 'first_page' in k[1]))}
-        else:
-            filtered_candidates = {k: v for k, v in candidates[entity_type].items() 
-                                if v >= min_score}
+        # Bir sonraki parça örtüşme bölgesindeki ilk satır (yoksa kelime) başından başlar
+        next_start = max(start + 1, end - overlap)
+        boundary = text.find("\n", next_start, end)
+        if boundary == -1:
+            boundary = text.find(" ", next_start, end)
+        start = boundary + 1 if boundary != -1 else next_start
+    
+    return chunks
+
+
+def _run_ner_on_chunk(chunk_text):
+    """Süreç havuzu işçisi: parçayı NER'den geçir ve seri hale getirilebilir span'lar döndür"""
+    nlp = get_nlp()
+    if nlp is None:
+        return []
+    doc = nlp(chunk_text)
+    return [(ent.text, ent.label_, ent.start_char, ent.end_char) for ent in doc.ents]
+
+
+def _init_ner_worker():
+    """Süreç havuzu işçisini başlatırken modeli önceden yükle"""
+    get_nlp()
+
+
+def _get_ner_pool():
+    """Büyük belgeler için NER süreç havuzunu (modeller önceden yüklenmiş) ilk kullanımda oluştur"""
+    global _ner_pool
+    with _ner_pool_lock:
+        if _ner_pool is None:
+            _ner_pool = ProcessPoolExecutor(max_workers=NER_WORKERS, initializer=_init_ner_worker)
+            logging.info(f"NER süreç havuzu oluşturuldu ({NER_WORKERS} işçi)")
+        return _ner_pool
+
+
+def _reset_ner_pool():
+    """Bozulan (veya süreç sonlanırken) NER süreç havuzunu kapat; sonraki büyük belgede yeni havuz oluşturulur"""
+    global _ner_pool
+    with _ner_pool_lock:
+        pool, _ner_pool = _ner_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+        logging.info("NER süreç havuzu kapatıldı")
+
+
+atexit.register(_reset_ner_pool)
+
+
+def parse_text_regions(regions, batch_size=None, n_process=None):
+    """
+    Metin bölgelerini (header, first_page, main_content) NER'den geçir.
+    
+    Tüm bölgeler ve örtüşen metin parçaları tek bir nlp.pipe(..., as_tuples=True) çağrısına
+    gönderilir; tuple bağlamı her parçanın bölgesini ve bölge içindeki ofsetini taşır.
+    Toplam metin NER_PARALLEL_THRESHOLD karakteri aşarsa parçalar modelleri önceden
+    yüklenmiş bir süreç havuzunda çalıştırılır. Örtüşme bölgesinde iki kez bulunan
+    varlıklar bölge ofsetlerine göre tekilleştirilir. Aynı metne sahip bölgeler tek bir
+    ayrıştırmayı paylaşır.
+    
+    Args:
+        regions (list): (context, text) çiftleri
+        batch_size (int, optional): nlp.pipe batch boyutu (varsayılan: NER_BATCH_SIZE)
+        n_process (int, optional): nlp.pipe süreç sayısı (varsayılan: NER_N_PROCESS)
+        
+    Returns:
+        dict: {context: [NerSpan, ...]} - ofsetler bölge metnine göredir
+    """
+    pipe_input = []
+    region_by_text = {}  # Aynı metni tekrar ayrıştırmamak için metin -> ilk bölge
+    aliases = {}
+    
+    for context, region_text in regions:
+        if not region_text:
+            continue
         
-        # Güven puanına göre sırala (azalan)
-        sorted_candidates = sorted(filtered_candidates.items(), key=lambda x: x[1], reverse=True)
+        if region_text in region_by_text:
+            aliases[context] = region_by_text[region_text]
+            continue
         
-        # Varlık metinlerini tuple'lardan çıkar ve nihai listeye ekle
-        entities[entity_type] = [candidate[0][0] for candidate in sorted_candidates]
+        region_by_text[region_text] = context
+        for offset, chunk in split_text_into_chunks(region_text):
+            pipe_input.append((chunk, (context, offset)))
+    
+    parsed_regions = {}
+    if not pipe_input:
+        return parsed_regions
+    
+    nlp = get_nlp()
+    if nlp is None:
+        logging.warning("spaCy modeli yüklenemediği için NER atlanıyor, yalnızca regex tespiti yapılacak")
+        return parsed_regions
+    
+    results = None
+    total_chars = sum(len(chunk) for chunk, _ in pipe_input)
+    if NER_WORKERS > 1 and len(pipe_input) > 1 and total_chars > NER_PARALLEL_THRESHOLD:
+        chunk_texts = [chunk for chunk, _ in pipe_input]
+        try:
+            chunk_results = list(_get_ner_pool().map(_run_ner_on_chunk, chunk_texts))
+            results = zip(chunk_results, (context for _, context in pipe_input))
+            logging.info(f"{len(pipe_input)} metin parçası {NER_WORKERS} işçili süreç havuzunda işlendi")
+        except Exception as e:
+            # Örn. model yüklenirken bellek yetersizliğinden sonlanan işçi (BrokenProcessPool)
+            logging.warning(f"Paralel NER başarısız oldu, parçalar bu süreçte işlenecek: {str(e)}")
+            _reset_ner_pool()
+    if results is None:
+        docs = nlp.pipe(
+            pipe_input,
+            as_tuples=True,
+            batch_size=batch_size or NER_BATCH_SIZE,
+            n_process=n_process or NER_N_PROCESS
+        )
+        results = (
+            ([(ent.text, ent.label_, ent.start_char, ent.end_char) for ent in doc.ents], context)
+            for doc, context in docs
+        )
+        logging.info(f"{len(pipe_input)} metin parçası tek bir nlp.pipe çağrısıyla ayrıştırıldı")
+    
+    # Parça ofsetlerini bölge ofsetine çevir ve örtüşmede tekrar bulunan varlıkları ele
+    seen_spans = set()
+    for ents, (context, offset) in results:
+        region_ents = parsed_regions.setdefault(context, [])
+        for ent_text, label, start_char, end_char in ents:
+            span_key = (context, offset + start_char, offset + end_char, label)
+            if span_key in seen_spans:
+                continue
+            seen_spans.add(span_key)
+            region_ents.append(NerSpan(ent_text, label, offset + start_char, offset + end_char))
     
-    # Son filtreleme ve normalizasyon
-    entities = normalize_and_filter_entities(entities, text, excluded_text)
+    for context, source_context in aliases.items():
+        parsed_regions[context] = parsed_regions.get(source_context, [])
     
-    # Sonuçları logla
-    log_entity_stats(entities)
+    return parsed_regions
+
+
+def build_ner_focus_text(text, layout_blocks, window_size=300):
+    """
+    NER'in çalıştırılacağı ilgi bölgesi (ROI) metnini oluştur.
     
-    return entities
+    Sayfa düzeni sınıflandırıcısının yazar, kurum, dipnot ve biyografi olarak işaretlediği
+    bloklar ile ana metinde yazar bağlam ifadelerinin çevresindeki pencereler birleştirilir.
+    Böylece NER süresi makalenin uzunluğundan büyük ölçüde bağımsız olur.
+    """
+    parts = []
+    
+    roi_text = get_roi_text(layout_blocks)
+    if roi_text:
+        parts.append(roi_text)
+    
+    # Yazar bağlam ifadelerinin çevresindeki pencereleri birleştirerek ekle
+    windows = []
+    for phrase in AUTHOR_CONTEXT_RES:
+        for match in phrase.finditer(text):
+            windows.append((max(0, match.start() - window_size), min(len(text), match.end() + window_size)))
+    
+    windows.sort()
+    merged = []
+    for start, end in windows:
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    
+    parts.extend(text[start:end] for start, end in merged)
+    
+    focus_text = "\n\n".join(parts)
+    logging.info(f"NER ilgi bölgesi: {len(focus_text)} karakter (tüm metin: {len(text)} karakter)")
+    return focus_text
 
 
-def process_text_for_single_entity_type(text, candidates, entity_type, context="main_content", first_page=False):
+def process_text_for_single_entity_type(document, candidates, entity_type, context="main_content", first_page=False,
+                                        ner_spans=None):
     """
     Belirli bir varlık tipi için metni işle
+    document: IndexedDocument (veya düz metin)
+    ner_spans: parse_text_regions ile önceden bulunmuş NER span listesi. Span'lar ilgi
+               bölgesi metninden gelebilir; regex her zaman belge metni üzerinde çalışır.
     """
-    # Büyük metni parçalar halinde işle
-    if len(text) > 500000:  # metin ~500KB'dan büyükse
-        logging.info(f"Büyük metin tespit edildi ({len(text)} karakter), parçalar halinde işleniyor")
-        chunks = [text[i:i+250000] for i in range(0, len(text), 250000)]
-        for chunk in chunks:
-            process_chunk_for_single_entity_type(chunk, candidates, entity_type, context, first_page)
-    else:
-        process_chunk_for_single_entity_type(text, candidates, entity_type, context, first_page)
+    document = IndexedDocument.wrap(document)
+    
+    if ner_spans is None and entity_type in NER_ENTITY_TYPES:
+        ner_spans = parse_text_regions([(context, document.text)]).get(context, [])
+    
+    # NER ile varlıkları çıkar
+    if ner_spans:
+        extract_ner_entities_for_type(ner_spans, candidates, entity_type, context, first_page)
+    
+    # Regex taraması spaCy uzunluk sınırına tabi olmadığından tüm metin üzerinde yapılır;
+    # böylece parça sınırında kalan eşleşmeler de kaçmaz
+    process_chunk_for_single_entity_type(document, candidates, entity_type, context, first_page)
     
     # Özellikle konferans makaleleri için akademik başlık ve yazar taraması yap
     if first_page and entity_type == 'author_name':
-        extract_academic_header_entities(text, candidates, [entity_type], context)
+        extract_academic_header_entities(document, candidates, [entity_type], context)
 
 
-def process_chunk_for_single_entity_type(text, candidates, entity_type, context, first_page):
+def process_chunk_for_single_entity_type(document, candidates, entity_type, context, first_page):
     """Tek bir varlık tipi için metin parçasını işle"""
-    # spaCy NER kullan
-    doc = nlp(text)
-    
-    # NER ile varlıkları çıkar
-    extract_ner_entities_for_type(doc, candidates, entity_type, context, first_page)
-    
     # Regex ile varlıkları çıkar
-    extract_regex_entities_for_type(text, candidates, entity_type, context, first_page)
+    extract_regex_entities_for_type(document, candidates, entity_type, context, first_page)
     
     # Yazar bağlamında geçen varlıkların puanlarını artır
     if entity_type == 'author_name':
-        boost_entities_in_author_contexts(text, candidates, [entity_type], context, first_page)
+        boost_entities_in_author_contexts(document, candidates, [entity_type], context, first_page)
 
 
-def extract_ner_entities_for_type(doc, candidates, entity_type, context, first_page):
-    """Belirli bir varlık tipi için NER kullanarak varlıkları çıkar"""
+def extract_ner_entities_for_type(ner_spans, candidates, entity_type, context, first_page):
+    """
+    Belirli bir varlık tipi için NER kullanarak varlıkları çıkar
+    ner_spans: text ve label_ alanlarına sahip varlıklar (NerSpan listesi veya doc.ents)
+    """
     # Kişi isimleri
     if entity_type == 'author_name':
-        for ent in doc.ents:
+        for ent in ner_spans:
             if ent.label_ in ["PERSON", "ORG:PERSON"]:
                 name = ent.text.strip()
                 
@@ -260,7 +618,7 @@ def extract_ner_entities_for_type(doc, candidates, entity_type, context, first_p
     
     # Kurum Bilgileri
     elif entity_type == 'institution_info':
-        for ent in doc.ents:
+        for ent in ner_spans:
             if ent.label_ in ["ORG", "FAC", "GPE", "LOC", "FACILITY", "ORGANIZATION"]:
                 institution = ent.text.strip()
                 
@@ -290,41 +648,42 @@ def extract_ner_entities_for_type(doc, candidates, entity_type, context, first_p
         pass  # Email için özel bir NER işlemi olmadığı için boş geçiyoruz
 
 
-def extract_regex_entities_for_type(text, candidates, entity_type, context, first_page):
+def extract_regex_entities_for_type(document, candidates, entity_type, context, first_page):
     """Belirli bir varlık tipi için regex kullanarak varlıkları çıkar"""
+    text = document.text
     
     # Kişi isimleri için regex kalıpları
     if entity_type == 'author_name':
         # Akademik makalelerde yaygın olan satır bazlı yazar formatı - isim + departman + üniversite
         # Örnek: "Divyashikha Sethia\nDepartment of Computer\nScience and Engineering\nDelhi Technological University\nDelhi, India"
-        lines = text.split('\n')
+        lines = document.lines
         for i, line in enumerate(lines):
             line = line.strip()
             # Tek kelimelik ve tek satırlık isimler
-            if i < len(lines) - 1 and re.match(r'^[A-Z][a-zA-Z\-]+$', line):
+            if i < len(lines) - 1 and SINGLE_NAME_LINE_RE.match(line):
                 name = line
                 # Sonraki satırda "Department" veya benzeri kelimeler varsa
-                if i+1 < len(lines) and re.search(r'Department|Faculty|Institute|School', lines[i+1]):
+                if i+1 < len(lines) and AFFILIATION_LINE_RE.search(lines[i+1]):
                     if is_valid_person_name(name):
                         name_key = (name, context)
                         candidates[entity_type][name_key] = max(candidates[entity_type].get(name_key, 0), 3.0)
                         logging.info(f"Tek kelimelik satır bazlı yazar tespit edildi: {name}")
             
             # İki veya daha fazla kelimeden oluşan isimler
-            if re.match(r'^[A-Z][a-zA-Z\-]+(?:\s+[A-Z][a-zA-Z\-]+)+$', line):
+            if MULTI_NAME_LINE_RE.match(line):
                 name = line
                 # Sonraki satırda "Department" veya benzeri kelimeler varsa
-                if i+1 < len(lines) and re.search(r'Department|Faculty|Institute|School', lines[i+1]):
+                if i+1 < len(lines) and AFFILIATION_LINE_RE.search(lines[i+1]):
                     if is_valid_person_name(name):
                         name_key = (name, context)
                         candidates[entity_type][name_key] = max(candidates[entity_type].get(name_key, 0), 3.0)
                         logging.info(f"Satır bazlı yazar tespit edildi: {name}")
                         
             # İsmi başında inisyal olan yazarları tespit et (örn: "S. Indu")
-            if re.match(r'^[A-Z]\.\s+[A-Z][a-zA-Z\-]+$', line):
+            if INITIAL_NAME_LINE_RE.match(line):
                 name = line
                 # Sonraki satırda "Department" veya benzeri kelimeler varsa
-                if i+1 < len(lines) and re.search(r'Department|Faculty|Institute|School', lines[i+1]):
+                if i+1 < len(lines) and AFFILIATION_LINE_RE.search(lines[i+1]):
                     if is_valid_person_name(name):
                         name_key = (name, context)
                         candidates[entity_type][name_key] = max(candidates[entity_type].get(name_key, 0), 3.0)
@@ -365,17 +724,17 @@ def extract_regex_entities_for_type(text, candidates, entity_type, context, firs
         # Örnek:
         # Divyashikha Sethia
         # divyashikha@dtu.ac.in
-        lines = text.split('\n')
+        lines = document.lines
         for i in range(len(lines) - 1):
             # İlk satır isim olabilir
             current_line = lines[i].strip()
             next_line = lines[i + 1].strip()
             
             # İsim formatı kontrolü
-            if (re.match(r'^[A-Z][a-zA-Z\-]+(?:\s+[A-Z][a-zA-Z\-]+)+$', current_line) or 
-                re.match(r'^[A-Z]\.\s+[A-Z][a-zA-Z\-]+$', current_line)):
+            if (MULTI_NAME_LINE_RE.match(current_line) or 
+                INITIAL_NAME_LINE_RE.match(current_line)):
                 # Sonraki satır email olabilir
-                if re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', next_line):
+                if EMAIL_LINE_RE.match(next_line):
                     name = current_line
                     email = next_line
                     
@@ -394,7 +753,7 @@ def extract_regex_entities_for_type(text, candidates, entity_type, context, firs
                 candidates[entity_type][name_key] = max(candidates[entity_type].get(name_key, 0), 2.0)
                 
         # IEEE formatındaki isimler (John Smith, Member, IEEE)
-        ieee_author_matches = re.findall(r'([A-Z][a-zA-Z\-]+(?:\s+[A-Z][a-zA-Z\-]+)+)(?:,\s+(?:Member|Senior Member|Fellow|Student Member|Associate Member),\s+IEEE)', text)
+        ieee_author_matches = IEEE_MEMBER_AUTHOR_RE.findall(text)
         for name in ieee_author_matches:
             name = name.strip()
             if is_valid_person_name(name):
@@ -403,90 +762,33 @@ def extract_regex_entities_for_type(text, candidates, entity_type, context, firs
     
     # İletişim bilgileri için regex kalıpları
     elif entity_type == 'contact_info':
-        # Telefon numaraları için regex kalıpları
-        phone_patterns = [
-            # Temizlenmiş uluslararası telefon formatı
-            r'\b\+\d{1,3}[\s\-\.]?\d{1,4}[\s\-\.]?\d{1,4}[\s\-\.]?\d{1,4}\b',
-            
-            # US/Kanada formatı
-            r'\b\(\d{3}\)[\s\-\.]?\d{3}[\s\-\.]?\d{4}\b',
-            r'\b\d{3}[\s\-\.]?\d{3}[\s\-\.]?\d{4}\b',
-            
-            # Avrupa türü formatlar
-            r'\b\d{2,4}[\s\-\.]\d{2,4}[\s\-\.]\d{2,4}[\s\-\.]\d{2,4}\b',
-            
-            # Türkiye formatı
-            r'\b0[\s\-\.]?\d{3}[\s\-\.]\d{3}[\s\-\.]\d{2}[\s\-\.]\d{2}\b',
-            r'\b\+90[\s\-\.]?\d{3}[\s\-\.]\d{3}[\s\-\.]\d{2}[\s\-\.]\d{2}\b',
-            
-            # Akademik makalelerdeki özel formatlar
-            r'(?:phone|tel)(?:ephone)?(?:\.|\:|\s)+[\(\s]*(?:\+?\d[\d\s\(\)\-\.]{7,20})',
-            
-            # Parantezli ve tireyle ayrılmış formatlar (özellikle akademik makalelerde yaygın)
-            r'\(?\d{2,3}\)?[\s\-\.]+\d{2,4}[\s\-\.]+\d{2,4}[\s\-\.]+\d{2,4}'
-        ]
-        
-        for pattern in phone_patterns:
-            matches = re.findall(pattern, text)
-            for phone in matches:
-                phone_key = (phone, context)
-                # Temel güven skoru başlat
-                score = 1.0
-                
-                # Context-aware scoring (bağlam kontrolü) - anahtar kelimeler içeriyor mu?
-                phone_context = get_context_window(text, phone, window_size=50)
-                
-                # Telefon içeren bir metnin önünde/arkasında telefon göstergeleri var mı?
-                phone_indicators = ['phone', 'tel', 'telefon', 'iletişim', 'contact', 'call', 'telephone', 'number', 'numara']
-                for indicator in phone_indicators:
-                    if indicator.lower() in phone_context.lower():
-                        score += 0.5
-                        break
-                
-                # "phone:" veya "tel:" ile başlayan formatlar genellikle kesin telefon numaralarıdır
-                if re.search(r'(?:phone|tel)(?:ephone)?(?:\.|\:|\s)+', phone_context, re.IGNORECASE):
-                    score += 1.0
-                    
-                # Parantez içeren formatlar için ek güven
-                if '(' in phone or ')' in phone:
-                    score += 0.5
-                
-                candidates[entity_type][phone_key] = max(candidates[entity_type].get(phone_key, 0), score)
-        
-        # E-posta adresleri
-        email_matches = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b', text)
-        for email in email_matches:
-            email_key = (email, context)
-            candidates[entity_type][email_key] = max(candidates[entity_type].get(email_key, 0), 2.0)  # E-postalar oldukça belirgin
-            
-        # ORCID format - iD
-        orcid_matches = re.findall(r'ORCID(?:\:|\s)+(?:https?\:\/\/orcid\.org\/)?(\d{4}\-\d{4}\-\d{4}\-\d{4})', text, re.IGNORECASE)
-        for orcid in orcid_matches:
-            orcid_formatted = f"ORCID: {orcid}"
-            orcid_key = (orcid_formatted, context)
-            candidates[entity_type][orcid_key] = max(candidates[entity_type].get(orcid_key, 0), 2.0)
+        for value, start, end, score in iter_contact_matches(document):
+            contact_key = (value, context)
+            candidates[entity_type][contact_key] = max(candidates[entity_type].get(contact_key, 0), score)
     
     # Kurum bilgileri için regex kalıpları
     elif entity_type == 'institution_info':
-        # Üniversiteler ve kurumlar için yaygın kalıplar
-        institution_patterns = [
-            # Department, School, Faculty, Institute
-            r'(?:Department|Dept|School|Faculty|Institute)\s+of\s+[A-Z][^,;\n\d]{5,50}',
-            
-            # University, College
-            r'[A-Z][a-zA-Z\-]+(?:\s+[A-Z][a-zA-Z\-]+){1,8}\s+(?:University|College|Institute|School)',
-            r'(?:University|College|Institute|School)\s+of\s+[A-Z][^,;\n\d]{5,50}',
-            
-            # Labs, Centers, etc.
-            r'[A-Z][a-zA-Z\-]+(?:\s+[A-Z][a-zA-Z\-]+){1,8}\s+(?:Lab(?:orator(?:y|ies))?|Center|Centre|Foundation)',
-            
-            # Address blocks (especially for academic papers)
-            r'[A-Z][a-zA-Z\-]+(?:,|\s+)\s*[A-Z][a-zA-Z\s]{10,100}(?:,|\s+)(?:[A-Z]{2,3}|\d{5})'
-        ]
-        
-        for pattern in institution_patterns:
-            matches = re.findall(pattern, text)
-            for institution in matches:
+        # Önce yerel kurum sözlüğü - tek doğrusal tarama; puan eşleşmenin geçtiği bölgeye göre verilir
+        gazetteer_matches = find_institutions(document)
+        gazetteer_spans = []
+        for match in gazetteer_matches:
+            score, _ = score_gazetteer_match(document, match, context)
+            if score:
+                institution_key = (match.text, context)
+                candidates[entity_type][institution_key] = max(candidates[entity_type].get(institution_key, 0), score)
+            if score >= CANDIDATE_MIN_SCORE:
+                gazetteer_spans.append((match.start, match.end))
+        if gazetteer_matches:
+            logging.info(f"Kurum sözlüğü eşleşmeleri ({context}): {sorted({m.text for m in gazetteer_matches})}")
+
+        # Üniversiteler ve kurumlar için yaygın kalıplar (sözlük eşleşmelerinden bağımsız olarak her zaman taranır).
+        # Yalnızca tutulacak puandaki bir sözlük eşleşmesiyle çakışan kalıp eşleşmeleri atlanır; zayıf sözlük
+        # eşleşmelerinde kalıp puanı geçerli olur (aynı metin için büyük olan puan kalır)
+        for pattern in INSTITUTION_RES:
+            for match in pattern.finditer(text):
+                if any(start < match.end() and match.start() < end for start, end in gazetteer_spans):
+                    continue
+                institution = match.group()
                 # 100 karakterden uzun kurumları atla - muhtemelen yanlış tespitlerdir
                 if len(institution) > 100:
                     continue
@@ -497,7 +799,7 @@ def extract_regex_entities_for_type(text, candidates, entity_type, context, firs
                 score = 1.0
                 
                 # Bağlam kontrolü - anahtar kelimeler içeriyor mu?
-                inst_context = get_context_window(text, institution, window_size=100)
+                inst_context = get_context_window(document, institution, window_size=100)
                 inst_indicators = ['university', 'college', 'department', 'faculty', 'school', 'institute', 
                                   'laboratory', 'center', 'centre', 'üniversite', 'fakülte', 'bölüm', 'enstitü']
                 
@@ -507,69 +809,215 @@ def extract_regex_entities_for_type(text, candidates, entity_type, context, firs
                         break
                 
                 # Affiliation, address gibi anahtar kelimelere yakınsa
-                if re.search(r'(?:affiliation|address|department|kurum|adres)', inst_context, re.IGNORECASE):
+                if INSTITUTION_CONTEXT_RE.search(inst_context):
                     score += 0.5
                 
                 candidates[entity_type][institution_key] = max(candidates[entity_type].get(institution_key, 0), score)
 
 
-def boost_entities_in_author_contexts(text, candidates, options, context, first_page):
-    """Boost confidence scores for entities appearing near author context phrases"""
-    # Define context phrases that indicate author information
-    author_context_phrases = [
-        r"(?i)corresponding author",
-        r"(?i)author(s)?[:]?",
-        r"(?i)prepared by",
-        r"(?i)written by",
-        r"(?i)submitted by",
-        r"(?i)affiliation",
-        r"(?i)department of",
-        r"(?i)faculty of",
-        r"(?i)university of",
-        r"(?i)institute of",
-        r"(?i)contact[:]?",
-        r"(?i)e-?mail[:]?"
-    ]
+def is_author_block_offset(document, offset):
+    """Konum ilk sayfadaki yazar/kurum bloğunda mı (ilk özet, anahtar kelimeler veya giriş başlığından önce)"""
+    def find_block_end(text):
+        match = AUTHOR_BLOCK_END_RE.search(text)
+        return match.start() if match else len(text)
+
+    return offset < document.derived("author_block_end", find_block_end)
+
+
+def score_gazetteer_match(document, match, context):
+    """
+    Kurum sözlüğü eşleşmesinin güven puanı.
+    Başlıkta, ilk sayfadaki yazar bloğunda veya kurum/adres satırında geçen eşleşmeler güçlü
+    aday sayılır; gövde metnindeki geçişler ("Google Research", "MIT") diğer zayıf adaylar gibi
+    yalnızca bağlam penceresine göre puanlanır. Tireyle bağlanmış bileşik adların parçası olan
+    eşleşmeler ("MIT-BIH") atlanır.
+
+    Args:
+        document (IndexedDocument): Eşleşmenin bulunduğu belge
+        match (GazetteerMatch): find_institutions eşleşmesi
+        context (str): Metin bağlamı (header, first_page, main_content...)
+
+    Returns:
+        tuple: (puan, güçlü mü) - atlanan eşleşmeler için (0.0, False)
+    """
+    text = document.text
+    if (match.end + 1 < len(text) and text[match.end] == '-' and text[match.end + 1].isalnum()) or \
+            (match.start >= 2 and text[match.start - 1] == '-' and text[match.start - 2].isalnum()):
+        return 0.0, False
+
+    line_start = text.rfind('\n', 0, match.start) + 1
+    line_end = text.find('\n', match.end)
+    line = text[line_start:line_end if line_end != -1 else len(text)]
+    if context == 'header' or INSTITUTION_CONTEXT_RE.search(line) or \
+            (context == 'first_page' and is_author_block_offset(document, match.start)):
+        return 3.0, True
+
+    score = 0.5
+    if INSTITUTION_CONTEXT_RE.search(document.window(match.start, match.end, 100)):
+        score += 0.5
+    return score, False
+
+
+def score_phone_match(phone, phone_context):
+    """Telefon numarası eşleşmesinin güven puanı (bağlam penceresindeki göstergelere göre)"""
+    # Temel güven skoru başlat
+    score = 1.0
     
-    # Find locations of context phrases
-    context_locations = []
-    for phrase in author_context_phrases:
-        for match in re.finditer(phrase, text):
-            start, end = match.span()
-            context_locations.append((start, end, match.group()))
+    # Telefon içeren bir metnin önünde/arkasında telefon göstergeleri var mı?
+    lowered_context = phone_context.lower()
+    if any(indicator in lowered_context for indicator in PHONE_INDICATORS):
+        score += 0.5
     
-    # If no context phrases found, return
-    if not context_locations:
-        return
+    # "phone:" veya "tel:" ile başlayan formatlar genellikle kesin telefon numaralarıdır
+    if PHONE_LABEL_RE.search(phone_context):
+        score += 1.0
+    
+    # Parantez içeren formatlar için ek güven
+    if '(' in phone or ')' in phone:
+        score += 0.5
+    
+    return score
+
+
+def iter_contact_matches(document):
+    """
+    Belgedeki telefon, e-posta ve ORCID eşleşmeleri.
+    
+    Telefon puanı, numaranın belgedeki ilk geçişinin çevresindeki 50 karakterlik bağlamdan hesaplanır.
+    
+    Yields:
+        tuple: (aday metni, başlangıç, bitiş, puan)
+    """
+    document = IndexedDocument.wrap(document)
+    text = document.text
+    
+    # Telefon numaraları için regex kalıpları
+    for pattern in PHONE_RES:
+        for match in pattern.finditer(text):
+            phone = match.group(0)
+            yield phone, match.start(), match.end(), score_phone_match(phone, get_context_window(document, phone, window_size=50))
+    
+    # E-posta adresleri - oldukça belirgin
+    for match in EMAIL_RE.finditer(text):
+        yield match.group(0), match.start(), match.end(), 2.0
+    
+    # ORCID format - iD
+    for match in ORCID_RE.finditer(text):
+        yield f"ORCID: {match.group(1)}", match.start(), match.end(), 2.0
+
+
+def locate_region_spans(document, region_text):
+    """
+    Bir bölge metninin (ilk sayfa, başlık bölümleri) ana içerikte kapladığı aralıkları bul.
+    
+    Bölge metni ana içeriğin bir alt metniyse tek aralık döner. Değilse (ör. başlık bölümleri ilk
+    sayfadan seçilmiş satır pencerelerinin birleşimidir, hariç tutulan bölümlere düşen satırlar ana
+    içerikte yoktur) satırlar sırayla ana içerikte aranır; art arda gelen satırlar tek aralıkta
+    birleştirilir, ana içerikte bulunmayan satırlar ayrıca döndürülür.
     
-    # For each context location, find nearby entities and boost their scores
-    for start, end, phrase in context_locations:
-        # Consider text within a window of the context phrase
-        window_size = 200  # Characters before/after the phrase
-        window_start = max(0, start - window_size)
-        window_end = min(len(text), end + window_size)
-        context_window = text[window_start:window_end]
+    Args:
+        document (IndexedDocument): Ana içerik
+        region_text (str): Bölge metni
         
-        # Boost scores for entities in this window
-        for entity_type in candidates:
-            if entity_type in options:
-                boosted_keys = []
-                
-                for (entity, ent_context), score in candidates[entity_type].items():
-                    # If entity is in this context window, boost its score
-                    if entity in context_window:
-                        boost = 1.0
-                        
-                        # Higher boost for closer phrases
-                        if phrase.lower() in ["corresponding author", "author:", "authors:"]:
-                            boost = 2.0
-                        
-                        boosted_keys.append((entity, ent_context))
-                        candidates[entity_type][(entity, ent_context)] = score + boost
-                
-                # Log boosted entities
-                if boosted_keys and len(boosted_keys) < 5:  # Avoid excessive logging
-                    logging.info(f"Boosted {entity_type} scores for entities near '{phrase}': {[k[0] for k in boosted_keys]}")
+    Returns:
+        tuple: ([(başlangıç, bitiş)] aralıkları, ana içerikte bulunmayan satırlardan oluşan metin)
+    """
+    if not region_text:
+        return [], ""
+    
+    position = document.find(region_text)
+    if position != -1:
+        return [(position, position + len(region_text))], ""
+    
+    text = document.text
+    spans = []
+    missing_lines = []
+    cursor = 0
+    for line in region_text.split('\n'):
+        if not line.strip():
+            continue
+        start = text.find(line, cursor)
+        if start == -1:
+            start = text.find(line)
+        if start == -1:
+            missing_lines.append(line)
+            continue
+        end = start + len(line)
+        # Aradaki tek satır sonu dahil bitişik satırları birleştir
+        if spans and spans[-1][1] <= start <= spans[-1][1] + 1:
+            spans[-1] = (spans[-1][0], max(spans[-1][1], end))
+        else:
+            spans.append((start, end))
+        cursor = end
+    
+    return spans, "\n".join(missing_lines)
+
+
+def extract_contact_entities(documents, candidates):
+    """
+    İletişim bilgisi adaylarını (telefon, e-posta, ORCID) üç bölge için tek taramada topla.
+    
+    Başlık bölümleri ve ilk sayfa, ana içerikle aynı karakterleri içerir; kalıpları her bölgede
+    ayrı ayrı çalıştırmak yerine ana içerik bir kez taranır. Her eşleşme "main_content" bağlamıyla,
+    ayrıca ana içerikteki konumu başlık/ilk sayfa aralıklarından birinin içindeyse o bölgenin
+    bağlamıyla da eklenir. Bölgelerin ana içerikte bulunmayan satırları (ör. hariç tutulan
+    bölümlere düşen ilk sayfa satırları) yalnızca o bölge için ayrıca taranır.
+    
+    Args:
+        documents (dict): {"header", "first_page", "main_content"} -> IndexedDocument
+        candidates (dict): {"contact_info": {(varlık, bağlam): puan}} - yerinde güncellenir
+    """
+    contact_candidates = candidates['contact_info']
+    
+    def add(value, context, score):
+        key = (value, context)
+        contact_candidates[key] = max(contact_candidates.get(key, 0), score)
+    
+    main_document = documents["main_content"]
+    
+    region_spans = []
+    residual_documents = []
+    for region in CONTACT_REGIONS:
+        region_document = documents.get(region)
+        if not region_document:
+            continue
+        spans, missing_text = locate_region_spans(main_document, region_document.text)
+        region_spans.extend((start, end, region) for start, end in spans)
+        if missing_text:
+            residual_documents.append((region, IndexedDocument(missing_text)))
+    
+    spans_index = IntervalIndex((start, end) for start, end, _ in region_spans)
+    for value, start, end, score in iter_contact_matches(main_document):
+        add(value, "main_content", score)
+        for span_id in spans_index.containing(start, end):
+            add(value, region_spans[span_id][2], score)
+    
+    for region, residual_document in residual_documents:
+        for value, _, _, score in iter_contact_matches(residual_document):
+            add(value, region, score)
+
+
+def boost_entities_in_author_contexts(document, candidates, options, context, first_page):
+    """Boost confidence scores for entities appearing near author context phrases"""
+    for entity_type in candidates:
+        if entity_type not in options or not candidates[entity_type]:
+            continue
+        
+        # Tüm adaylar için pencere artışlarını tek vektörel geçişte hesapla
+        keys = list(candidates[entity_type].keys())
+        entity_texts = list(dict.fromkeys(entity for entity, _ in keys))
+        boosts = dict(zip(entity_texts, author_context_boosts(document, entity_texts)))
+        
+        boosted_keys = []
+        for key in keys:
+            boost = boosts[key[0]]
+            if boost > 0:
+                candidates[entity_type][key] += boost
+                boosted_keys.append(key)
+        
+        # Log boosted entities
+        if boosted_keys and len(boosted_keys) < 5:  # Avoid excessive logging
+            logging.info(f"Boosted {entity_type} scores for entities near author context: {[k[0] for k in boosted_keys]}")
 
 
 def is_valid_person_name(name):
@@ -644,13 +1092,13 @@ def is_common_word(text):
     return text.lower() in common_words
 
 
-def get_context_window(text, target, window_size=50):
+def get_context_window(document, target, window_size=50):
     """
     Bir metin içindeki hedef metinle ilgili bağlamsal pencereyi döndürür.
     Bu, varlıkların puanlanmasında bağlam ipuçlarını toplamak için kullanılır.
     
     Args:
-        text (str): Tüm metin
+        document (IndexedDocument): Tüm metin (düz metin de kabul edilir)
         target (str): Bağlamı alınacak hedef metin
         window_size (int): Hedefin önünde ve arkasında alınacak karakter sayısı
         
@@ -658,32 +1106,25 @@ def get_context_window(text, target, window_size=50):
         str: Hedefin çevresindeki bağlam metni
     """
     try:
-        target_pos = text.find(target)
-        if target_pos == -1:
-            return ""
-            
-        start_pos = max(0, target_pos - window_size)
-        end_pos = min(len(text), target_pos + len(target) + window_size)
-        
-        return text[start_pos:end_pos]
+        return IndexedDocument.wrap(document).context_window(target, window_size)
     except:
         return ""
 
 
-def get_confidence_score(entity_text, context_text, window_size=100):
+def get_confidence_score(entity_text, context_document, window_size=100):
     """
     Bir varlığın (kişi, kurum, iletişim bilgisi vs.) güven skorunu hesaplar.
     Daha yüksek skorlar daha güvenilir tespitleri gösterir.
     
     Args:
         entity_text (str): Tespit edilen varlık metni
-        context_text (str): Varlığın geçtiği metin bağlamı
+        context_document (IndexedDocument): Varlığın geçtiği metin bağlamı
         window_size (int): Varlık etrafındaki bağlam penceresi boyutu
         
     Returns:
         float: 0 ile 5 arasında bir güven skoru (5 en yüksek güven)
     """
-    if not entity_text or not context_text:
+    if not entity_text or not context_document:
         return 0.0
     
     # Temel güven skoru
@@ -697,7 +1138,7 @@ def get_confidence_score(entity_text, context_text, window_size=100):
         score += 0.3  # Daha uzun isimler genellikle daha ayırt edicidir
     
     # 2. İsmin geçtiği bağlam penceresini al
-    context_window = get_context_window(context_text, entity_text, window_size)
+    context_window = get_context_window(context_document, entity_text, window_size)
     
     # 3. Bağlam ipuçlarını kontrol et
     context_indicators = {
@@ -765,8 +1206,15 @@ def get_confidence_score(entity_text, context_text, window_size=100):
     return min(5.0, max(0.0, score))
 
 
-def normalize_and_filter_entities(entities, main_text, excluded_text):
-    """Final filtering and normalization of detected entities"""
+def normalize_and_filter_entities(entities, main_document, excluded_text):
+    """
+    Final filtering and normalization of detected entities
+    main_document: Ana içeriğin IndexedDocument'ı - INDEX TERMS/KEYWORDS satırları ve başlık
+                   pozisyonları belge oluşturulurken hesaplanmıştır
+    """
+    main_document = IndexedDocument.wrap(main_document)
+    main_text = main_document.text
+    keyword_line_set = main_document.keyword_line_numbers
     # Tam eşleşme garantilemek için büyük/küçük harf duyarlı sözlük
     normalized_entities = {
         "author_name": set(),
@@ -774,21 +1222,10 @@ def normalize_and_filter_entities(entities, main_text, excluded_text):
         "institution_info": set()
     }
     
-    # INDEX TERMS veya KEYWORDS içeren satırları belirle
-    index_terms_lines = []
-    keywords_lines = []
-    
-    # Metni satırlara böl
-    lines = main_text.split('\n')
-    
-    # INDEX TERMS veya KEYWORDS içeren satırları bul
-    for i, line in enumerate(lines):
-        if re.search(r'INDEX\s+TERMS', line, re.IGNORECASE):
-            # Bu satırı ve sonraki iki satırı kaydet
-            index_terms_lines.extend([i, i+1, i+2, i+3])
-        elif re.search(r'KEYWORDS', line, re.IGNORECASE):
-            # Bu satırı ve sonraki iki satırı kaydet
-            keywords_lines.extend([i, i+1, i+2, i+3])
+    # Tüm aday değerlerin ana ve hariç tutulan metindeki geçişlerini tek geçişte bul
+    candidate_index = StringIndex(value for values in entities.values() for value in values if value and len(value) >= 2)
+    main_occurrences = candidate_index.find_all(main_text)
+    excluded_occurrences = candidate_index.find_all(excluded_text) if excluded_text else {}
     
     # Her kategori için normalleştirme ve tam eşleşme sağla
     for key, values in entities.items():
@@ -798,34 +1235,42 @@ def normalize_and_filter_entities(entities, main_text, excluded_text):
                 continue
                 
             # Hariç tutulan metinlerde geçiyorsa atla
-            if excluded_text and value in excluded_text:
+            if value in excluded_occurrences:
                 logging.info(f"Hariç tutulan metinde olduğu için atlandı: {value}")
                 continue
             
+            positions = main_occurrences.get(value, [])
+            
             # INDEX TERMS veya KEYWORDS bölümlerinde geçiyor mu kontrol et
-            # 1. Tam satır eşleşmesi: Değerin geçtiği satırları bul
+            # 1. Tam satır eşleşmesi: Değerin geçtiği satırlardan biri bu satırlardan mı?
             in_index_terms_or_keywords = False
             
-            for line_index in list(set(index_terms_lines + keywords_lines)):
-                if line_index < len(lines) and value in lines[line_index]:
-                    in_index_terms_or_keywords = True
-                    logging.info(f"INDEX TERMS/KEYWORDS satırında olduğu için atlandı: {value}")
-                    break
+            if keyword_line_set and '\n' not in value:
+                for position in positions:
+                    if main_document.line_of(position) in keyword_line_set:
+                        in_index_terms_or_keywords = True
+                        logging.info(f"INDEX TERMS/KEYWORDS satırında olduğu için atlandı: {value}")
+                        break
             
             if in_index_terms_or_keywords:
                 continue
                 
             # 2. Bağlam penceresi kontrolü
-            text_pos = main_text.find(value)
-            if text_pos > -1:
-                # Öncesindeki ve sonrasındaki metni kontrol et (geniş pencere)
-                surrounding_text = main_text[max(0, text_pos - 200):min(len(main_text), text_pos + len(value) + 200)]
+            if positions:
+                text_pos = positions[0]
+                window_start = max(0, text_pos - 200)
+                window_end = min(len(main_text), text_pos + len(value) + 200)
                 
-                # Kelimenin INDEX TERMS veya KEYWORDS bölümünde geçip geçmediğini kontrol et
-                if re.search(r'INDEX\s+TERMS[\s\:\-]*.*' + re.escape(value), surrounding_text, re.IGNORECASE | re.DOTALL) or \
-                   re.search(r'KEYWORDS[\s\:\-]*.*' + re.escape(value), surrounding_text, re.IGNORECASE | re.DOTALL):
-                    logging.info(f"INDEX TERMS/KEYWORDS bölüm bağlamında olduğu için atlandı: {value}")
-                    continue
+                # Pencerede INDEX TERMS / KEYWORDS başlığı varsa
+                if main_document.has_keyword_header_between(window_start, window_end):
+                    # Öncesindeki ve sonrasındaki metni kontrol et (geniş pencere)
+                    surrounding_text = main_text[window_start:window_end]
+                    
+                    # Kelimenin INDEX TERMS veya KEYWORDS bölümünde geçip geçmediğini kontrol et
+                    if re.search(r'INDEX\s+TERMS[\s\:\-]*.*' + re.escape(value), surrounding_text, re.IGNORECASE | re.DOTALL) or \
+                       re.search(r'KEYWORDS[\s\:\-]*.*' + re.escape(value), surrounding_text, re.IGNORECASE | re.DOTALL):
+                        logging.info(f"INDEX TERMS/KEYWORDS bölüm bağlamında olduğu için atlandı: {value}")
+                        continue
             
             # Bilimsel terimler listesinde var mı kontrol et (kısaltmalar için)
             if key == "author_name" and value.upper() in ['CNN', 'RNN', 'LSTM', 'GRU', 'DNN', 'SVM', 'PCA', 'LDA', 
@@ -838,7 +1283,7 @@ def normalize_and_filter_entities(entities, main_text, excluded_text):
             full_match = value
             
             # Metin içinde tamamen eşleşiyor mu?
-            if full_match in main_text:
+            if positions:
                 normalized_entities[key].add(full_match)
     
     # Set'ten listeye dönüştür ve sırala
@@ -859,11 +1304,12 @@ def log_entity_stats(entities):
             logging.info(f"Examples: {', '.join(sample)}")
 
 
-def extract_academic_header_entities(text, candidates, options, context):
+def extract_academic_header_entities(document, candidates, options, context):
     """
     Akademik makale başlıklarında yaygın olan yazar, iletişim ve kurum bilgilerini inceleyen
     özel bir fonksiyon. Tipik olarak konferans makalelerinin ilk sayfasındaki yapılandırılmış bilgileri hedefler.
     """
+    text = document.text
     # Konferans makaleleri tipik olarak şu formatta olur:
     # - Konferans adı ve tarihi
     # - Makale başlığı
@@ -882,31 +1328,11 @@ def extract_academic_header_entities(text, candidates, options, context):
     
     # IEEE formatı için özel tespit
     if 'author_name' in options:
-        # IEEE formatındaki yazar isimleri, örn: "Jane Doe, Member, IEEE"
-        ieee_author_patterns = [
-            # "Name, Title, IEEE" formatı
-            r"([A-Z][a-zÀ-ÿ]+(?:\s+[A-Z][a-zÀ-ÿ]+){1,3})\s*,\s*(?:Member|Senior Member|Fellow|Student Member|Graduate Student Member)\s*,\s*IEEE",
-            
-            # Birden fazla yazarı virgülle ayıran satırlar (IEEE üyelik bilgisi içeren)
-            r"([A-Z][a-zÀ-ÿ]+(?:\s+[A-Z][a-zÀ-ÿ]+){1,3}),\s*([A-Z][a-zÀ-ÿ]+(?:\s+[A-Z][a-zÀ-ÿ]+){1,3}),\s*(?:Member|Senior Member|Fellow|Student Member|Graduate Student Member),\s*IEEE",
-            
-            # IEEE üyelik bilgisi sonraki satırda olan yazarlar
-            r"([A-Z][a-zÀ-ÿ]+(?:\s+[A-Z][a-zÀ-ÿ]+){1,3})(?:\n|\r\n?)\s*(?:Member|Senior Member|Fellow|Student Member|Graduate Student Member),\s*IEEE",
-            
-            # Virgülle ayrılmış yazar listesi
-            r"([A-Z][a-zÀ-ÿ]+(?:[ -][A-Z][a-zÀ-ÿ]+){1,3}),\s*([A-Z][a-zÀ-ÿ]+(?:[ -][A-Z][a-zÀ-ÿ]+){1,3})",
-            
-            # Birden fazla yazarı virgülle ayıran satırlar (genel)
-            r"([A-Z][a-zÀ-ÿ]+(?:\s+[A-Z][a-zÀ-ÿ]+){1,3}),\s*([A-Z][a-zÀ-ÿ]+(?:\s+[A-Z][a-zÀ-ÿ]+){1,3}),\s*([A-Z][a-zÀ-ÿ]+(?:\s+[A-Z][a-zÀ-ÿ]+){1,3})",
-            
-            # "AND" veya "ve" ile bağlanan yazarlar
-            r"([A-Z][a-zÀ-ÿ]+(?:\s+[A-Z][a-zÀ-ÿ]+){1,3})\s+(?:AND|Ve|and)\s+([A-Z][a-zÀ-ÿ]+(?:\s+[A-Z][a-zÀ-ÿ]+){1,3})"
-        ]
-        
+        # IEEE formatındaki yazar isimleri, örn: "Jane Doe, Member, IEEE" (kalıplar: IEEE_AUTHOR_LIST_RES)
         # Önce temizlenmiş metinde, sonra orijinal metinde ara
         for search_text in [cleaned_text, text]:
-            for pattern in ieee_author_patterns:
-                ieee_matches = re.finditer(pattern, search_text)
+            for pattern in IEEE_AUTHOR_LIST_RES:
+                ieee_matches = pattern.finditer(search_text)
                 for match in ieee_matches:
                     # Tüm eşleşen grupları al - birden fazla yazar olabilir
                     name_groups = [g for g in match.groups() if g]
@@ -1047,7 +1473,22 @@ def extract_academic_header_entities(text, candidates, options, context):
     
     # Kurum bilgilerinin tespit edilmesi ve güçlendirilmesi
     if 'institution_info' in options:
-        # Akademik makale için tipik kurum/adres formatları
+        # Yazar bloğundaki veya kurum satırındaki sözlük eşleşmeleri ve geçtikleri satırlar
+        for match in find_institutions(document):
+            if not score_gazetteer_match(document, match, context)[1]:
+                continue
+            key = (match.text, context)
+            candidates['institution_info'][key] = max(candidates['institution_info'].get(key, 0), 4.5)
+
+            line_start = text.rfind('\n', 0, match.start) + 1
+            line_end = text.find('\n', match.end)
+            full_line = text[line_start:line_end if line_end != -1 else len(text)].strip()
+            if len(full_line) > len(match.text):
+                full_key = (full_line, context)
+                candidates['institution_info'][full_key] = max(candidates['institution_info'].get(full_key, 0), 4.5)
+                logging.info(f"Sözlükteki kurumun satırı tespit edildi: {full_line}")
+
+        # Akademik makale için tipik kurum/adres formatları (sözlük eşleşmelerinden bağımsız)
         institution_patterns = [
             # Kurum adı + şehir/adres
             r"([A-Z][a-zA-Z\s&,.'-]+(?:University|College|Institute|School|Laboratory|Department))(?:\s*,\s*|\s+at\s+)([A-Z][a-zA-Z\s,]+)",
@@ -1100,41 +1541,6 @@ def extract_academic_header_entities(text, candidates, options, context):
                         candidates['institution_info'][key] = max(candidates['institution_info'].get(key, 0), score)
                         logging.info(f"Kurum/adres bileşeni tespit edildi: {institution}")
         
-        # İlave özel durum: "Indian Institute of Information Technology" gibi belirli kalıplar
-        special_institutions = [
-            "Indian Institute of Information Technology",
-            "Indian Institute of Technology",
-            "All India Institute of Medical Sciences"
-        ]
-        
-        for special_inst in special_institutions:
-            if special_inst in text:
-                # İlgili satırı bul
-                pattern = fr"({re.escape(special_inst)}[A-Za-z\s,]*)"
-                matches = re.finditer(pattern, text)
-                
-                for match in matches:
-                    institution = match.group(1).strip()
-                    if len(institution) > len(special_inst):  # Daha fazla bilgi içeriyorsa
-                        score = 4.5  # Çok yüksek güven puanı
-                        key = (institution, context)
-                        candidates['institution_info'][key] = max(candidates['institution_info'].get(key, 0), score)
-                        
-                        # Tam satır içeriğini bulmak için çevresindeki metni incele
-                        start_pos = max(0, match.start() - 20)
-                        end_pos = min(len(text), match.end() + 150)
-                        surrounding_text = text[start_pos:end_pos]
-                        
-                        # Adres ve ilgili diğer bilgileri bulmak için satır sonlarını ara
-                        lines = re.split(r'[\n\r]+', surrounding_text)
-                        for line in lines:
-                            if institution in line and len(line.strip()) > len(institution):
-                                full_line = line.strip()
-                                full_key = (full_line, context)
-                                full_score = 4.5
-                                candidates['institution_info'][full_key] = max(candidates['institution_info'].get(full_key, 0), full_score)
-                                logging.info(f"Özel kurum satırı tespit edildi: {full_line}")
-        
         # Sayısal posta kodu içeren satırlar
         postal_code_pattern = r"([A-Za-z,\s]+)\s+(\d{5,6})(?:,\s*([A-Za-z]+))?"
         postal_matches = re.finditer(postal_code_pattern, text)
@@ -1183,16 +1589,18 @@ def extract_potential_person_names(text, min_score=0.1):
     """
     
     # NLP modeli kullanarak kişi isimleri çıkarılır
-    doc = nlp(text)
+    nlp = get_nlp()
+    doc = nlp(text) if nlp is not None else None
+    document = IndexedDocument(text)
     
     # İsimlerin güven skorları ile birlikte bir liste oluşturulur
     persons = []
     
     # Named Entity Recognition (NER) kullanarak isimleri buluyor
-    for ent in doc.ents:
+    for ent in (doc.ents if doc is not None else []):
         if ent.label_ == "PERSON":
             if is_valid_person_name(ent.text):
-                confidence = get_confidence_score(ent.text, text)
+                confidence = get_confidence_score(ent.text, document)
                 # Min skordan büyükse listeye ekle
                 if confidence >= min_score:
                     persons.append({"text": ent.text, "confidence": confidence})
@@ -1227,7 +1635,7 @@ def extract_potential_person_names(text, min_score=0.1):
             if is_valid_person_name(name):
                 # Daha önce eklenmiş mi kontrol et
                 if not any(p["text"] == name for p in persons):
-                    confidence = get_confidence_score(name, text)
+                    confidence = get_confidence_score(name, document)
                     # "Er." ünvanı varsa ek güven puanı ver
                     if name.startswith("Er.") or "Er. " in name:
                         confidence += 0.2  # Güven skorunu artır
@@ -0,0 +1,72 @@
+import os
+import sys
+
+# Proje kök dizinini path'e ekle
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+root_dir = os.path.dirname(parent_dir)
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+import fitz  # PyMuPDF
+
+# Kendi modüllerimizi import et
+from app.utils.entity_detector import detect_entities, get_biography_page_document
+from app.utils.indexed_document import IndexedDocument
+from app.utils.text_extractor import extract_text_from_pdf, section_text
+
+FIRST_PAGE = "Emotion Recognition From EEG Signals\nJohn Smith\nStanford University, Stanford, CA\n"
+
+
+def test_body_line_institution_without_context_is_kept():
+    """
+    Gövde metninde bir yazar adının altındaki satırda tek başına duran, yakınında kurum/adres
+    anahtar kelimesi olmayan sözlük kurumu (zayıf sözlük puanı) kalıp puanıyla tutulur
+    """
+    main_content = (
+        "The proposed model was trained for fifty epochs on the public recordings.\n"
+        "Ayse Yilmaz\n"
+        "Middle East Technical University\n"
+        "The remaining experiments follow the same protocol as the first study.\n"
+    )
+    entities = detect_entities(main_content, ["institution_info"], "", FIRST_PAGE, FIRST_PAGE)
+    assert any("Middle East Technical University" in entity for entity in entities["institution_info"])
+
+
+def test_body_acronym_mention_is_not_kept():
+    """Gövde metninde cümle içinde geçen kurum kısaltması maskelenmez"""
+    main_content = (
+        "We compare our results with the baseline released by MIT on the public recordings.\n"
+        "The remaining experiments follow the same protocol as the first study.\n"
+    )
+    entities = detect_entities(main_content, ["institution_info"], "", FIRST_PAGE, FIRST_PAGE)
+    assert "MIT" not in entities["institution_info"]
+
+
+
+def test_biography_page_found_before_references(tmp_path):
+    """
+    Referans başlığından sonraki sayfalar ana içeriğe metin katmasa da ofsetleri kaydedilir;
+    biyografi aşaması metni olan son ana içerik sayfasını kullanır
+    """
+    pages = [
+        "Emotion Recognition From EEG Signals\nJohn Smith\nI. INTRODUCTION\nWe study emotion recognition.\n",
+        "II. METHOD\nThe model uses convolutional and recurrent layers.\n",
+        "V. CONCLUSION\nThe approach works well.\nJOHN SMITH received the Ph.D. degree from Stanford University.\n",
+        "REFERENCES\n[1] A. Author, Some paper, 2020.\n[2] B. Author, Another paper, 2021.\n",
+        "[3] C. Author, Third paper, 2022.\n",
+    ]
+    pdf_path = str(tmp_path / "references.pdf")
+    with fitz.open() as doc:
+        for page_text in pages:
+            doc.new_page().insert_text((72, 72), page_text, fontsize=10)
+        doc.save(pdf_path)
+
+    extracted_text = extract_text_from_pdf(pdf_path)
+    main_content = section_text(extracted_text, "main_content")
+    page_offsets = extracted_text["page_offsets"]["main_content"]
+    assert page_offsets[-1][1] == len(main_content)
+
+    biography_document = get_biography_page_document(IndexedDocument(main_content, page_offsets))
+    assert biography_document is not None
+    assert "received the Ph.D. degree" in biography_document.text
@@ -0,0 +1,223 @@
+import os
+import re
+import logging
+
+# PyMuPDF (fitz) kütüphanesini import et
+try:
+    import fitz  # PyMuPDF
+    HAVE_PYMUPDF = True
+except ImportError:
+    HAVE_PYMUPDF = False
+    logging.warning("PyMuPDF (fitz) kütüphanesi yüklü değil. Metin çıkarımı pypdf ile yapılacak.")
+
+# pdfminer.six yalnızca yedek arka uç olarak kullanılır
+try:
+    from pdfminer.high_level import extract_text as pdfminer_extract_text
+    HAVE_PDFMINER = True
+except ImportError:
+    HAVE_PDFMINER = False
+    logging.warning("pdfminer.six kütüphanesi yüklü değil. pdfminer yedek metin çıkarımı kullanılamayacak.")
+
+# Metin çıkarımı ayarları - ortam değişkenleri ile yapılandırılabilir
+# Varsayılan arka uç: anonymize_pdf'in search_for ile aradığı metinle aynı dizeleri üretir
+EXTRACTION_BACKEND = os.environ.get('EXTRACTION_BACKEND', 'pymupdf')
+# Birincil arka ucun boş veya bozuk metin döndürdüğü sayfalarda sırayla denenen arka uçlar
+EXTRACTION_FALLBACK_BACKENDS = [
+    name.strip() for name in os.environ.get('EXTRACTION_FALLBACK_BACKENDS', 'pypdf,pdfminer').split(',') if name.strip()
+]
+# Bozuk karakterlerin (U+FFFD, (cid:N), özel kullanım alanı, kontrol karakterleri) boşluk dışı
+# karakterlere oranı bu değeri aşarsa sayfa metni bozuk sayılır
+EXTRACTION_GARBLED_RATIO = float(os.environ.get('EXTRACTION_GARBLED_RATIO', 0.1))
+# Harflerin boşluk dışı karakterlere oranı bu değerin altındaysa sayfa metni bozuk sayılır
+EXTRACTION_MIN_LETTER_RATIO = float(os.environ.get('EXTRACTION_MIN_LETTER_RATIO', 0.15))
+
+# Çıkarımı başarısız olmuş glifler: pdfminer (cid:N) çıktısı, yerine geçme karakteri,
+# özel kullanım alanı ve satır yapısı dışındaki kontrol karakterleri
+GARBLED_CHAR_RE = re.compile(r"\(cid:\d+\)|[\ufffd\ue000-\uf8ff\x00-\x08\x0e-\x1b]")
+
+
+def _pymupdf_page_text(parsed_pdf, page_num):
+    return parsed_pdf.fitz_doc[page_num].get_text()
+
+
+def _pypdf_page_text(parsed_pdf, page_num):
+    return parsed_pdf.reader.pages[page_num].extract_text()
+
+
+def _pdfminer_pages_text(parsed_pdf, page_nums):
+    # pdfminer her çağrıda dosyayı baştan ayrıştırır; sayfalar tek çağrıda çıkarılır ve
+    # her sayfanın sonuna eklenen form besleme karakterinden ayrılır
+    pages = pdfminer_extract_text(parsed_pdf.path, page_numbers=page_nums).split("\f")[:-1]
+    if len(pages) != len(page_nums):
+        raise ValueError(f"{len(page_nums)} sayfa istendi, {len(pages)} sayfa metni çıkarıldı")
+    return pages
+
+
+def _pdfminer_page_text(parsed_pdf, page_num):
+    return _pdfminer_pages_text(parsed_pdf, [page_num])[0]
+
+
+# Arka uç adı -> (sayfa metni fonksiyonu, kullanılabilir mi)
+EXTRACTION_BACKENDS = {
+    "pymupdf": (_pymupdf_page_text, HAVE_PYMUPDF),
+    "pypdf": (_pypdf_page_text, True),
+    "pdfminer": (_pdfminer_page_text, HAVE_PDFMINER),
+}
+
+# Birden fazla sayfayı tek çağrıda çıkarabilen arka uçlar -> (sayfa listesi metni fonksiyonu)
+EXTRACTION_BATCH_BACKENDS = {
+    "pdfminer": _pdfminer_pages_text,
+}
+
+
+def available_backends():
+    """Kurulu kütüphanelere göre kullanılabilen arka uç adları"""
+    return [name for name, (_, available) in EXTRACTION_BACKENDS.items() if available]
+
+
+def backend_order(primary=None, fallbacks=None):
+    """
+    Sayfa metni için denenecek arka uçlar: birincil arka uç ve ardından yedekler.
+    Kurulu olmayan veya bilinmeyen arka uçlar atlanır; birincil arka uç kullanılamıyorsa
+    ilk kullanılabilir yedek birincil olur.
+    """
+    primary = primary or EXTRACTION_BACKEND
+    fallbacks = EXTRACTION_FALLBACK_BACKENDS if fallbacks is None else fallbacks
+    order = []
+    for name in [primary] + list(fallbacks):
+        if name not in EXTRACTION_BACKENDS:
+            logging.warning(f"Bilinmeyen metin çıkarım arka ucu atlandı: {name}")
+        elif EXTRACTION_BACKENDS[name][1] and name not in order:
+            order.append(name)
+    return order
+
+
+def text_quality(text):
+    """
+    Sayfa metninin kalite puanı: bozuk olmayan harflerin boşluk dışı karakterlere oranı.
+
+    Returns:
+        tuple: (puan 0-1 arası, bozuk mu) - boş metin için (0.0, True)
+    """
+    visible = len(text) - sum(1 for char in text if char.isspace()) if text else 0
+    if not visible:
+        return 0.0, True
+
+    garbled = sum(len(match.group()) for match in GARBLED_CHAR_RE.finditer(text))
+    letters = sum(1 for char in text if char.isalpha())
+    garbled_ratio = garbled / visible
+    letter_ratio = letters / visible
+    is_garbled = garbled_ratio > EXTRACTION_GARBLED_RATIO or letter_ratio < EXTRACTION_MIN_LETTER_RATIO
+    return max(0.0, letter_ratio - garbled_ratio), is_garbled
+
+
+def extract_backend_page_text(parsed_pdf, page_num, backend):
+    """
+    Tek bir arka uçla sayfa metnini çıkar.
+
+    Returns:
+        str: Sayfa metni (arka uç hata verirse boş metin)
+    """
+    page_text_func = EXTRACTION_BACKENDS[backend][0]
+    try:
+        return page_text_func(parsed_pdf, page_num) or ""
+    except Exception as e:
+        logging.warning(f"{backend} ile sayfa {page_num + 1} metni çıkarılamadı: {str(e)}")
+        return ""
+
+
+def extract_backend_pages_text(parsed_pdf, page_nums, backend):
+    """
+    Tek bir arka uçla birden fazla sayfanın metnini çıkar (destekleyen arka uçlarda tek çağrıda).
+
+    Returns:
+        list: Sayfa metinleri, page_nums sırasıyla
+    """
+    pages_text_func = EXTRACTION_BATCH_BACKENDS.get(backend)
+    if pages_text_func is not None and len(page_nums) > 1:
+        try:
+            return [text or "" for text in pages_text_func(parsed_pdf, page_nums)]
+        except Exception as e:
+            logging.warning(f"{backend} ile {len(page_nums)} sayfa birlikte çıkarılamadı, sayfalar tek tek denenecek: {str(e)}")
+    return [extract_backend_page_text(parsed_pdf, page_num, backend) for page_num in page_nums]
+
+
+def has_text_spans(parsed_pdf, page_num):
+    """
+    Sayfada metin içeren bir span var mı (fitz get_text("dict") blokları)?
+    PyMuPDF yoksa veya sayfa okunamazsa True döner (sayfa boş kabul edilmez).
+    """
+    if parsed_pdf.fitz_doc is None:
+        return True
+    try:
+        blocks = parsed_pdf.page_blocks(page_num)
+    except Exception as e:
+        logging.warning(f"Sayfa {page_num + 1} blokları okunamadı: {str(e)}")
+        return True
+    return any(span.get("text", "").strip()
+               for block in blocks if block.get("type", 0) == 0
+               for line in block.get("lines", [])
+               for span in line.get("spans", []))
+
+
+def extract_pages_text(parsed_pdf, page_nums, order=None):
+    """
+    Sayfa metinlerini birincil arka uçla çıkar; metni boş veya bozuk olan sayfalar için yedek
+    arka uçları sırayla dene.
+
+    Birincil arka uç boş metin döndürdüğünde sayfada hiç metin span'ı yoksa (boş veya yalnızca
+    görsel içeren sayfa) yedekler denenmez. Yedek gereken sayfalar toplanır ve her yedek arka uç
+    bu sayfalar için bir kez çalıştırılır (pdfminer dosyayı tek sefer ayrıştırır). Hiçbir arka uç
+    düzgün metin vermezse kalite puanı en yüksek olan metin kullanılır.
+
+    Args:
+        parsed_pdf (ParsedPdf): Açık belgeler ve dosya yolu
+        page_nums (list): Sayfa numaraları (0 tabanlı)
+        order (list, optional): Denenecek arka uçlar (varsayılan: backend_order())
+
+    Returns:
+        list: (sayfa metni, kullanılan arka uç adı) çiftleri, page_nums sırasıyla
+    """
+    order = order or backend_order()
+    if not order:
+        return [("", None) for _ in page_nums]
+
+    results = {}
+    best = {}
+    pending = list(page_nums)
+    for backend in order:
+        texts = extract_backend_pages_text(parsed_pdf, pending, backend)
+        still_pending = []
+        for page_num, text in zip(pending, texts):
+            score, is_garbled = text_quality(text)
+            if not is_garbled:
+                if backend != order[0]:
+                    logging.info(f"Sayfa {page_num + 1} metni yedek arka uçla çıkarıldı: {backend}")
+                results[page_num] = (text, backend)
+                continue
+            if backend == order[0] and not text.strip() and not has_text_spans(parsed_pdf, page_num):
+                results[page_num] = (text, backend)
+                continue
+            if page_num not in best or score > best[page_num][2]:
+                best[page_num] = (text, backend, score)
+            still_pending.append(page_num)
+        pending = still_pending
+        if not pending:
+            break
+
+    for page_num in pending:
+        text, backend, _ = best[page_num]
+        if text.strip():
+            logging.warning(f"Sayfa {page_num + 1} için düzgün metin çıkarılamadı, en iyi sonuç kullanılıyor: {backend}")
+        results[page_num] = (text, backend)
+    return [results[page_num] for page_num in page_nums]
+
+
+def extract_page_text(parsed_pdf, page_num, order=None):
+    """
+    Tek bir sayfanın metni (bkz. extract_pages_text).
+
+    Returns:
+        tuple: (sayfa metni, kullanılan arka uç adı)
+    """
+    return extract_pages_text(parsed_pdf, [page_num], order)[0]
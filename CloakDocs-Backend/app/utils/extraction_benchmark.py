@@ -0,0 +1,131 @@
+import os
+import sys
+import time
+import argparse
+
+# Proje kök dizinini path'e ekle
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+root_dir = os.path.dirname(parent_dir)
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+# Kendi modüllerimizi import et
+from app.utils.pdf_document import ParsedPdf
+from app.utils.text_normalizer import normalize_entity
+from app.utils.extraction_backends import (
+    HAVE_PYMUPDF, available_backends, backend_order, extract_backend_pages_text, extract_pages_text, text_quality
+)
+
+# Eşleşme oranında kullanılan ifadelerin kelime sayısı
+PHRASE_WORDS = 3
+
+
+def sample_phrases(text, limit):
+    """
+    Sayfa metninden search_for ile aranacak ifadeleri seç: her satırdaki ardışık PHRASE_WORDS
+    kelimelik gruplar, sayfa boyunca eşit aralıklarla en fazla limit tane.
+    """
+    phrases = []
+    for line in text.split("\n"):
+        words = normalize_entity(line).split()
+        for i in range(0, len(words) - PHRASE_WORDS + 1, PHRASE_WORDS):
+            phrase = " ".join(words[i:i + PHRASE_WORDS])
+            if sum(1 for char in phrase if char.isalpha()) >= 6:
+                phrases.append(phrase)
+    if len(phrases) <= limit:
+        return phrases
+    step = len(phrases) / limit
+    return [phrases[int(i * step)] for i in range(limit)]
+
+
+def extract_with(pdf_path, backend):
+    """
+    Tüm sayfaları tek bir arka uçla ("auto" için sayfa bazlı yedekli arayüzle) çıkar.
+
+    Returns:
+        tuple: (sayfa metinleri, kullanılan arka uçlar)
+    """
+    with ParsedPdf(pdf_path) as parsed_pdf:
+        if backend == "auto":
+            results = extract_pages_text(parsed_pdf, list(range(len(parsed_pdf))), backend_order())
+            return [text for text, _ in results], [used for _, used in results]
+        texts = extract_backend_pages_text(parsed_pdf, list(range(len(parsed_pdf))), backend)
+        return texts, [backend] * len(texts)
+
+
+def match_rate(pdf_path, page_texts, sample):
+    """
+    Arka uç metninden seçilen ifadelerin PyMuPDF page.search_for ile bulunma oranı
+    (anonymize_pdf sansür konumlarını bu yolla bulur).
+
+    Returns:
+        tuple: (bulunan ifade sayısı, aranan ifade sayısı)
+    """
+    if not HAVE_PYMUPDF:
+        return 0, 0
+    found = total = 0
+    with ParsedPdf(pdf_path) as parsed_pdf:
+        doc = parsed_pdf.fitz_doc
+        for page_num, text in enumerate(page_texts):
+            for phrase in sample_phrases(text, sample):
+                total += 1
+                if doc[page_num].search_for(phrase):
+                    found += 1
+    return found, total
+
+
+def run_benchmark(pdf_path, repeat=3, sample=20, backends=None):
+    """
+    Metin çıkarım arka uçlarının hızını, boş/bozuk sayfa sayısını ve search_for eşleşme
+    oranını ölç ve yazdır.
+
+    Args:
+        pdf_path (str): PDF dosyası
+        repeat (int): Hız ölçümü için tekrar sayısı (en iyi süre raporlanır)
+        sample (int): Eşleşme oranı için sayfa başına aranan en fazla ifade sayısı
+        backends (list, optional): Ölçülecek arka uçlar (varsayılan: kurulu tüm arka uçlar ve "auto")
+    """
+    print(f"Dosya yükleniyor: {pdf_path}")
+
+    if not os.path.exists(pdf_path):
+        print(f"HATA: {pdf_path} dosyası bulunamadı!")
+        return False
+
+    backends = backends or available_backends() + ["auto"]
+    print(f"Arka uçlar: {', '.join(backends)} (auto sırası: {' > '.join(backend_order())}), tekrar: {repeat}")
+    print(f"{'Arka uç':<10}{'sayfa/sn':>10}{'karakter':>10}{'boş':>6}{'bozuk':>7}{'eşleşme':>10}  yedek kullanılan sayfalar")
+
+    for backend in backends:
+        best_time = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            page_texts, used = extract_with(pdf_path, backend)
+            elapsed = time.perf_counter() - started
+            best_time = elapsed if best_time is None else min(best_time, elapsed)
+
+        empty = sum(1 for text in page_texts if not text.strip())
+        garbled = sum(1 for text in page_texts if text.strip() and text_quality(text)[1])
+        found, total = match_rate(pdf_path, page_texts, sample)
+        rate = f"{found / total:.1%}" if total else "-"
+        pages_per_second = len(page_texts) / best_time if best_time else float("inf")
+        primary = backend_order()[0] if backend == "auto" else backend
+        fallback_pages = [page_num + 1 for page_num, name in enumerate(used) if name != primary]
+
+        print(f"{backend:<10}{pages_per_second:>10.1f}{sum(len(text) for text in page_texts):>10}{empty:>6}{garbled:>7}"
+              f"{rate:>10}  {fallback_pages if fallback_pages else ''}")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Metin çıkarım arka uçları kıyaslama aracı")
+    parser.add_argument("pdf_path", help="PDF dosyasının yolu")
+    parser.add_argument("--repeat", type=int, default=3, help="Hız ölçümü için tekrar sayısı (varsayılan: 3)")
+    parser.add_argument("--sample", type=int, default=20,
+                        help="Eşleşme oranı için sayfa başına aranan en fazla ifade (varsayılan: 20)")
+    parser.add_argument("--backend", action="append", dest="backends",
+                        help="Ölçülecek arka uç (pymupdf, pypdf, pdfminer, auto); birden fazla verilebilir")
+
+    args = parser.parse_args()
+
+    run_benchmark(args.pdf_path, args.repeat, args.sample, args.backends)
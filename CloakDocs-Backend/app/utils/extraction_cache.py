@@ -0,0 +1,277 @@
+import os
+import gzip
+import json
+import mmap
+import hashlib
+import logging
+import tempfile
+import threading
+from app.utils.pdf_document import ParsedPdf
+from app.utils.text_extractor import extract_text_from_pdf
+from app.utils.layout_classifier import extract_layout_blocks
+from app.utils.extraction_backends import backend_order
+from app.utils.detection_cache import file_digest
+
+# zstd sıkıştırması (yoksa gzip kullanılır)
+try:
+    import zstandard
+    HAVE_ZSTD = True
+except ImportError:
+    HAVE_ZSTD = False
+    logging.info("zstandard kütüphanesi yüklü değil. Metin çıkarımı önbelleği gzip ile sıkıştırılacak.")
+
+# Metin çıkarımı, bölüm ayrımı veya sayfa düzeni bloklarının biçimini etkileyen bir değişiklik
+# yapıldığında artırılmalıdır; eski kayıtlar bu sayede kullanılmaz ve zamanla silinir.
+EXTRACTOR_VERSION = "2"
+
+# Önbellek ayarları - ortam değişkenleri ile yapılandırılabilir
+EXTRACTION_CACHE_ENABLED = os.environ.get('EXTRACTION_CACHE_ENABLED', 'true').lower() == 'true'
+EXTRACTION_CACHE_DIR = os.environ.get(
+    'EXTRACTION_CACHE_DIR',
+    os.path.join(os.environ.get('UPLOAD_FOLDER', os.path.join(os.getcwd(), 'uploads')), '.cache', 'extraction')
+)
+EXTRACTION_CACHE_MAX_BYTES = int(os.environ.get('EXTRACTION_CACHE_MAX_BYTES', 512 * 1024 * 1024))
+EXTRACTION_CACHE_COMPRESSION = os.environ.get('EXTRACTION_CACHE_COMPRESSION', 'zstd' if HAVE_ZSTD else 'gzip')
+EXTRACTION_CACHE_LEVEL = int(os.environ.get('EXTRACTION_CACHE_LEVEL', 6))
+
+# Sıkıştırma biçimi -> dosya uzantısı
+CACHE_SUFFIXES = {"zstd": ".json.zst", "gzip": ".json.gz"}
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_extractor_version():
+    """
+    Önbellek anahtarına eklenen sürüm damgası.
+    Metin çıkarım arka uçlarının sırası da damgaya dahil edilir (farklı arka uç farklı metin üretir).
+    """
+    return f"{EXTRACTOR_VERSION}:{','.join(backend_order())}"
+
+
+def make_extraction_key(kind, digest):
+    """
+    İçerik adresli önbellek anahtarı oluştur.
+
+    Args:
+        kind (str): Kayıt türü ("text" veya "layout")
+        digest (str): PDF dosyasının SHA-256 özeti
+
+    Returns:
+        str: Dosya adı olarak kullanılabilen anahtar
+    """
+    return hashlib.sha256(f"{kind}|{digest}|{get_extractor_version()}".encode("utf-8")).hexdigest()
+
+
+def _compress(payload, compression):
+    if compression == "zstd":
+        return zstandard.ZstdCompressor(level=EXTRACTION_CACHE_LEVEL).compress(payload)
+    return gzip.compress(payload, compresslevel=EXTRACTION_CACHE_LEVEL)
+
+
+def _decompress(data, compression):
+    if compression == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+class ExtractionCache:
+    """
+    Sıkıştırılmış disk önbelleği: her kayıt zstd veya gzip ile sıkıştırılmış tek bir JSON
+    dosyasıdır. Dosyalar mmap ile açılıp doğrudan açılır (ayrı bir okuma tamponu kopyalanmaz);
+    toplam boyut sınırı aşıldığında en uzun süredir kullanılmayan (mtime) dosyalar silinir.
+    """
+
+    def __init__(self, cache_dir=EXTRACTION_CACHE_DIR, max_bytes=EXTRACTION_CACHE_MAX_BYTES,
+                 compression=EXTRACTION_CACHE_COMPRESSION):
+        if compression not in CACHE_SUFFIXES or (compression == "zstd" and not HAVE_ZSTD):
+            logging.warning(f"Desteklenmeyen önbellek sıkıştırması ({compression}), gzip kullanılacak")
+            compression = "gzip"
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.compression = compression
+        self._lock = threading.RLock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key, compression=None):
+        return os.path.join(self.cache_dir, f"{key}{CACHE_SUFFIXES[compression or self.compression]}")
+
+    def _is_entry(self, name):
+        return name.endswith(tuple(CACHE_SUFFIXES.values()))
+
+    def get(self, key):
+        """Kaydı döndür (yoksa None). Başka sıkıştırmayla yazılmış kayıtlar da okunur."""
+        for compression in [self.compression] + [c for c in CACHE_SUFFIXES if c != self.compression]:
+            if compression == "zstd" and not HAVE_ZSTD:
+                continue
+            path = self._path(key, compression)
+            try:
+                with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    value = json.loads(_decompress(mapped, compression))
+                # Son kullanım zamanını güncelle (LRU silme sırası için)
+                os.utime(path, None)
+                return value
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                logging.warning(f"Metin çıkarımı önbellek kaydı okunamadı, yok sayılıyor ({key}): {str(e)}")
+                return None
+        return None
+
+    def put(self, key, value):
+        """Kaydı sıkıştırarak yaz; disk yazımı atomiktir"""
+        try:
+            payload = _compress(json.dumps(value, ensure_ascii=False).encode("utf-8"), self.compression)
+        except (TypeError, ValueError) as e:
+            logging.warning(f"Metin çıkarımı önbellek kaydı serileştirilemedi ({key}): {str(e)}")
+            return
+
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, self._path(key))
+        except Exception as e:
+            logging.warning(f"Metin çıkarımı önbellek kaydı yazılamadı ({key}): {str(e)}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        self.evict()
+
+    def evict(self):
+        """Toplam disk boyutu sınırı aşıldıysa en uzun süredir kullanılmayan kayıtları sil"""
+        with self._lock:
+            entries = []
+            total = 0
+            for name in os.listdir(self.cache_dir):
+                if not self._is_entry(name):
+                    continue
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            if total <= self.max_bytes:
+                return
+
+            removed = 0
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                    removed += 1
+                except OSError:
+                    continue
+
+            logging.info(f"Metin çıkarımı önbelleğinden {removed} kayıt silindi (boyut sınırı: {self.max_bytes} bayt)")
+
+    def clear(self):
+        """Tüm kayıtları sil"""
+        with self._lock:
+            for name in os.listdir(self.cache_dir):
+                if self._is_entry(name):
+                    try:
+                        os.remove(os.path.join(self.cache_dir, name))
+                    except OSError:
+                        pass
+
+
+def get_extraction_cache():
+    """Süreç genelindeki önbelleği döndür (devre dışıysa veya oluşturulamazsa None)"""
+    global _cache
+
+    if not EXTRACTION_CACHE_ENABLED:
+        return None
+
+    with _cache_lock:
+        if _cache is None:
+            try:
+                _cache = ExtractionCache()
+            except Exception as e:
+                logging.error(f"Metin çıkarımı önbelleği oluşturulamadı ({EXTRACTION_CACHE_DIR}): {str(e)}")
+                return None
+        return _cache
+
+
+def compact_layout_pages(pages):
+    """
+    Sayfa düzeni bloklarını önbellek için küçült: yalnızca metin blokları ve sınıflandırmada
+    kullanılan alanlar (bbox, span metni, boyutu ve fontu) tutulur; görsel blokları atılır.
+    """
+    return [{
+        "page": page["page"],
+        "width": page["width"],
+        "height": page["height"],
+        "blocks": [{
+            "type": 0,
+            "bbox": list(block["bbox"]),
+            "lines": [{"spans": [{"text": span.get("text", ""), "size": span.get("size", 0), "font": span.get("font", "")}
+                                 for span in line.get("spans", [])]}
+                      for line in block["lines"]]
+        } for block in page["blocks"] if block.get("type", 0) == 0 and "lines" in block]
+    } for page in pages]
+
+
+def _resolve_digest(pdf, digest):
+    """PDF özeti verilmemişse dosyadan hesapla (hesaplanamazsa None)"""
+    if digest:
+        return digest
+    try:
+        return file_digest(pdf.path if isinstance(pdf, ParsedPdf) else pdf)
+    except Exception as e:
+        logging.warning(f"Dosya özeti hesaplanamadı, metin çıkarımı önbelleği kullanılmayacak: {str(e)}")
+        return None
+
+
+def _cached(kind, pdf, digest, build):
+    cache = get_extraction_cache()
+    digest = _resolve_digest(pdf, digest) if cache else None
+    if digest:
+        key = make_extraction_key(kind, digest)
+        value = cache.get(key)
+        if value is not None:
+            logging.info(f"Metin çıkarımı önbelleğinden alındı ({kind}): {digest[:12]}")
+            return value
+
+    value = build(pdf)
+    if digest:
+        cache.put(key, value)
+    return value
+
+
+def get_extracted_text(pdf, digest=None):
+    """
+    PDF'in metin çıkarımı sonucu (tam metin, bölüm aralıkları, sayfa ve bölüm ofsetleri).
+    Aynı içerikteki dosya için daha önce herhangi bir uç noktada çıkarılmışsa önbellekten
+    okunur ve PDF ayrıştırılmaz.
+
+    Args:
+        pdf (str | ParsedPdf): PDF dosya yolu veya istek boyunca paylaşılan ParsedPdf
+        digest (str, optional): Dosyanın SHA-256 özeti (verilmezse hesaplanır)
+
+    Returns:
+        dict: extract_text_from_pdf çıktısı
+    """
+    return _cached("text", pdf, digest, extract_text_from_pdf)
+
+
+def get_layout_pages(pdf, digest=None):
+    """
+    PDF'in sayfa düzeni blokları (extract_layout_blocks çıktısının compact_layout_pages hali);
+    önbellekte varsa PDF ayrıştırılmaz.
+
+    Args:
+        pdf (str | ParsedPdf): PDF dosya yolu veya istek boyunca paylaşılan ParsedPdf
+        digest (str, optional): Dosyanın SHA-256 özeti (verilmezse hesaplanır)
+
+    Returns:
+        list: {"page", "width", "height", "blocks"} sözlükleri
+    """
+    return _cached("layout", pdf, digest, lambda source: compact_layout_pages(extract_layout_blocks(source)))
@@ -0,0 +1,211 @@
+import re
+import hashlib
+import logging
+from collections import namedtuple
+from app.utils.string_index import StringIndex
+
+# Kimlik indeksindeki kaynakların aday puanları
+IDENTITY_SOURCE_SCORES = {
+    "confirmed": 3,   # Aynı gönderen/makale için daha önce tespit edilmiş varlık
+    "email": 3,       # Gönderenin e-posta adresi
+    "name_guess": 2   # E-posta adresinden türetilen isim/kurum tahmini
+}
+
+# Eşleşmelerin bölge öncelik sırası (ilk geçtiği bölge aday bağlamı olur)
+IDENTITY_CONTEXTS = ("header", "first_page", "main_content")
+
+# Alan adından kurum kısaltması çıkarılmayan genel e-posta sağlayıcıları
+FREE_MAIL_DOMAINS = {
+    "gmail.com", "googlemail.com", "hotmail.com", "outlook.com", "live.com", "yahoo.com", "icloud.com",
+    "yandex.com", "yandex.ru", "protonmail.com", "proton.me", "mail.ru", "aol.com", "gmx.com", "msn.com"
+}
+
+# Kurum kısaltması çıkarılırken atlanan alan adı etiketleri (ülke kodları ayrıca atlanır)
+GENERIC_DOMAIN_LABELS = {"ac", "edu", "com", "org", "net", "gov", "mil", "int", "info", "co", "mail", "email"}
+
+# İsim tahmininde kullanılan yerel kısım parçalarının minimum uzunluğu
+MIN_NAME_PART_LENGTH = 2
+
+IdentityEntry = namedtuple('IdentityEntry', ['text', 'entity_type', 'source'])
+IdentityMatch = namedtuple('IdentityMatch', ['text', 'entity_type', 'source', 'context', 'score'])
+
+
+def guess_names_from_email(email):
+    """
+    E-posta adresinin yerel kısmından yazar adı tahminleri üret.
+
+    Örnek: "john.smith+ieee@dtu.ac.in" -> ["John Smith", "JOHN SMITH", "J. Smith"]
+    Tek parçalı yerel kısımlardan (ör. "jsmith") tahmin üretilmez.
+
+    Returns:
+        list: İsim yazım varyantları
+    """
+    if not email or '@' not in email:
+        return []
+
+    local_part = email.split('@', 1)[0].split('+', 1)[0]
+    parts = [part for part in re.split(r'[._\-]+', local_part) if part.isalpha()]
+    if len(parts) < 2:
+        return []
+
+    first, last = parts[0], parts[-1]
+    if len(last) < MIN_NAME_PART_LENGTH:
+        return []
+
+    guesses = []
+    if len(first) >= MIN_NAME_PART_LENGTH:
+        full_name = f"{first.capitalize()} {last.capitalize()}"
+        guesses.extend([full_name, full_name.upper()])
+    guesses.append(f"{first[0].upper()}. {last.capitalize()}")
+    return guesses
+
+
+def guess_institution_from_domain(domain):
+    """
+    Kurumsal e-posta alan adından kurum kısaltması tahmin et.
+
+    Örnek: "cs.dtu.ac.in" -> "DTU", "upc.edu" -> "UPC". Genel e-posta sağlayıcıları için None.
+    """
+    domain = (domain or "").lower()
+    if not domain or domain in FREE_MAIL_DOMAINS:
+        return None
+
+    labels = [label for label in domain.split('.') if label]
+    # Sondan başlayarak TLD, ülke kodu ve genel etiketleri atla
+    while labels and (len(labels[-1]) == 2 or labels[-1] in GENERIC_DOMAIN_LABELS):
+        labels.pop()
+    if not labels:
+        return None
+
+    acronym = labels[-1]
+    if not acronym.isalpha() or not 3 <= len(acronym) <= 8:
+        return None
+    return acronym.upper()
+
+
+class IdentityIndex:
+    """
+    Gönderen e-postası, e-postadan türetilen isim ve kurum tahminleri ve aynı gönderen/makale için
+    daha önce onaylanmış varlıklardan oluşan kimlik indeksi.
+
+    Tüm kimlik metinleri tek bir Aho-Corasick otomatında derlenir; belge bölgeleri NER'den
+    önce tek taramada eşleştirilir.
+    """
+
+    def __init__(self, entries):
+        unique = {}
+        for entry in entries:
+            if entry.text and (entry.text, entry.entity_type) not in unique:
+                unique[(entry.text, entry.entity_type)] = entry
+        self.entries = list(unique.values())
+        self._index = StringIndex(entry.text for entry in self.entries)
+
+    @classmethod
+    def build(cls, email=None, confirmed_entities=None):
+        """
+        Args:
+            email (str, optional): Gönderenin e-posta adresi
+            confirmed_entities (dict, optional): {varlık_tipi: [metinler]} - Paper.get_confirmed_entities çıktısı
+
+        Returns:
+            IdentityIndex
+        """
+        entries = []
+
+        for entity_type, values in (confirmed_entities or {}).items():
+            for value in values:
+                entries.append(IdentityEntry(value, entity_type, "confirmed"))
+
+        if email:
+            email = email.strip()
+            entries.append(IdentityEntry(email, "contact_info", "email"))
+            if email.lower() != email:
+                entries.append(IdentityEntry(email.lower(), "contact_info", "email"))
+
+            for guess in guess_names_from_email(email):
+                entries.append(IdentityEntry(guess, "author_name", "name_guess"))
+
+            institution = guess_institution_from_domain(email.rsplit('@', 1)[-1])
+            if institution:
+                entries.append(IdentityEntry(institution, "institution_info", "name_guess"))
+
+        return cls(entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __bool__(self):
+        return bool(self.entries)
+
+    @property
+    def signature(self):
+        """İndeks içeriğinin özeti (önbellek anahtarları için)"""
+        payload = "\n".join(sorted(f"{e.entity_type}\t{e.source}\t{e.text}" for e in self.entries))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def match(self, documents, entity_types=None):
+        """
+        Kimlik metinlerini belge bölgelerinde ara.
+
+        Args:
+            documents (dict): {"header", "first_page", "main_content"} -> IndexedDocument
+            entity_types (list, optional): Yalnızca bu varlık tiplerindeki kimlikler döndürülür
+
+        Returns:
+            list: IdentityMatch listesi - her kimlik için ilk geçtiği bölge (öncelik sırasıyla)
+        """
+        matches = []
+        if not self.entries:
+            return matches
+
+        found_in = {}
+        for context in IDENTITY_CONTEXTS:
+            document = documents.get(context)
+            if not document:
+                continue
+            for text in self._index.find_all(document.text):
+                found_in.setdefault(text, context)
+
+        for entry in self.entries:
+            if entity_types is not None and entry.entity_type not in entity_types:
+                continue
+            context = found_in.get(entry.text)
+            if context is None:
+                continue
+            matches.append(IdentityMatch(entry.text, entry.entity_type, entry.source, context,
+                                         IDENTITY_SOURCE_SCORES[entry.source]))
+
+        if matches:
+            logging.info(f"Kimlik indeksi eşleşmeleri: {[(m.text, m.entity_type, m.context) for m in matches]}")
+        return matches
+
+
+def has_high_confidence_author_match(matches, identity_index):
+    """
+    Beklenen tüm yazarlar başlık veya ilk sayfada yüksek güvenle eşleşti mi?
+
+    Beklenen yazarlar, aynı gönderen/makale için daha önce onaylanmış yazar adlarının tamamıdır;
+    biri bile başlık/ilk sayfada bulunmazsa (ör. yazar listesi değişmişse) False döner ve ana
+    içerik NER'i atlanmaz. Onaylanmış yazar yoksa gönderen e-postası ile birlikte bulunan bir
+    isim tahmini yeterlidir.
+
+    Args:
+        matches (list): IdentityIndex.match çıktısı
+        identity_index (IdentityIndex): Eşleşmelerin alındığı indeks
+    """
+    early = {match.text: match for match in matches if match.context in ("header", "first_page")}
+    expected_authors = {entry.text for entry in identity_index.entries
+                        if entry.entity_type == "author_name" and entry.source == "confirmed"}
+    if expected_authors:
+        return all(text in early for text in expected_authors)
+    return (any(match.source == "email" for match in early.values()) and
+            any(match.entity_type == "author_name" and match.source == "name_guess" for match in early.values()))
+
+
+def seed_identity_candidates(candidates, entity_type, matches):
+    """Kimlik eşleşmelerini aday sözlüğüne puanlarıyla ekle"""
+    for match in matches:
+        if match.entity_type != entity_type:
+            continue
+        key = (match.text, match.context)
+        candidates[entity_type][key] = candidates[entity_type].get(key, 0) + match.score
@@ -0,0 +1,138 @@
+from bisect import bisect_left, bisect_right
+from app.utils.patterns import (
+    INDEX_TERMS_SECTION_RES, KEYWORDS_SECTION_RES, INDEX_TERMS_HEADER_RE, KEYWORDS_HEADER_RE
+)
+
+# INDEX TERMS / KEYWORDS başlık satırından sonra bölüme dahil sayılan satır sayısı
+KEYWORD_TRAILING_LINES = 3
+
+
+class IndexedDocument:
+    """
+    İstek başına bir kez oluşturulan, değiştirilemez metin ve konum indeksleri.
+
+    Satır başlangıçları, sayfa sınırları, bölüm aralıkları ve INDEX TERMS/KEYWORDS aralıkları
+    oluşturulurken hesaplanır; tespit yardımcıları metni tekrar tekrar bölmek yerine bu
+    indeksleri kullanır. Konumdan satır/sayfa/bölüm bulma işlemleri O(log n)'dir.
+    """
+
+    __slots__ = (
+        "text", "lines", "line_starts", "page_numbers", "page_starts", "section_titles", "section_starts",
+        "keyword_spans", "keyword_line_numbers", "keyword_header_starts", "_first_positions", "_derived"
+    )
+
+    def __init__(self, text, page_offsets=None, section_offsets=None):
+        """
+        Args:
+            text (str): Belge metni
+            page_offsets (list, optional): (sayfa_no, başlangıç_pozisyonu) çiftleri
+            section_offsets (list, optional): (bölüm_başlığı, başlangıç_pozisyonu) çiftleri
+        """
+        text = text or ""
+        lines = tuple(text.split('\n'))
+
+        line_starts = [0]
+        for line in lines[:-1]:
+            line_starts.append(line_starts[-1] + len(line) + 1)
+
+        page_offsets = sorted(page_offsets or [], key=lambda item: item[1])
+        section_offsets = sorted(section_offsets or [], key=lambda item: item[1])
+
+        # INDEX TERMS / KEYWORDS bölümleri (tam eşleşme aralıkları, kalıp sırasıyla)
+        keyword_spans = []
+        for kind, pattern_list in (("index_terms", INDEX_TERMS_SECTION_RES), ("keywords", KEYWORDS_SECTION_RES)):
+            for pattern in pattern_list:
+                for match in pattern.finditer(text):
+                    if match.group(0):
+                        keyword_spans.append((kind, match.start(), match.end()))
+
+        # INDEX TERMS / KEYWORDS başlığı içeren satırlar ve sonraki satırlar
+        keyword_line_numbers = set()
+        for i, line in enumerate(lines):
+            if INDEX_TERMS_HEADER_RE.search(line) or KEYWORDS_HEADER_RE.search(line):
+                keyword_line_numbers.update(range(i, i + KEYWORD_TRAILING_LINES + 1))
+
+        keyword_header_starts = sorted(
+            [m.start() for m in INDEX_TERMS_HEADER_RE.finditer(text)] +
+            [m.start() for m in KEYWORDS_HEADER_RE.finditer(text)]
+        )
+
+        set_field = super().__setattr__
+        set_field("text", text)
+        set_field("lines", lines)
+        set_field("line_starts", tuple(line_starts))
+        set_field("page_numbers", tuple(page for page, _ in page_offsets))
+        set_field("page_starts", tuple(offset for _, offset in page_offsets))
+        set_field("section_titles", tuple(title for title, _ in section_offsets))
+        set_field("section_starts", tuple(offset for _, offset in section_offsets))
+        set_field("keyword_spans", tuple(keyword_spans))
+        set_field("keyword_line_numbers", frozenset(n for n in keyword_line_numbers if n < len(lines)))
+        set_field("keyword_header_starts", tuple(keyword_header_starts))
+        set_field("_first_positions", {})
+        set_field("_derived", {})
+
+    def __setattr__(self, name, value):
+        raise AttributeError("IndexedDocument değiştirilemez")
+
+    def __len__(self):
+        return len(self.text)
+
+    def __bool__(self):
+        return bool(self.text)
+
+    @classmethod
+    def wrap(cls, text_or_document):
+        """Metni IndexedDocument'a dönüştür; zaten IndexedDocument ise aynen döndür"""
+        if isinstance(text_or_document, cls):
+            return text_or_document
+        return cls(text_or_document)
+
+    def line_of(self, offset):
+        """Konumun bulunduğu satırın indeksi"""
+        return bisect_right(self.line_starts, offset) - 1
+
+    def page_of(self, offset):
+        """Konumun bulunduğu sayfa numarası (sayfa bilgisi yoksa None)"""
+        index = bisect_right(self.page_starts, offset) - 1
+        return self.page_numbers[index] if index >= 0 else None
+
+    def section_of(self, offset):
+        """Konumun bulunduğu bölümün başlığı (bilinen bir bölümde değilse None)"""
+        index = bisect_right(self.section_starts, offset) - 1
+        return self.section_titles[index] if index >= 0 else None
+
+    def keyword_sections(self, kind=None):
+        """INDEX TERMS / KEYWORDS bölüm metinleri (kind: "index_terms" veya "keywords")"""
+        return [self.text[start:end] for span_kind, start, end in self.keyword_spans if kind is None or span_kind == kind]
+
+    def has_keyword_header_between(self, start, end):
+        """[start, end) aralığında bir INDEX TERMS / KEYWORDS başlığı başlıyor mu?"""
+        index = bisect_left(self.keyword_header_starts, start)
+        return index < len(self.keyword_header_starts) and self.keyword_header_starts[index] < end
+
+    def find(self, target):
+        """Hedef metnin ilk geçiş pozisyonu (str.find ile aynı, sonuç önbelleğe alınır)"""
+        position = self._first_positions.get(target)
+        if position is None:
+            position = self.text.find(target)
+            self._first_positions[target] = position
+        return position
+
+    def derived(self, key, factory):
+        """Metinden türetilen bir yapıyı (ör. bağlam penceresi indeksi) ilk istendiğinde oluştur ve sakla"""
+        value = self._derived.get(key)
+        if value is None:
+            value = factory(self.text)
+            self._derived[key] = value
+        return value
+
+    def window(self, start, end, window_size):
+        """[start, end) aralığının önünde ve arkasında window_size karakter içeren metin"""
+        return self.text[max(0, start - window_size):min(len(self.text), end + window_size)]
+
+    def context_window(self, target, window_size=50):
+        """Hedefin ilk geçişinin çevresindeki bağlam metni (hedef yoksa boş metin)"""
+        position = self.find(target)
+        if position == -1:
+            return ""
+        return self.window(position, position + len(target), window_size)
@@ -0,0 +1,145 @@
+import os
+import json
+import logging
+import threading
+from collections import namedtuple
+from app.utils.string_index import StringIndex
+
+# Yerel kurum sözlüğü (üniversiteler, araştırma kurumları, şirketler) - ortam değişkeni ile değiştirilebilir
+INSTITUTION_GAZETTEER_PATH = os.environ.get(
+    'INSTITUTION_GAZETTEER_PATH',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'institutions.json')
+)
+
+# Türkçe karakterlerin ASCII karşılıkları (PDF'lerde ve İngilizce metinlerde sıkça aksansız yazılır)
+TURKISH_ASCII_FOLD = str.maketrans("çğıöşüâîûÇĞİÖŞÜÂÎÛéèÉ", "cgiosuaiuCGIOSUAIUeeE")
+
+GazetteerEntry = namedtuple('GazetteerEntry', ['name', 'type', 'country'])
+GazetteerMatch = namedtuple('GazetteerMatch', ['start', 'end', 'text', 'name', 'type'])
+
+_gazetteer = None
+_gazetteer_lock = threading.Lock()
+
+
+def turkish_upper(text):
+    """Türkçe büyük harf dönüşümü (i -> İ, ı -> I)"""
+    return text.replace('i', 'İ').replace('ı', 'I').upper()
+
+
+def surface_variants(name):
+    """
+    Kurum adının metinde karşılaşılabilecek yazım varyantları: özgün, aksansız,
+    büyük harfli ve büyük harfli aksansız.
+    """
+    variants = [name, name.translate(TURKISH_ASCII_FOLD)]
+    upper = turkish_upper(name)
+    variants.extend([upper, upper.translate(TURKISH_ASCII_FOLD)])
+    return list(dict.fromkeys(variants))
+
+
+def is_word_boundary(text, start, end):
+    """
+    Eşleşmenin önünde ve arkasında harf yoksa True (kısaltmaların kelime içinde eşleşmesini önler).
+    Rakamlar sınır sayılır; kurum adlarına bitişik yazılan dipnot numaraları ("2Indian Institute ...") yaygındır.
+    """
+    if start > 0 and text[start - 1].isalpha():
+        return False
+    if end < len(text) and text[end].isalpha():
+        return False
+    return True
+
+
+class InstitutionGazetteer:
+    """
+    Kurum adları, Türkçe/İngilizce varyantları ve kısaltmalarından oluşan sözlük.
+
+    Tüm yazım biçimleri tek bir Aho-Corasick otomatında derlenir; metin tek doğrusal taramada
+    eşleştirilir ve kelime sınırına oturmayan geçişler atılır.
+    """
+
+    def __init__(self, institutions):
+        """
+        Args:
+            institutions (list): {"name", "aliases", "abbreviations", "type", "country"} sözlükleri
+        """
+        self.surfaces = {}
+        for institution in institutions:
+            entry = GazetteerEntry(institution["name"], institution.get("type", "institution"),
+                                   institution.get("country"))
+            for name in [institution["name"]] + institution.get("aliases", []):
+                for variant in surface_variants(name):
+                    self.surfaces.setdefault(variant, entry)
+            # Kısaltmaların aksansız biçimleri başka kısaltmalarla çakışabilir (İTÜ -> ITU, ITU-T);
+            # bu nedenle yalnızca sözlükte verildikleri biçimde eşleşirler
+            for abbreviation in institution.get("abbreviations", []):
+                self.surfaces.setdefault(abbreviation, entry)
+
+        self.institution_count = len(institutions)
+        self._index = StringIndex(self.surfaces)
+
+    @classmethod
+    def load(cls, path=INSTITUTION_GAZETTEER_PATH):
+        """Sözlüğü JSON dosyasından yükle ve derle"""
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        gazetteer = cls(data.get("institutions", []))
+        logging.info(f"Kurum sözlüğü derlendi: {gazetteer.institution_count} kurum, "
+                     f"{len(gazetteer.surfaces)} yazım biçimi ({path})")
+        return gazetteer
+
+    def __len__(self):
+        return len(self.surfaces)
+
+    def find(self, text):
+        """
+        Metindeki kurum geçişlerini bul.
+
+        Örtüşen geçişlerde en soldaki en uzun eşleşme tutulur
+        (ör. "Indian Institute of Technology Delhi" içindeki "Indian Institute of Technology" atılır).
+
+        Returns:
+            list: Başlangıç pozisyonuna göre sıralı GazetteerMatch listesi
+        """
+        if not text or not self.surfaces:
+            return []
+
+        found = []
+        for start, surface in self._index.iter_matches(text):
+            end = start + len(surface)
+            if is_word_boundary(text, start, end):
+                found.append((start, -end, surface))
+        found.sort()
+
+        matches = []
+        last_end = -1
+        for start, negative_end, surface in found:
+            if start < last_end:
+                continue
+            entry = self.surfaces[surface]
+            matches.append(GazetteerMatch(start, -negative_end, surface, entry.name, entry.type))
+            last_end = -negative_end
+        return matches
+
+
+def get_institution_gazetteer():
+    """Süreç genelindeki kurum sözlüğünü döndür (ilk çağrıda derlenir; yüklenemezse boş sözlük)"""
+    global _gazetteer
+
+    with _gazetteer_lock:
+        if _gazetteer is None:
+            try:
+                _gazetteer = InstitutionGazetteer.load()
+            except Exception as e:
+                logging.error(f"Kurum sözlüğü yüklenemedi ({INSTITUTION_GAZETTEER_PATH}): {str(e)}")
+                _gazetteer = InstitutionGazetteer([])
+        return _gazetteer
+
+
+def find_institutions(document):
+    """
+    IndexedDocument üzerindeki kurum geçişleri (belge başına bir kez hesaplanır).
+
+    Returns:
+        list: GazetteerMatch listesi
+    """
+    return document.derived(("institution_gazetteer",), get_institution_gazetteer().find)
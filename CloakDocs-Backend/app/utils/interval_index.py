@@ -0,0 +1,42 @@
+from bisect import bisect_left, bisect_right
+
+
+class IntervalIndex:
+    """
+    Karakter ofsetleri üzerindeki [başlangıç, bitiş) aralıkları için sıralı uç nokta indeksi.
+
+    Aralıklar başlangıçlarına göre sıralanır ve en uzun aralığın boyu saklanır. Bir [start, end)
+    aralığını kapsayan aralıkların başlangıcı [end - en_uzun_boy, start] içinde olmak zorundadır;
+    bu aralık ikili arama ile bulunur ve yalnızca oradaki aralıklar kontrol edilir. Yazar bağlam
+    pencereleri gibi boyları birbirine yakın aralıklarda sorgu maliyeti, sorgulanan konumla
+    örtüşen aralık sayısıyla orantılıdır.
+    """
+
+    __slots__ = ("starts", "ends", "ids", "max_length")
+
+    def __init__(self, intervals):
+        """
+        Args:
+            intervals (iterable): (başlangıç, bitiş) çiftleri; sorgular bu sıradaki indeksleri döndürür
+        """
+        ordered = sorted((start, end, index) for index, (start, end) in enumerate(intervals))
+        self.starts = [start for start, _, _ in ordered]
+        self.ends = [end for _, end, _ in ordered]
+        self.ids = [index for _, _, index in ordered]
+        self.max_length = max((end - start for start, end, _ in ordered), default=0)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def containing(self, start, end):
+        """
+        [start, end) aralığını tamamen kapsayan aralıklar.
+
+        Returns:
+            list: Kapsayan aralıkların (oluşturma sırasındaki) indeksleri
+        """
+        low = bisect_left(self.starts, end - self.max_length)
+        high = bisect_right(self.starts, start)
+        ends = self.ends
+        ids = self.ids
+        return [ids[i] for i in range(low, high) if ends[i] >= end]
@@ -0,0 +1,222 @@
+import re
+import logging
+from collections import Counter
+from app.utils.pdf_document import ParsedPdf
+
+# PyMuPDF (fitz) kütüphanesini import et
+try:
+    import fitz  # PyMuPDF
+    HAVE_PYMUPDF = True
+except ImportError:
+    HAVE_PYMUPDF = False
+    logging.warning("PyMuPDF (fitz) kütüphanesi yüklü değil. Sayfa düzeni analizi yapılamayacak.")
+
+# Blok tipleri
+BLOCK_TITLE = "title"
+BLOCK_AUTHOR = "author_block"
+BLOCK_AFFILIATION = "affiliation"
+BLOCK_BODY = "body"
+BLOCK_FOOTER = "footer"
+BLOCK_BIOGRAPHY = "biography"
+
+# Yazar, iletişim ve kurum bilgisini taşıması muhtemel bloklar - yalnızca bunlar NER'e gönderilir
+ROI_BLOCK_TYPES = (BLOCK_AUTHOR, BLOCK_AFFILIATION, BLOCK_FOOTER, BLOCK_BIOGRAPHY)
+
+# Kurum/adres bloklarını belirleyen ucuz metin özellikleri
+AFFILIATION_RE = re.compile(
+    r"(?i)\b(?:department|dept\.|faculty|school of|university|universit[éeà]|institute|college|laborator(?:y|ies)|"
+    r"centre|center for|üniversite|fakülte|bölüm|enstitü|is with|are with)\b|@|\b\d{5,6}\b"
+)
+
+# Yazar biyografisi göstergeleri (IEEE formatı)
+BIOGRAPHY_RE = re.compile(
+    r"(?i)received the .{0,80}degree|was born in|research interests|is currently (?:a|an|pursuing|working)|"
+    r"(?:he|she) (?:received|joined|was with|is affiliated with)"
+)
+
+# Özet/anahtar kelime başlangıcı - ilk sayfada yazar bloğunun bittiği yer
+ABSTRACT_RE = re.compile(r"(?i)^\s*(?:abstract|a b s t r a c t|index terms|keywords|article info|öz\b|özet)")
+
+# IEEE üyelik ibaresi - yazar satırlarının güçlü göstergesi
+IEEE_MEMBERSHIP_RE = re.compile(r"(?:Member|Fellow),?\s*IEEE")
+
+
+def extract_layout_blocks(pdf):
+    """
+    PDF'in tüm sayfalarındaki metin bloklarını fitz get_text("dict") ile oku.
+
+    Args:
+        pdf (str | ParsedPdf): PDF dosya yolu veya istek boyunca paylaşılan ParsedPdf
+                               (bloklar onda saklanır ve başlık tespitinde yeniden kullanılır)
+
+    Returns:
+        list: Her sayfa için {"page", "width", "height", "blocks"} sözlükleri.
+              PyMuPDF yoksa boş liste döner.
+    """
+    if not HAVE_PYMUPDF:
+        return []
+
+    parsed_pdf, owned = ParsedPdf.wrap(pdf)
+    try:
+        return parsed_pdf.layout_pages()
+    finally:
+        if owned:
+            parsed_pdf.close()
+
+
+def font_family(font_name):
+    """Alt küme önekini (ör. "ABCDEF+Times-Roman") atarak font adını döndür"""
+    return font_name.split("+", 1)[-1] if font_name else ""
+
+
+def _block_text_and_style(block):
+    """
+    Blok metnini (satırlar \\n ile ayrılmış) ve karakter ağırlıklı baskın font boyutunu ve
+    font adını döndür
+    """
+    lines = []
+    size_weights = Counter()
+    font_weights = Counter()
+
+    for line in block.get("lines", []):
+        line_text = ""
+        for span in line.get("spans", []):
+            span_text = span.get("text", "")
+            line_text += span_text
+            if span_text.strip():
+                size_weights[round(span.get("size", 0), 1)] += len(span_text.strip())
+                font_weights[font_family(span.get("font", ""))] += len(span_text.strip())
+        if line_text.strip():
+            lines.append(line_text.strip())
+
+    dominant_size = size_weights.most_common(1)[0][0] if size_weights else 0
+    dominant_font = font_weights.most_common(1)[0][0] if font_weights else ""
+    return "\n".join(lines), dominant_size, dominant_font
+
+
+def collect_text_blocks(pages):
+    """
+    Sayfalardaki metin bloklarını metin, bbox, baskın font boyutu ve font adıyla topla.
+
+    Returns:
+        list: {"page", "text", "bbox", "size", "font", "page_height"} sözlükleri
+    """
+    raw_blocks = []
+    for page in pages:
+        for block in page["blocks"]:
+            if block.get("type", 0) != 0 or "lines" not in block:
+                continue
+            text, size, font = _block_text_and_style(block)
+            if not text:
+                continue
+            raw_blocks.append({
+                "page": page["page"],
+                "text": text,
+                "bbox": tuple(block["bbox"]),
+                "size": size,
+                "font": font,
+                "page_height": page["height"]
+            })
+    return raw_blocks
+
+
+def body_font_size(raw_blocks):
+    """Gövde metninin font boyutu - en çok karakter taşıyan boyut"""
+    size_weights = Counter()
+    for block in raw_blocks:
+        size_weights[block["size"]] += len(block["text"])
+    return size_weights.most_common(1)[0][0] if size_weights else 0
+
+
+def is_page_band_block(block, body_size):
+    """Sayfa üstü/altı bandındaki bloklar ve sayfanın alt kısmındaki küçük fontlu dipnotlar"""
+    x0, y0, x1, y1 = block["bbox"]
+    height = block["page_height"]
+    return y0 > height * 0.9 or y1 < height * 0.1 or (
+        block["size"] and block["size"] < body_size * 0.85 and y0 > height * 0.6)
+
+
+def classify_layout_blocks(pages):
+    """
+    Sayfa bloklarını font boyutu, konum ve basit metin özelliklerine göre sınıflandır.
+
+    Sınıflar: title, author_block, affiliation, body, footer, biography
+
+    Args:
+        pages (list): extract_layout_blocks çıktısı
+
+    Returns:
+        list: {"page", "type", "text", "bbox", "size", "font"} sözlükleri, sayfa ve okuma sırasına göre
+    """
+    if not pages:
+        return []
+
+    # Tüm metin bloklarını topla
+    raw_blocks = collect_text_blocks(pages)
+    if not raw_blocks:
+        return []
+
+    # Gövde metninin font boyutu - en çok karakter taşıyan boyut
+    body_size = body_font_size(raw_blocks)
+    last_page = pages[-1]["page"]
+
+    # İlk sayfadaki başlık: üst yarıdaki en büyük fontlu blok(lar)
+    first_page_blocks = [b for b in raw_blocks if b["page"] == 0]
+    title_size = 0
+    for block in first_page_blocks:
+        if block["bbox"][1] < block["page_height"] * 0.5 and len(block["text"]) > 5:
+            title_size = max(title_size, block["size"])
+    if title_size < body_size * 1.2:
+        title_size = 0
+
+    # Yazar bloğu başlık ile özet arasında kalır
+    title_bottom = None
+    abstract_top = None
+    for block in first_page_blocks:
+        if title_size and block["size"] >= title_size * 0.95:
+            title_bottom = max(title_bottom or 0, block["bbox"][3])
+        elif abstract_top is None and ABSTRACT_RE.search(block["text"]):
+            abstract_top = block["bbox"][1]
+
+    classified = []
+    for block in raw_blocks:
+        page_num = block["page"]
+        x0, y0, x1, y1 = block["bbox"]
+        height = block["page_height"]
+        text = block["text"]
+        block_type = BLOCK_BODY
+
+        if page_num == 0 and title_size and block["size"] >= title_size * 0.95:
+            block_type = BLOCK_TITLE
+        elif is_page_band_block(block, body_size):
+            # Sayfa üstü/altı bantları ve dipnotlar - ilk sayfa dipnotları ve kayan başlıklar
+            # genellikle yazar ve kurum bilgisi içerir
+            block_type = BLOCK_FOOTER
+        elif page_num >= last_page - 1 and BIOGRAPHY_RE.search(text):
+            block_type = BLOCK_BIOGRAPHY
+        elif page_num == 0 and (
+            (title_bottom is not None and y0 >= title_bottom - 1 and (abstract_top is None or y1 <= abstract_top + 1))
+            or IEEE_MEMBERSHIP_RE.search(text)
+        ):
+            block_type = BLOCK_AFFILIATION if AFFILIATION_RE.search(text) else BLOCK_AUTHOR
+        elif page_num == 0 and AFFILIATION_RE.search(text) and len(text) < 400:
+            block_type = BLOCK_AFFILIATION
+
+        classified.append({
+            "page": page_num,
+            "type": block_type,
+            "text": text,
+            "bbox": block["bbox"],
+            "size": block["size"],
+            "font": block["font"]
+        })
+
+    counts = Counter(b["type"] for b in classified)
+    logging.info(f"Sayfa düzeni sınıflandırıldı: {dict(counts)}")
+
+    return classified
+
+
+def get_roi_text(classified_blocks, block_types=ROI_BLOCK_TYPES):
+    """İlgili blok tiplerinin metinlerini okuma sırasıyla birleştir"""
+    return "\n\n".join(b["text"] for b in classified_blocks if b["type"] in block_types)
@@ -0,0 +1,337 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import tempfile
+import threading
+from collections import Counter
+from app.utils.layout_classifier import (
+    BLOCK_TITLE, BLOCK_AUTHOR, BLOCK_AFFILIATION, BLOCK_BODY, BLOCK_FOOTER, BLOCK_BIOGRAPHY,
+    AFFILIATION_RE, BIOGRAPHY_RE, classify_layout_blocks, collect_text_blocks, body_font_size, is_page_band_block
+)
+
+# Şablon tarifleri ayarları - ortam değişkenleri ile yapılandırılabilir
+LAYOUT_TEMPLATES_ENABLED = os.environ.get('LAYOUT_TEMPLATES_ENABLED', 'true').lower() == 'true'
+LAYOUT_TEMPLATE_STORE_PATH = os.environ.get(
+    'LAYOUT_TEMPLATE_STORE_PATH',
+    os.path.join(os.environ.get('UPLOAD_FOLDER', os.path.join(os.getcwd(), 'uploads')), '.cache', 'layout_templates.json')
+)
+# Bir tarifin kullanılabilmesi için aynı sonucu veren en az kaç makaleden öğrenilmiş olması gerektiği
+LAYOUT_TEMPLATE_MIN_SAMPLES = int(os.environ.get('LAYOUT_TEMPLATE_MIN_SAMPLES', 3))
+LAYOUT_TEMPLATE_MAX_ITEMS = int(os.environ.get('LAYOUT_TEMPLATE_MAX_ITEMS', 500))
+
+# Tarifte konumları ve font imzaları öğrenilen ilk sayfa bölgeleri
+TEMPLATE_REGION_TYPES = (BLOCK_TITLE, BLOCK_AUTHOR, BLOCK_AFFILIATION)
+
+# Bölge bantlarının eşleştirilmesinde kullanılan tolerans (sayfa yüksekliğine oranla)
+TEMPLATE_BAND_TOLERANCE = 0.02
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def _dominant_style(blocks):
+    """Bloklar arasında en çok karakter taşıyan (font, boyut) çifti"""
+    weights = Counter()
+    for block in blocks:
+        weights[(block["font"], block["size"])] += len(block["text"])
+    return list(weights.most_common(1)[0][0]) if weights else None
+
+
+def compute_template_fingerprint(pages):
+    """
+    Makalenin yayın şablonunu tanımlayan parmak izi.
+
+    İmza içerikten bağımsız, şablona özgü özelliklerden oluşur: ilk sayfanın boyutu, ilk sayfadaki
+    baskın metin fontu, başlık fontu ve ikinci sayfanın kayan başlık (running head) fontu.
+
+    Args:
+        pages (list): layout_classifier.extract_layout_blocks çıktısı
+
+    Returns:
+        str: Onaltılık parmak izi (sayfa yoksa None)
+    """
+    if not pages:
+        return None
+
+    first_page = pages[0]
+    first_blocks = collect_text_blocks([first_page])
+    height = first_page["height"]
+
+    title_style = None
+    title_candidates = [b for b in first_blocks if b["bbox"][1] < height * 0.5 and len(b["text"]) > 5]
+    if title_candidates:
+        title = max(title_candidates, key=lambda b: b["size"])
+        title_style = [title["font"], title["size"]]
+
+    running_head_style = None
+    if len(pages) > 1:
+        second_page = pages[1]
+        running_head_style = _dominant_style(
+            [b for b in collect_text_blocks([second_page]) if b["bbox"][3] < second_page["height"] * 0.1]
+        )
+
+    signature = [
+        round(first_page["width"]), round(height),
+        _dominant_style(first_blocks), title_style, running_head_style
+    ]
+    return hashlib.sha256(json.dumps(signature).encode("utf-8")).hexdigest()[:32]
+
+
+def build_template_recipe(classified_blocks, pages):
+    """
+    Genel sezgisellerle sınıflandırılmış bloklardan şablon tarifi çıkar.
+
+    Tarif, ilk sayfadaki başlık, yazar ve kurum bölgelerinin font imzalarını ve dikey bantlarını
+    (sayfa yüksekliğine oranla), gövde font boyutunu ve biyografi bloklarının font imzalarını içerir.
+
+    Returns:
+        dict: Tarif; ilk sayfada yazar bloğu bulunamadıysa None
+    """
+    heights = {page["page"]: page["height"] for page in pages}
+    body_size = body_font_size(classified_blocks)
+
+    regions = {}
+    for block_type in TEMPLATE_REGION_TYPES:
+        blocks = [b for b in classified_blocks if b["page"] == 0 and b["type"] == block_type]
+        if not blocks:
+            continue
+        height = heights[0]
+        regions[block_type] = {
+            "styles": sorted({(b["font"], b["size"]) for b in blocks}),
+            "band": [round(min(b["bbox"][1] for b in blocks) / height, 3),
+                     round(max(b["bbox"][3] for b in blocks) / height, 3)]
+        }
+
+    if BLOCK_AUTHOR not in regions:
+        return None
+
+    # Son sayfalarda gövde veya kaynakça bloklarıyla aynı fontu taşıyan biyografiler font imzasıyla
+    # ayırt edilemez; bu durumda tarif biyografi imzası içermez ve regex kullanılır
+    last_page = pages[-1]["page"]
+    last_page_blocks = [b for b in classified_blocks if b["page"] >= last_page - 1]
+    other_styles = {(b["font"], b["size"]) for b in last_page_blocks
+                    if b["type"] not in (BLOCK_BIOGRAPHY, BLOCK_FOOTER)}
+    biography_styles = {(b["font"], b["size"]) for b in last_page_blocks if b["type"] == BLOCK_BIOGRAPHY}
+    biography_styles = sorted(biography_styles) if not biography_styles & other_styles else []
+
+    # JSON'a yazıldıktan sonra da karşılaştırılabilmesi için çiftler liste olarak tutulur
+    for region in regions.values():
+        region["styles"] = [list(style) for style in region["styles"]]
+
+    return {
+        "body_size": body_size,
+        "regions": regions,
+        "biography_styles": [list(style) for style in biography_styles]
+    }
+
+
+def _region_styles(recipe):
+    return {block_type: region["styles"] for block_type, region in recipe["regions"].items()}
+
+
+def _in_region(block, region):
+    """Blok bölgenin font imzalarından birini taşıyor ve dikey bandının içinde kalıyorsa True"""
+    if not region or [block["font"], block["size"]] not in region["styles"]:
+        return False
+    top, bottom = region["band"]
+    height = block["page_height"]
+    return (block["bbox"][1] >= (top - TEMPLATE_BAND_TOLERANCE) * height
+            and block["bbox"][3] <= (bottom + TEMPLATE_BAND_TOLERANCE) * height)
+
+
+def apply_template_recipe(pages, recipe):
+    """
+    Blokları şablon tarifine göre sınıflandır (başlık/özet arama ve blok başına regex taraması yapılmaz).
+
+    Returns:
+        list: classify_layout_blocks ile aynı biçimde bloklar; tarif ilk sayfada yazar bloğu
+              bulamazsa (şablon uyuşmazlığı) None
+    """
+    raw_blocks = collect_text_blocks(pages)
+    if not raw_blocks:
+        return None
+
+    body_size = recipe["body_size"]
+    regions = recipe["regions"]
+    biography_styles = recipe.get("biography_styles") or []
+    last_page = pages[-1]["page"]
+
+    classified = []
+    for block in raw_blocks:
+        page_num = block["page"]
+        block_type = BLOCK_BODY
+
+        if page_num == 0 and _in_region(block, regions.get(BLOCK_TITLE)):
+            block_type = BLOCK_TITLE
+        elif is_page_band_block(block, body_size):
+            block_type = BLOCK_FOOTER
+        elif page_num >= last_page - 1 and (
+            [block["font"], block["size"]] in biography_styles
+            if biography_styles else BIOGRAPHY_RE.search(block["text"])
+        ):
+            block_type = BLOCK_BIOGRAPHY
+        elif page_num == 0:
+            in_author = _in_region(block, regions.get(BLOCK_AUTHOR))
+            in_affiliation = _in_region(block, regions.get(BLOCK_AFFILIATION))
+            if in_author and in_affiliation:
+                block_type = BLOCK_AFFILIATION if AFFILIATION_RE.search(block["text"]) else BLOCK_AUTHOR
+            elif in_author:
+                block_type = BLOCK_AUTHOR
+            elif in_affiliation:
+                block_type = BLOCK_AFFILIATION
+
+        classified.append({
+            "page": page_num,
+            "type": block_type,
+            "text": block["text"],
+            "bbox": block["bbox"],
+            "size": block["size"],
+            "font": block["font"]
+        })
+
+    if not any(b["page"] == 0 and b["type"] == BLOCK_AUTHOR for b in classified):
+        return None
+    return classified
+
+
+class LayoutTemplateStore:
+    """
+    Şablon parmak izi -> tarif kayıtlarını tutan JSON dosyası.
+
+    Aynı parmak izine sahip makalelerden aynı bölge font imzaları öğrenildikçe örnek sayısı artar
+    ve bantlar birleştirilir; farklı bir sonuç tarifi sıfırlar. Tarif yalnızca örnek sayısı
+    LAYOUT_TEMPLATE_MIN_SAMPLES'a ulaştığında kullanılır. Kayıt sayısı sınırı aşıldığında en uzun
+    süredir kullanılmayan şablonlar silinir.
+    """
+
+    def __init__(self, path=LAYOUT_TEMPLATE_STORE_PATH, min_samples=LAYOUT_TEMPLATE_MIN_SAMPLES,
+                 max_items=LAYOUT_TEMPLATE_MAX_ITEMS):
+        self.path = path
+        self.min_samples = min_samples
+        self.max_items = max_items
+        self._lock = threading.RLock()
+        self._templates = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f).get("templates", {})
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logging.warning(f"Şablon tarifleri okunamadı, boş başlatılıyor ({self.path}): {str(e)}")
+            return {}
+
+    def _save(self):
+        """Kayıtları atomik olarak diske yaz"""
+        tmp_path = None
+        try:
+            directory = os.path.dirname(self.path)
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": 1, "templates": self._templates}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logging.warning(f"Şablon tarifleri yazılamadı ({self.path}): {str(e)}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def __len__(self):
+        return len(self._templates)
+
+    def get(self, fingerprint):
+        """Parmak izi için güvenilir tarifi döndür (yoksa veya yeterli örnek yoksa None)"""
+        with self._lock:
+            entry = self._templates.get(fingerprint)
+            if not entry or entry["samples"] < self.min_samples:
+                return None
+            entry["last_used"] = time.time()
+            return entry["recipe"]
+
+    def learn(self, fingerprint, recipe):
+        """Genel sınıflandırmadan çıkarılan tarifi parmak izinin kaydına ekle"""
+        if not fingerprint or not recipe:
+            return
+
+        with self._lock:
+            entry = self._templates.get(fingerprint)
+            if entry and _region_styles(entry["recipe"]) == _region_styles(recipe):
+                # Aynı şablon: bantları genişlet ve örnek sayısını artır
+                for block_type, region in recipe["regions"].items():
+                    band = entry["recipe"]["regions"][block_type]["band"]
+                    band[0] = min(band[0], region["band"][0])
+                    band[1] = max(band[1], region["band"][1])
+                known = entry["recipe"].setdefault("biography_styles", [])
+                known.extend(style for style in recipe["biography_styles"] if style not in known)
+                entry["samples"] += 1
+            else:
+                entry = {"recipe": recipe, "samples": 1}
+                self._templates[fingerprint] = entry
+            entry["last_used"] = time.time()
+
+            if entry["samples"] == self.min_samples:
+                logging.info(f"Şablon tarifi {self.min_samples} makaleden öğrenildi, sonraki makalelerde "
+                             f"kullanılacak: {fingerprint[:12]}")
+
+            if len(self._templates) > self.max_items:
+                oldest = sorted(self._templates, key=lambda key: self._templates[key].get("last_used", 0))
+                for key in oldest[:len(self._templates) - self.max_items]:
+                    del self._templates[key]
+
+            self._save()
+
+    def forget(self, fingerprint):
+        """Şablonla uyuşmayan bir makale görüldüğünde tarifi sil"""
+        with self._lock:
+            if self._templates.pop(fingerprint, None) is not None:
+                self._save()
+
+
+def get_template_store():
+    """Süreç genelindeki şablon tarifi deposunu döndür (devre dışıysa None)"""
+    global _store
+
+    if not LAYOUT_TEMPLATES_ENABLED:
+        return None
+
+    with _store_lock:
+        if _store is None:
+            _store = LayoutTemplateStore()
+        return _store
+
+
+def classify_layout_blocks_with_template(pages):
+    """
+    Sayfa bloklarını sınıflandır; makalenin şablonu için öğrenilmiş bir tarif varsa genel
+    sezgiseller yerine tarifi uygula.
+
+    Tarif yoksa veya makale tarife uymuyorsa classify_layout_blocks kullanılır ve sonucu
+    şablonun tarifini öğrenmek için kaydedilir.
+
+    Args:
+        pages (list): layout_classifier.extract_layout_blocks çıktısı
+
+    Returns:
+        list: classify_layout_blocks ile aynı biçimde sınıflandırılmış bloklar
+    """
+    store = get_template_store()
+    if not pages or store is None:
+        return classify_layout_blocks(pages)
+
+    fingerprint = compute_template_fingerprint(pages)
+    recipe = store.get(fingerprint)
+    if recipe:
+        classified = apply_template_recipe(pages, recipe)
+        if classified is not None:
+            counts = Counter(b["type"] for b in classified)
+            logging.info(f"Sayfa düzeni şablon tarifiyle sınıflandırıldı ({fingerprint[:12]}): {dict(counts)}")
+            return classified
+        logging.info(f"Makale şablon tarifine uymuyor, tarif siliniyor: {fingerprint[:12]}")
+        store.forget(fingerprint)
+
+    classified = classify_layout_blocks(pages)
+    store.learn(fingerprint, build_template_recipe(classified, pages))
+    return classified
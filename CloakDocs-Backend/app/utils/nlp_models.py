@@ -0,0 +1,114 @@
+import os
+import logging
+import threading
+from importlib import metadata
+
+# Tercih sırasına göre denenecek spaCy modelleri (SPACY_MODELS ortam değişkeni ile değiştirilebilir)
+# Örnek: SPACY_MODELS=en_core_web_lg,en_core_web_sm
+DEFAULT_MODEL_PREFERENCE = ["en_core_sci_md", "en_core_web_lg", "en_core_web_sm"]
+
+# Süreç genelinde yüklenmiş modeller - {model_adı: Language veya None}
+_models = {}
+_default_model_name = None
+# Hiçbir model yüklenemediyse True; hata bir kez loglanır ve yükleme tekrar denenmez
+_no_model = False
+_lock = threading.RLock()
+
+
+def get_model_preference():
+    """Yüklenecek modellerin tercih sırasını döndür"""
+    configured = os.environ.get('SPACY_MODELS', '')
+    preference = [name.strip() for name in configured.split(',') if name.strip()]
+    return preference or list(DEFAULT_MODEL_PREFERENCE)
+
+
+def load_model(name):
+    """
+    Belirtilen spaCy modelini süreç başına yalnızca bir kez yükle.
+
+    Model kurulu değilse paket yüklemeye veya indirmeye çalışılmaz; None döndürülür
+    ve sonuç önbelleğe alınır, böylece başarısız yükleme her istekte tekrarlanmaz.
+
+    Args:
+        name (str): spaCy model paketinin adı (örn: en_core_web_sm)
+
+    Returns:
+        Language veya None: Yüklenen spaCy pipeline'ı
+    """
+    with _lock:
+        if name in _models:
+            return _models[name]
+
+        model = None
+        try:
+            import spacy
+            model = spacy.load(name)
+            logging.info(f"spaCy modeli yüklendi: {name}")
+        except ImportError:
+            logging.error("spaCy kurulu değil, NER kullanılamayacak")
+        except OSError:
+            logging.warning(f"spaCy modeli bulunamadı: {name}")
+        except Exception as e:
+            logging.error(f"spaCy modeli yüklenirken hata ({name}): {str(e)}")
+
+        _models[name] = model
+        return model
+
+
+def get_nlp():
+    """
+    Tercih sırasındaki ilk yüklenebilen spaCy modelini döndür.
+
+    entity_detector ve pdf_processor aynı pipeline'ı paylaşır; model ilk kullanımda
+    yüklenir ve süreç boyunca yeniden kullanılır.
+
+    Returns:
+        Language veya None: Hiçbir model yüklenemezse None
+    """
+    global _default_model_name, _no_model
+
+    with _lock:
+        if _default_model_name is not None:
+            return _models.get(_default_model_name)
+        if _no_model:
+            return None
+
+        for name in get_model_preference():
+            model = load_model(name)
+            if model is not None:
+                _default_model_name = name
+                return model
+
+        _no_model = True
+        logging.error(f"Hiçbir spaCy modeli yüklenemedi. Denenen modeller: {', '.join(get_model_preference())}. "
+                      f"Bir modeli kurmak için: python -m spacy download en_core_web_sm")
+        return None
+
+
+def get_loaded_model_name():
+    """Varsayılan olarak kullanılan modelin adını döndür (henüz yüklenmediyse None)"""
+    return _default_model_name
+
+
+def package_version(name):
+    """Kurulu paketin sürümü (kurulu değilse None) - paket içe aktarılmaz"""
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def get_model_signature():
+    """
+    Kullanılan (veya get_nlp ile yüklenecek) modelin adı ve paket sürümü; model yüklenmez.
+    Model henüz yüklenmediyse tercih sırasındaki ilk kurulu model paketi esas alınır.
+
+    Returns:
+        str: "model@sürüm" veya kurulu model yoksa "none"
+    """
+    names = [_default_model_name] if _default_model_name is not None else get_model_preference()
+    for name in names:
+        version = package_version(name)
+        if version is not None:
+            return f"{name}@{version}"
+    return "none"
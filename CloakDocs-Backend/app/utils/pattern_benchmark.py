@@ -0,0 +1,142 @@
+import os
+import re
+import sys
+import argparse
+import timeit
+
+# Proje kök dizinini path'e ekle
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+root_dir = os.path.dirname(parent_dir)
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+# Kendi modüllerimizi import et
+from app.utils import patterns
+
+
+def load_pages(input_path):
+    """
+    Kıyaslamada kullanılacak sayfa metinlerini yükle.
+    PDF dosyaları pypdf ile sayfa sayfa okunur; diğer dosyalar form feed (\\f) veya
+    yaklaşık 3000 karakterlik parçalara bölünür.
+    """
+    if input_path.lower().endswith(".pdf"):
+        from pypdf import PdfReader
+        with open(input_path, "rb") as file:
+            reader = PdfReader(file)
+            return [page.extract_text() + "\n" for page in reader.pages]
+
+    with open(input_path, "r", encoding="utf-8") as f:
+        text = f.read()
+
+    if "\f" in text:
+        return [page for page in text.split("\f") if page.strip()]
+    return [text[i:i + 3000] for i in range(0, len(text), 3000)]
+
+
+def legacy_scan(pattern_list, text, flags=0):
+    """Eski yöntem: her kalıp için ayrı re.search çağrısı (derleme re önbelleğine bırakılır)"""
+    return sum(1 for pattern in pattern_list if re.search(pattern, text, flags))
+
+
+def get_benchmark_cases():
+    """Kıyaslanacak (isim, eski çağrı, yeni çağrı) üçlüleri"""
+    inline = lambda pattern_list: [f"(?i){p}" for p in pattern_list]
+
+    return [
+        (
+            "excluded_sections",
+            lambda text: legacy_scan(inline(patterns.EXCLUDED_SECTION_PATTERNS), text),
+            lambda text: patterns.search_any(patterns.EXCLUDED_SECTION_RES, text)
+        ),
+        (
+            "reference_sections",
+            lambda text: legacy_scan(inline(patterns.REFERENCE_SECTION_PATTERNS), text, re.MULTILINE),
+            lambda text: patterns.REFERENCE_SECTION_MULTILINE_RE.search(text) is not None
+        ),
+        (
+            "header_context",
+            lambda text: legacy_scan(inline(patterns.HEADER_CONTEXT_PATTERNS), text),
+            lambda text: patterns.HEADER_CONTEXT_RE.search(text) is not None
+        ),
+        (
+            "ieee_biography",
+            lambda text: legacy_scan(patterns.IEEE_BIOGRAPHY_PATTERNS, text, re.MULTILINE | re.IGNORECASE),
+            lambda text: patterns.count_matching_patterns(patterns.IEEE_BIOGRAPHY_PAGE_RES, text)
+        ),
+        (
+            "phone",
+            lambda text: [re.findall(p, text) for p in patterns.PHONE_PATTERNS],
+            lambda text: [p.findall(text) for p in patterns.PHONE_RES]
+        ),
+        (
+            "institution",
+            lambda text: [re.findall(p, text) for p in patterns.INSTITUTION_PATTERNS],
+            lambda text: [p.findall(text) for p in patterns.INSTITUTION_RES]
+        ),
+    ]
+
+
+def run_benchmark(input_path, repeat=20, purge_cache=True):
+    """
+    Sayfa başına regex maliyetini eski ve yeni yöntemle ölç ve yazdır.
+
+    Args:
+        input_path (str): PDF veya metin dosyası
+        repeat (int): Her sayfa için tekrar sayısı
+        purge_cache (bool): Eski yöntem ölçülürken re modülünün iç önbelleğini temizle
+                            (uzun süre çalışan süreçte çok sayıda farklı kalıp kullanıldığında
+                            önbelleğin taşmasını taklit eder)
+    """
+    print(f"Dosya yükleniyor: {input_path}")
+
+    if not os.path.exists(input_path):
+        print(f"HATA: {input_path} dosyası bulunamadı!")
+        return False
+
+    pages = load_pages(input_path)
+    if not pages:
+        print("HATA: Dosyada metin bulunamadı!")
+        return False
+
+    print(f"{len(pages)} sayfa, toplam {sum(len(p) for p in pages)} karakter, tekrar: {repeat}")
+    print(f"{'Kalıp grubu':<22}{'eski (µs/sayfa)':>18}{'yeni (µs/sayfa)':>18}{'hızlanma':>12}")
+
+    total_legacy = 0.0
+    total_registry = 0.0
+
+    for name, legacy, registry in get_benchmark_cases():
+        def legacy_run():
+            for page in pages:
+                if purge_cache:
+                    re.purge()
+                legacy(page)
+
+        def registry_run():
+            for page in pages:
+                registry(page)
+
+        legacy_time = min(timeit.repeat(legacy_run, number=1, repeat=repeat)) / len(pages) * 1e6
+        registry_time = min(timeit.repeat(registry_run, number=1, repeat=repeat)) / len(pages) * 1e6
+        total_legacy += legacy_time
+        total_registry += registry_time
+
+        speedup = legacy_time / registry_time if registry_time else float("inf")
+        print(f"{name:<22}{legacy_time:>18.1f}{registry_time:>18.1f}{speedup:>11.1f}x")
+
+    speedup = total_legacy / total_registry if total_registry else float("inf")
+    print(f"{'TOPLAM':<22}{total_legacy:>18.1f}{total_registry:>18.1f}{speedup:>11.1f}x")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Regex kalıp kayıt defteri kıyaslama aracı")
+    parser.add_argument("input_path", help="PDF veya metin dosyasının yolu")
+    parser.add_argument("--repeat", type=int, default=20, help="Her ölçüm için tekrar sayısı (varsayılan: 20)")
+    parser.add_argument("--keep-re-cache", action="store_true",
+                        help="Eski yöntem ölçülürken re modülünün önbelleğini temizleme")
+
+    args = parser.parse_args()
+
+    run_benchmark(args.input_path, args.repeat, purge_cache=not args.keep_re_cache)
@@ -0,0 +1,189 @@
+import os
+import re
+import sys
+import time
+import argparse
+import multiprocessing
+
+# Proje kök dizinini path'e ekle
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+root_dir = os.path.dirname(parent_dir)
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+
+def build_adversarial_inputs(size):
+    """
+    Geri izleme (backtracking) patlamasını tetiklemeye yönelik girdiler.
+    Her girdi yaklaşık size karakterdir ve kalıpların eşleşmeye çok yaklaşıp son adımda
+    başarısız olduğu durumları hedefler.
+
+    Returns:
+        list: (isim, metin) çiftleri
+    """
+    def repeat(unit, suffix=""):
+        return unit * max(1, size // len(unit)) + suffix
+
+    return [
+        ("harf dizisi", repeat("a", "!")),
+        ("büyük harf dizisi", repeat("A", "!")),
+        ("boşluk dizisi", repeat(" ", "x")),
+        ("satır sonu dizisi", repeat("\n", "x")),
+        ("boşluk ve satır sonu", repeat(" \n", "1")),
+        ("büyük harfli kelimeler", repeat("Aaaa ", "1")),
+        ("büyük harfli kelimeler, satırsız", repeat("Aaaa Bbbb ", "received the")),
+        ("virgüllü yazar listesi", repeat("Aaaa Bbbb, ", "1")),
+        ("tamamı büyük harfli isimler", repeat("AAAA BBBB ", "1")),
+        ("e-posta benzeri", repeat("a.", "@") + repeat("a.", "")),
+        ("noktalı kelimeler", repeat("a.a-", "")),
+        ("ayraçlı rakamlar", repeat("1-", "")),
+        ("boşluklu rakamlar", repeat("12 ", "")),
+        ("INDEX TERMS, boş satırsız", "INDEX TERMS " + repeat("x y\n", "")),
+        ("KEYWORDS, boş satırsız", "KEYWORDS: " + repeat("x y\n", "")),
+        ("biyografi cümlesi", repeat("Aa Bb received the ", "")),
+    ]
+
+
+def load_registered_patterns():
+    """Kayıt defterindeki kalıplar: {isim: derlenmiş kalıp}"""
+    from app.utils import patterns
+    return dict(patterns.iter_registered_patterns())
+
+
+def _run_pattern(name, inputs, connection):
+    """Alt süreç: kalıbı her girdide finditer ile sonuna kadar tüket ve süreleri gönder"""
+    pattern = load_registered_patterns()[name]
+    for input_name, text in inputs:
+        started = time.perf_counter()
+        for _ in pattern.finditer(text):
+            pass
+        connection.send((input_name, time.perf_counter() - started))
+    connection.close()
+
+
+def stress_pattern(name, inputs, time_limit):
+    """
+    Kalıbı tüm girdilerde ayrı bir süreçte çalıştır; süre sınırı aşılırsa süreci sonlandır.
+
+    Returns:
+        tuple: (en yavaş girdi, en uzun süre, sınır aşıldı mı)
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_run_pattern, args=(name, inputs, sender), daemon=True)
+    process.start()
+    sender.close()
+
+    deadline = time.monotonic() + time_limit
+    slowest = (None, 0.0)
+    completed = 0
+    while completed < len(inputs):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not receiver.poll(remaining):
+            break
+        try:
+            input_name, elapsed = receiver.recv()
+        except EOFError:
+            break
+        completed += 1
+        if elapsed > slowest[1]:
+            slowest = (input_name, elapsed)
+
+    timed_out = completed < len(inputs)
+    if timed_out:
+        process.terminate()
+        slowest = (inputs[completed][0], time_limit)
+    process.join()
+    return slowest[0], slowest[1], timed_out
+
+
+def compare_engines(text):
+    """
+    RE2 ile derlenen kalıpların eşleşmelerini (span ve gruplar) Python re ile karşılaştır.
+
+    Returns:
+        list: (kalıp ismi, re eşleşme sayısı, re2 eşleşme sayısı, ilk farklı eşleşme) - yalnızca farklı olanlar
+    """
+    from app.utils import patterns
+
+    differences = []
+    for name, compiled in patterns.iter_registered_patterns():
+        if patterns.pattern_engine(compiled) != "re2":
+            continue
+        source, flags = patterns.pattern_source(compiled)
+        reference = re.compile(source, flags)
+        expected = [(m.span(), m.groups()) for m in reference.finditer(text)]
+        actual = [(m.span(), m.groups()) for m in compiled.finditer(text)]
+        if expected != actual:
+            first = next((pair for pair in zip(expected, actual) if pair[0] != pair[1]), None)
+            differences.append((name, len(expected), len(actual), first))
+    return differences
+
+
+def run_stress_test(size=20000, time_limit=2.0, name_filter=None, compare_path=None):
+    """
+    Kayıt defterindeki her kalıbı çekişmeli girdilerle süre sınırı altında çalıştır ve sonuçları yazdır.
+
+    Args:
+        size (int): Her girdinin yaklaşık uzunluğu (karakter)
+        time_limit (float): Kalıp başına toplam süre sınırı (saniye)
+        name_filter (str, optional): Yalnızca isminde bu metin geçen kalıplar
+        compare_path (str, optional): Verilirse bu metin/PDF dosyasında RE2 ve re sonuçları karşılaştırılır
+
+    Returns:
+        bool: Tüm kalıplar süre sınırı içinde kaldıysa ve motorlar arasında fark yoksa True
+    """
+    from app.utils import patterns
+
+    print(f"Regex motoru: {patterns.REGEX_ENGINE} (google-re2 {'yüklü' if patterns.HAVE_RE2 else 'yüklü değil'})")
+
+    registered = load_registered_patterns()
+    names = [name for name in registered if not name_filter or name_filter in name]
+    inputs = build_adversarial_inputs(size)
+    print(f"{len(names)} kalıp, {len(inputs)} girdi (~{size} karakter), kalıp başına süre sınırı: {time_limit} sn")
+    print(f"{'Kalıp':<36}{'motor':>7}{'en uzun (ms)':>15}  en yavaş girdi")
+
+    failures = []
+    for name in names:
+        slowest_input, elapsed, timed_out = stress_pattern(name, inputs, time_limit)
+        status = "  ZAMAN AŞIMI" if timed_out else ""
+        print(f"{name:<36}{patterns.pattern_engine(registered[name]):>7}{elapsed * 1000:>15.1f}  "
+              f"{slowest_input or '-'}{status}")
+        if timed_out:
+            failures.append(name)
+
+    if failures:
+        print(f"\nHATA: {len(failures)} kalıp süre sınırını aştı: {', '.join(failures)}")
+    else:
+        print("\nTüm kalıplar süre sınırı içinde tamamlandı.")
+
+    ok = not failures
+    if compare_path:
+        if compare_path.lower().endswith(".pdf"):
+            from app.utils.pattern_benchmark import load_pages
+            text = "".join(load_pages(compare_path))
+        else:
+            with open(compare_path, "r", encoding="utf-8") as f:
+                text = f.read()
+
+        differences = compare_engines(text)
+        print(f"\nMotor karşılaştırması ({compare_path}): {len(differences)} kalıpta fark")
+        for name, expected_count, actual_count, first in differences:
+            print(f"  {name}: re {expected_count} eşleşme, re2 {actual_count} eşleşme; ilk fark: {first}")
+        ok = ok and not differences
+
+    return ok
+
+
+if __name__ == "__main__":
+    # Motoru karşılaştırmak için: REGEX_ENGINE=re python -m app.utils.pattern_stress_test
+    parser = argparse.ArgumentParser(description="Regex kalıp kayıt defteri geri izleme (backtracking) denetimi")
+    parser.add_argument("--size", type=int, default=20000, help="Girdi uzunluğu (varsayılan: 20000 karakter)")
+    parser.add_argument("--time-limit", type=float, default=2.0, help="Kalıp başına süre sınırı (varsayılan: 2 sn)")
+    parser.add_argument("--filter", dest="name_filter", help="Yalnızca isminde bu metin geçen kalıpları çalıştır")
+    parser.add_argument("--compare", dest="compare_path",
+                        help="RE2 ve re sonuçlarını bu metin/PDF dosyası üzerinde karşılaştır")
+
+    args = parser.parse_args()
+
+    sys.exit(0 if run_stress_test(args.size, args.time_limit, args.name_filter, args.compare_path) else 1)
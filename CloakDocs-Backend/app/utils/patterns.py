@@ -0,0 +1,501 @@
+import os
+import re
+import logging
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+# google-re2 (doğrusal zamanlı regex motoru) varsa kullan, yoksa yalnızca Python re kullanılır
+try:
+    import re2
+    HAVE_RE2 = True
+except ImportError:
+    HAVE_RE2 = False
+    logging.info("google-re2 kütüphanesi yüklü değil. Regex kalıpları Python re motoru ile derlenecek.")
+
+# Merkezi regex kalıp kayıt defteri.
+#
+# Tespit, metin çıkarma ve anonimleştirme modüllerinde kullanılan kalıp listeleri burada
+# modül yüklenirken bir kez derlenir; fonksiyon gövdelerinde liste oluşturma ve re önbelleği
+# araması yapılmaz.
+#
+# Python'un re motoru alternasyonlarda sabit önek (literal prefix) hızlandırmasını kullanamaz.
+# Bu yüzden üyeleri sabit metinle başlayan listeler (biyografi göstergeleri, hariç tutulan
+# bölümler) tek tek derlenir ve ilk eşleşmede duran yardımcılarla taranır. Satır başına
+# bağlı listeler ve satır ön filtreleri ise tek bir birleşik tarayıcıya dönüştürülür; böylece
+# sayfa/satır N kez yerine bir kez taranır. Ölçümler için: python -m app.utils.pattern_benchmark
+#
+# google-re2 yüklüyse kalıplar doğrusal zamanlı RE2 motoruyla derlenir; geri izleme (backtracking)
+# yapılmadığından tek bir kötü PDF metni bir CPU çekirdeğini kilitleyemez. RE2'nin desteklemediği
+# veya anlamı farklı olan yapıları içeren kalıplar (lookaround, geri başvuru, Unicode kelime sınırı,
+# MULTILINE olmadan $) Python re ile derlenir. Denetim için: python -m app.utils.pattern_stress_test
+
+# Regex motoru: "auto" (RE2 varsa RE2, yoksa re) veya "re" (her zaman Python re)
+REGEX_ENGINE = os.environ.get('REGEX_ENGINE', 'auto').lower()
+
+# Python'un Unicode \s sınıfının RE2 karşılığı (str.isspace() ile aynı karakterler)
+RE2_SPACE_CLASS = r"\t\n\v\f\r\x{1c}-\x{1f} \x{85}\x{a0}\x{1680}\x{2000}-\x{200a}\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}"
+
+# RE2'ye satır içi bayrak olarak aktarılabilen re bayrakları
+RE2_INLINE_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+
+# RE2 ile derlenen kalıpların özgün (kalıp, bayrak) çiftleri - denetim araçları için
+_re2_sources = {}
+
+
+def translate_for_re2(pattern, flags=0, ascii_word_boundary=False):
+    r"""
+    Python re kalıbını aynı anlamdaki RE2 kalıbına çevir.
+
+    \s ve \d Python'daki gibi Unicode karakterleri kapsayacak şekilde genişletilir, \Z yerine \z
+    kullanılır ve bayraklar satır içi bayrağa dönüştürülür. Anlamı korunarak çevrilemeyen yapılar
+    (\b, \B, \w, \W, geri başvurular, karakter sınıfı içinde \S/\D, MULTILINE olmadan $) için
+    None döner. Lookaround gibi RE2'nin hiç desteklemediği yapılar derleme sırasında elenir.
+
+    Args:
+        ascii_word_boundary (bool): True ise \b ve \B, RE2'nin ASCII kelime sınırı ile çevrilir
+            (Python'da kelime sınırı Unicode harflerini de dikkate alır; yalnızca komşuları
+            pratikte ASCII olan kalıplar için kullanılmalıdır)
+
+    Returns:
+        str: RE2 kalıbı (çevrilemiyorsa None)
+    """
+    supported_flags = 0
+    prefix = ""
+    for flag, letter in RE2_INLINE_FLAGS:
+        if flags & flag:
+            supported_flags |= flag
+            prefix += letter
+    if flags & ~supported_flags & ~re.UNICODE:
+        return None
+
+    translated = []
+    in_class = False
+    class_start = 0
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            escape = pattern[i + 1:i + 2]
+            if escape in ("w", "W") or escape.isdigit():
+                return None
+            if escape in ("b", "B") and not ascii_word_boundary:
+                return None
+            if escape == "s":
+                translated.append(RE2_SPACE_CLASS if in_class else f"[{RE2_SPACE_CLASS}]")
+            elif escape == "d":
+                translated.append(r"\p{Nd}")
+            elif escape in ("S", "D"):
+                if in_class:
+                    return None
+                translated.append(f"[^{RE2_SPACE_CLASS}]" if escape == "S" else r"\P{Nd}")
+            elif escape == "Z" and not in_class:
+                translated.append(r"\z")
+            else:
+                translated.append(char + escape)
+            i += 2
+            continue
+
+        if in_class:
+            # Sınıfın başındaki ] karakteri sınıfı kapatmaz
+            if char == "]" and i > class_start:
+                in_class = False
+        elif char == "[":
+            in_class = True
+            class_start = i + 1
+            if pattern[class_start:class_start + 1] == "^":
+                class_start += 1
+        elif char == "$" and not flags & re.MULTILINE:
+            return None
+        translated.append(char)
+        i += 1
+
+    return (f"(?{prefix})" if prefix else "") + "".join(translated)
+
+
+def compile_pattern(pattern, flags=0, ascii_word_boundary=False):
+    """
+    Kalıbı derle: mümkünse RE2 ile, değilse Python re ile.
+
+    Boş metinle eşleşebilen kalıplar (ör. yalnızca \Z alternatifi) Python re ile derlenir;
+    RE2 sarmalayıcısının finditer/findall çıktısı boş eşleşmelerde re'den farklıdır.
+
+    Args:
+        pattern (str): Python re sözdiziminde kalıp
+        flags (int): re bayrakları
+        ascii_word_boundary (bool): bkz. translate_for_re2
+
+    Returns:
+        re.Pattern veya re2 kalıbı (search, match, finditer, findall, sub arayüzleri aynıdır)
+    """
+    if HAVE_RE2 and REGEX_ENGINE != "re":
+        translated = None
+        if sre_parse.parse(pattern, flags).getwidth()[0] > 0:
+            translated = translate_for_re2(pattern, flags, ascii_word_boundary)
+        if translated is not None:
+            options = re2.Options()
+            options.log_errors = False
+            try:
+                compiled = re2.compile(translated, options)
+                _re2_sources[id(compiled)] = (pattern, flags)
+                return compiled
+            except re2.error:
+                pass
+        logging.debug(f"Kalıp Python re ile derlendi (RE2 ile uyumsuz): {pattern}")
+    return re.compile(pattern, flags)
+
+
+def pattern_engine(compiled_pattern):
+    """Derlenmiş kalıbın motoru: "re2" veya "re" """
+    return "re" if isinstance(compiled_pattern, re.Pattern) else "re2"
+
+
+def pattern_source(compiled_pattern):
+    """Derlenmiş kalıbın özgün Python re kalıbı ve bayrakları: (kalıp, bayraklar)"""
+    if isinstance(compiled_pattern, re.Pattern):
+        return compiled_pattern.pattern, compiled_pattern.flags
+    return _re2_sources[id(compiled_pattern)]
+
+
+def is_compiled_pattern(value):
+    """Değer compile_pattern ile derlenmiş bir kalıp mı?"""
+    return isinstance(value, re.Pattern) or (HAVE_RE2 and isinstance(value, re2._Regexp))
+
+
+def compile_patterns(patterns, flags=0, ascii_word_boundary=False):
+    """Kalıp listesini aynı bayraklarla derle"""
+    return [compile_pattern(pattern, flags, ascii_word_boundary) for pattern in patterns]
+
+
+def combine_patterns(patterns, flags=0):
+    """
+    Kalıp listesini tek bir alternasyon kalıbında birleştir.
+
+    Args:
+        patterns (list): Satır içi bayrak ((?i) gibi) içermeyen regex kalıpları
+        flags (int): Birleşik kalıba uygulanacak re bayrakları
+
+    Returns:
+        Kalıplardan herhangi biri eşleştiğinde eşleşen derlenmiş kalıp (bkz. compile_pattern)
+    """
+    return compile_pattern("|".join(f"(?:{pattern})" for pattern in patterns), flags)
+
+
+def search_any(compiled_patterns, text):
+    """Derlenmiş kalıplardan herhangi biri metinde eşleşiyorsa True döndür (ilk eşleşmede durur)"""
+    return any(pattern.search(text) for pattern in compiled_patterns)
+
+
+def count_matching_patterns(compiled_patterns, text, limit=None):
+    """
+    Metinde eşleşen kalıp sayısını döndür.
+
+    Args:
+        compiled_patterns (list): Derlenmiş kalıplar
+        text (str): Taranacak metin
+        limit (int, optional): Bu sayıya ulaşıldığında taramayı durdur
+
+    Returns:
+        int: Eşleşen kalıp sayısı (limit verilmişse en fazla limit)
+    """
+    count = 0
+    for pattern in compiled_patterns:
+        if pattern.search(text):
+            count += 1
+            if limit is not None and count >= limit:
+                break
+    return count
+
+
+# ---------------------------------------------------------------------------
+# Bölüm başlıkları (text_extractor, anonymize_processor)
+# ---------------------------------------------------------------------------
+
+# Anonimleştirmeden hariç tutulan bölümler
+EXCLUDED_SECTION_PATTERNS = [
+    r"INTRODUCTION",
+    r"RELATED\s+WORKS?",
+    r"REFERENCES",
+    r"BIBLIOGRAPHY",
+    r"ACKNOWLEDGEMENTS?",
+    r"CITED\s+REFERENCES"
+]
+EXCLUDED_SECTION_RES = compile_patterns(EXCLUDED_SECTION_PATTERNS, re.IGNORECASE)
+
+# Referans bölümü başlıkları (satırın tamamı)
+REFERENCE_SECTION_PATTERNS = [
+    r"^\s*REFERENCES\s*$",
+    r"^\s*BIBLIOGRAPHY\s*$",
+    r"^\s*CITED\s+REFERENCES\s*$",
+    r"^\s*REFERANSLAR\s*$",
+    r"^\s*KAYNAKLAR\s*$",
+    r"^\s*KAYNAKÇA\s*$",
+    r"^\s*REFERENCES\s+AND\s+CITATIONS\s*$"
+]
+# Yukarıdaki kalıpların ortak ^\s* ... \s*$ çerçevesi altında birleştirilmiş hali -
+# motor her satır başında tek bir alternasyon dener
+REFERENCE_SECTION_SCANNER = (
+    r"^\s*(?:REFERENCES(?:\s+AND\s+CITATIONS)?|BIBLIOGRAPHY|CITED\s+REFERENCES"
+    r"|REFERANSLAR|KAYNAKLAR|KAYNAKÇA)\s*$"
+)
+# Tek satır için
+REFERENCE_SECTION_RE = compile_pattern(REFERENCE_SECTION_SCANNER, re.IGNORECASE)
+# Sayfa metninin herhangi bir satırı için
+REFERENCE_SECTION_MULTILINE_RE = compile_pattern(REFERENCE_SECTION_SCANNER, re.IGNORECASE | re.MULTILINE)
+
+# Numaralı veya numarasız bölüm başlığı satırı
+# Tek satırlık kalıp kırpılmış (strip) satırlara uygulanır. ^\s* ile \s* ve [A-Za-z\s]+ aynı
+# boşlukları paylaşmasın diye başlık metni harfle başlar; uzun boşluk dizilerinde geri izleme
+# patlaması olmaz. Boşlukla bitmeyen metinlerde önceki ^\s*(?:\d+\.)*\s*([A-Za-z\s]+)$ kalıbıyla
+# aynı sonucu verir.
+SECTION_HEADER_RE = compile_pattern(r"^\s*(?:(?:\d+\.)+\s*)?([A-Za-z][A-Za-z\s]*)$", re.IGNORECASE)
+SECTION_HEADER_MULTILINE_RE = compile_pattern(r"^\s*(?:\d+\.)*\s*([A-Za-z\s]+)$", re.IGNORECASE | re.MULTILINE)
+
+# Sayfa metnini tek geçişte tarayan birleşik bölüm başlığı kalıbı: satırın tamamı bir referans
+# başlığıysa "reference", değilse SECTION_HEADER_RE ile aynı biçimdeki başlık metni "title" grubunda
+# yakalanır. Boşluk sınıfları satır sonunu içermez; eşleşmeler satır sınırını aşmaz.
+LINE_SPACE = r"[ \t\r\f\v]"
+SECTION_HEADER_SCANNER = (
+    rf"^{LINE_SPACE}*(?:"
+    rf"(?P<reference>REFERENCES(?:{LINE_SPACE}+AND{LINE_SPACE}+CITATIONS)?|BIBLIOGRAPHY"
+    rf"|CITED{LINE_SPACE}+REFERENCES|REFERANSLAR|KAYNAKLAR|KAYNAKÇA){LINE_SPACE}*"
+    rf"|(?:(?:\d+\.)+{LINE_SPACE}*)?(?P<title>[A-Za-z][A-Za-z \t\r\f\v]*)"
+    r")$"
+)
+SECTION_HEADER_SCANNER_RE = compile_pattern(SECTION_HEADER_SCANNER, re.IGNORECASE | re.MULTILINE)
+# Başlık metni hariç tutulan bölümlerden biri mi (EXCLUDED_SECTION_RES'in tek kalıplık hali)
+EXCLUDED_SECTION_RE = combine_patterns(EXCLUDED_SECTION_PATTERNS, re.IGNORECASE)
+
+# ---------------------------------------------------------------------------
+# İlk sayfa / başlık alanı (text_extractor)
+# ---------------------------------------------------------------------------
+
+# Yakınında yazar bilgisi bulunması muhtemel ifadeler
+HEADER_CONTEXT_PATTERNS = [
+    r"corresponding author",
+    r"author(s)?[:]?",
+    r"prepared by",
+    r"written by",
+    r"submitted by",
+    r"affiliation",
+    r"department of",
+    r"faculty of",
+    r"school of",
+    r"university of",
+    r"institute of",
+    r"contact[:]?"
+]
+# Satır ön filtresi: ifade içermeyen satırlar tek taramada elenir
+HEADER_CONTEXT_RE = combine_patterns(HEADER_CONTEXT_PATTERNS, re.IGNORECASE)
+HEADER_CONTEXT_RES = compile_patterns(HEADER_CONTEXT_PATTERNS, re.IGNORECASE)
+
+# Başlık alanı göstergeleri
+TITLE_MARKER_PATTERNS = [
+    r"^ABSTRACT",
+    r"^TITLE[:]?",
+    r"^KEYWORDS[:]?"
+]
+TITLE_MARKER_RE = combine_patterns(TITLE_MARKER_PATTERNS, re.IGNORECASE)
+TITLE_MARKER_RES = compile_patterns(TITLE_MARKER_PATTERNS, re.IGNORECASE)
+
+# ---------------------------------------------------------------------------
+# Varlık tespiti (entity_detector)
+# ---------------------------------------------------------------------------
+
+# Yazar bağlam ifadeleri - her biri ayrı bir güçlendirme penceresi ürettiği için ayrı derlenir
+AUTHOR_CONTEXT_PATTERNS = [
+    r"corresponding author",
+    r"author(s)?[:]?",
+    r"prepared by",
+    r"written by",
+    r"submitted by",
+    r"affiliation",
+    r"department of",
+    r"faculty of",
+    r"university of",
+    r"institute of",
+    r"contact[:]?",
+    r"e-?mail[:]?"
+]
+AUTHOR_CONTEXT_RES = compile_patterns(AUTHOR_CONTEXT_PATTERNS, re.IGNORECASE)
+
+# INDEX TERMS / KEYWORDS bölümleri
+INDEX_TERMS_SECTION_RES = [
+    compile_pattern(r'INDEX\s+TERMS[\s\:\-]+.*?(?=\n\n|\Z)', re.IGNORECASE | re.DOTALL),
+    compile_pattern(r'INDEX\s+TERMS.*?\n(.*?)(?=\n\n|\Z)', re.IGNORECASE | re.DOTALL),
+    compile_pattern(r'(?:^|\n)INDEX\s+TERMS[^\n]*\n((?:[^\n]+[\n]?){1,5})', re.IGNORECASE | re.DOTALL),
+]
+KEYWORDS_SECTION_RES = [
+    compile_pattern(r'KEYWORDS[\s\:\-]+.*?(?=\n\n|\Z)', re.IGNORECASE | re.DOTALL),
+    compile_pattern(r'KEYWORDS.*?\n(.*?)(?=\n\n|\Z)', re.IGNORECASE | re.DOTALL),
+    compile_pattern(r'(?:^|\n)KEYWORDS[^\n]*\n((?:[^\n]+[\n]?){1,5})', re.IGNORECASE | re.DOTALL),
+]
+
+# INDEX TERMS / KEYWORDS başlığı içeren satırlar
+INDEX_TERMS_HEADER_RE = compile_pattern(r'INDEX\s+TERMS', re.IGNORECASE)
+KEYWORDS_HEADER_RE = compile_pattern(r'KEYWORDS', re.IGNORECASE)
+
+# Satır bazlı yazar tespiti
+SINGLE_NAME_LINE_RE = compile_pattern(r'^[A-Z][a-zA-Z\-]+$')
+MULTI_NAME_LINE_RE = compile_pattern(r'^[A-Z][a-zA-Z\-]+(?:\s+[A-Z][a-zA-Z\-]+)+$')
+INITIAL_NAME_LINE_RE = compile_pattern(r'^[A-Z]\.\s+[A-Z][a-zA-Z\-]+$')
+AFFILIATION_LINE_RE = compile_pattern(r'Department|Faculty|Institute|School')
+EMAIL_LINE_RE = compile_pattern(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# IEEE üyelik bilgisiyle birlikte yazılan yazar isimleri (John Smith, Member, IEEE)
+IEEE_MEMBER_AUTHOR_RE = compile_pattern(
+    r'([A-Z][a-zA-Z\-]+(?:\s+[A-Z][a-zA-Z\-]+)+)(?:,\s+(?:Member|Senior Member|Fellow|Student Member|Associate Member),\s+IEEE)'
+)
+
+# Akademik başlıktaki IEEE yazar listesi kalıpları - iç içe niceleyiciler re ile uzun büyük harfli
+# kelime dizilerinde çok geri izleme yapar, RE2 ile doğrusal çalışır
+IEEE_AUTHOR_LIST_PATTERNS = [
+    # "Name, Title, IEEE" formatı
+    r"([A-Z][a-zÀ-ÿ]+(?:\s+[A-Z][a-zÀ-ÿ]+){1,3})\s*,\s*(?:Member|Senior Member|Fellow|Student Member|Graduate Student Member)\s*,\s*IEEE",
+
+    # Birden fazla yazarı virgülle ayıran satırlar (IEEE üyelik bilgisi içeren)
+    r"([A-Z][a-zÀ-ÿ]+(?:\s+[A-Z][a-zÀ-ÿ]+){1,3}),\s*([A-Z][a-zÀ-ÿ]+(?:\s+[A-Z][a-zÀ-ÿ]+){1,3}),\s*(?:Member|Senior Member|Fellow|Student Member|Graduate Student Member),\s*IEEE",
+
+    # IEEE üyelik bilgisi sonraki satırda olan yazarlar
+    r"([A-Z][a-zÀ-ÿ]+(?:\s+[A-Z][a-zÀ-ÿ]+){1,3})(?:\n|\r\n?)\s*(?:Member|Senior Member|Fellow|Student Member|Graduate Student Member),\s*IEEE",
+
+    # Virgülle ayrılmış yazar listesi
+    r"([A-Z][a-zÀ-ÿ]+(?:[ -][A-Z][a-zÀ-ÿ]+){1,3}),\s*([A-Z][a-zÀ-ÿ]+(?:[ -][A-Z][a-zÀ-ÿ]+){1,3})",
+
+    # Birden fazla yazarı virgülle ayıran satırlar (genel)
+    r"([A-Z][a-zÀ-ÿ]+(?:\s+[A-Z][a-zÀ-ÿ]+){1,3}),\s*([A-Z][a-zÀ-ÿ]+(?:\s+[A-Z][a-zÀ-ÿ]+){1,3}),\s*([A-Z][a-zÀ-ÿ]+(?:\s+[A-Z][a-zÀ-ÿ]+){1,3})",
+
+    # "AND" veya "ve" ile bağlanan yazarlar
+    r"([A-Z][a-zÀ-ÿ]+(?:\s+[A-Z][a-zÀ-ÿ]+){1,3})\s+(?:AND|Ve|and)\s+([A-Z][a-zÀ-ÿ]+(?:\s+[A-Z][a-zÀ-ÿ]+){1,3})"
+]
+IEEE_AUTHOR_LIST_RES = compile_patterns(IEEE_AUTHOR_LIST_PATTERNS)
+
+# Telefon numaraları - her kalıp ayrı aday ürettiği için ayrı derlenir
+PHONE_PATTERNS = [
+    # Temizlenmiş uluslararası telefon formatı
+    r'\b\+\d{1,3}[\s\-\.]?\d{1,4}[\s\-\.]?\d{1,4}[\s\-\.]?\d{1,4}\b',
+
+    # US/Kanada formatı
+    r'\b\(\d{3}\)[\s\-\.]?\d{3}[\s\-\.]?\d{4}\b',
+    r'\b\d{3}[\s\-\.]?\d{3}[\s\-\.]?\d{4}\b',
+
+    # Avrupa türü formatlar
+    r'\b\d{2,4}[\s\-\.]\d{2,4}[\s\-\.]\d{2,4}[\s\-\.]\d{2,4}\b',
+
+    # Türkiye formatı
+    r'\b0[\s\-\.]?\d{3}[\s\-\.]\d{3}[\s\-\.]\d{2}[\s\-\.]\d{2}\b',
+    r'\b\+90[\s\-\.]?\d{3}[\s\-\.]\d{3}[\s\-\.]\d{2}[\s\-\.]\d{2}\b',
+
+    # Akademik makalelerdeki özel formatlar
+    r'(?:phone|tel)(?:ephone)?(?:\.|\:|\s)+[\(\s]*(?:\+?\d[\d\s\(\)\-\.]{7,20})',
+
+    # Parantezli ve tireyle ayrılmış formatlar (özellikle akademik makalelerde yaygın)
+    r'\(?\d{2,3}\)?[\s\-\.]+\d{2,4}[\s\-\.]+\d{2,4}[\s\-\.]+\d{2,4}'
+]
+PHONE_RES = compile_patterns(PHONE_PATTERNS)
+PHONE_LABEL_RE = compile_pattern(r'(?:phone|tel)(?:ephone)?(?:\.|\:|\s)+', re.IGNORECASE)
+
+# Noktalı uzun dizilerde re ile karesel zaman alır; RE2 ile (ASCII kelime sınırı) doğrusal çalışır
+EMAIL_RE = compile_pattern(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b', ascii_word_boundary=True)
+ORCID_RE = compile_pattern(r'ORCID(?:\:|\s)+(?:https?\:\/\/orcid\.org\/)?(\d{4}\-\d{4}\-\d{4}\-\d{4})', re.IGNORECASE)
+
+# Kurumlar - her kalıp ayrı aday ürettiği için ayrı derlenir
+INSTITUTION_PATTERNS = [
+    # Department, School, Faculty, Institute
+    r'(?:Department|Dept|School|Faculty|Institute)\s+of\s+[A-Z][^,;\n\d]{5,50}',
+
+    # University, College
+    r'[A-Z][a-zA-Z\-]+(?:\s+[A-Z][a-zA-Z\-]+){1,8}\s+(?:University|College|Institute|School)',
+    r'(?:University|College|Institute|School)\s+of\s+[A-Z][^,;\n\d]{5,50}',
+
+    # Labs, Centers, etc.
+    r'[A-Z][a-zA-Z\-]+(?:\s+[A-Z][a-zA-Z\-]+){1,8}\s+(?:Lab(?:orator(?:y|ies))?|Center|Centre|Foundation)',
+
+    # Address blocks (especially for academic papers)
+    r'[A-Z][a-zA-Z\-]+(?:,|\s+)\s*[A-Z][a-zA-Z\s]{10,100}(?:,|\s+)(?:[A-Z]{2,3}|\d{5})'
+]
+INSTITUTION_RES = compile_patterns(INSTITUTION_PATTERNS)
+INSTITUTION_CONTEXT_RE = compile_pattern(r'(?:affiliation|address|department|kurum|adres)', re.IGNORECASE)
+# İlk sayfada yazar/kurum bloğunu bitiren başlıklar (özet, anahtar kelimeler, giriş)
+AUTHOR_BLOCK_END_RE = compile_pattern(
+    r'^[ \t]*(?:abstract|özet|index[ \t]+terms|keywords|(?:\d+\.?|I\.)?[ \t]*introduction)', re.IGNORECASE | re.MULTILINE
+)
+
+# Aday puanlama özellikleri (candidate_scoring) - bağlam penceresindeki ipuçları
+CONTEXT_INDICATOR_WORDS = [
+    'author', 'yazar', 'dr', 'prof', 'professor', 'member', 'ieee', 'ph.d', 'contact', 'corresponding', 'student',
+    'university', 'college', 'institute', 'laboratory', 'department', 'faculty', 'school', 'üniversit', 'fakülte',
+    'enstitü', 'email', 'phone', 'telefon', 'address', 'tel', 'iletişim', 'numara'
+]
+CONTEXT_INDICATOR_RE = compile_pattern("|".join(re.escape(word) for word in CONTEXT_INDICATOR_WORDS), re.IGNORECASE)
+IEEE_MEMBERSHIP_CONTEXT_RE = compile_pattern(r'(?:Member|Senior Member|Fellow),\s*IEEE')
+PERSON_NAME_FORMAT_RE = compile_pattern(r'^[A-Z][a-zÀ-ÿ]+(\s+[A-Z][a-zÀ-ÿ]+)+$')
+
+# ---------------------------------------------------------------------------
+# Yazar biyografisi tespiti (anonymize_processor)
+# ---------------------------------------------------------------------------
+
+# IEEE formatı yazar biyografilerini tespit etmek için göstergeler
+IEEE_BIOGRAPHY_PATTERNS = [
+    r"received the .+ degree",
+    r"was born in",
+    r"is currently pursuing",
+    r"is currently a Research Scholar",
+    r"is currently a Professor",
+    r"is currently an Assistant Professor",
+    r"is currently an Associate Professor",
+    r"received the Ph\.D",
+    r"research interests include",
+    r"^[A-Z]{2,}(?:\s+[A-Z]{2,}){1,}\s*\(",
+    r"^[A-Z]{2,}(?:\s+[A-Z]{2,}){1,}\s*received",
+    r"[Hh]is research interests are",
+    r"[Hh]er interests include",
+    r"[Hh]e is currently working on",
+    r"[Ss]he has authored over",
+    r"[Hh]e has published more than",
+    r"[Hh]e was with",
+    r"[Ss]he was with",
+    r"[Hh]e is affiliated with",
+    r"[Ss]he is affiliated with",
+    r"[Hh]e received his",
+    r"[Ss]he received her",
+    r"[Hh]e joined the",
+    r"[Ss]he joined the",
+    r"\b[A-Z][a-z]+ [A-Z][a-z]+\b.*received the .* degree",
+    r"has been a member of",
+    r"has been an? (IEEE|Associate|Senior) member",
+    r"has published (more than|over|about|approximately) \d+",
+    r"has co-authored (more than|over|about|approximately) \d+",
+    r"has served as an? (editor|reviewer|chair|co-chair)"
+]
+# Sayfa düzeyinde (satır başı kalıpları her satırda geçerli)
+# ".*received the .* degree" kalıbı uzun satırlarda re ile kübik zaman alır; RE2 ile (ASCII kelime
+# sınırı) doğrusal çalışır
+IEEE_BIOGRAPHY_PAGE_RES = compile_patterns(IEEE_BIOGRAPHY_PATTERNS, re.IGNORECASE | re.MULTILINE,
+                                           ascii_word_boundary=True)
+# Paragraf düzeyinde
+IEEE_BIOGRAPHY_PARAGRAPH_RES = compile_patterns(IEEE_BIOGRAPHY_PATTERNS, re.IGNORECASE, ascii_word_boundary=True)
+
+# Biyografi sayfasındaki isim satırları
+CAPS_NAME_LINE_RE = compile_pattern(r"^([A-Z]{2,}(?:\s+[A-Z]{2,})+)", re.MULTILINE)
+PROPER_NAME_LINE_RE = compile_pattern(r"^([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,})", re.MULTILINE)
+IEEE_VOLUME_FOOTER_RE = compile_pattern(r"VOLUME\s+\d+,\s+\d{4}\s+\d+")
+PARAGRAPH_BREAK_RE = compile_pattern(r'\n\s*\n')
+BIOGRAPHY_PARAGRAPH_END_RE = compile_pattern(r"\n\s*\n|\n[A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)+|\Z")
+
+
+def iter_registered_patterns():
+    """
+    Kayıt defterindeki tüm derlenmiş kalıpları (isim, kalıp) çiftleri olarak döndür.
+    Kalıp denetimi ve kıyaslama araçları tarafından kullanılır.
+    """
+    for name, value in sorted(globals().items()):
+        if not name.isupper():
+            continue
+        if is_compiled_pattern(value):
+            yield name, value
+        elif isinstance(value, list) and value and all(is_compiled_pattern(item) for item in value):
+            for index, pattern in enumerate(value):
+                yield f"{name}[{index}]", pattern
@@ -0,0 +1,254 @@
+import os
+import math
+import atexit
+import logging
+import threading
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+from pypdf import PdfReader
+from app.utils.extraction_backends import backend_order, extract_page_text, extract_pages_text
+
+# PyMuPDF (fitz) kütüphanesini import et
+try:
+    import fitz  # PyMuPDF
+    HAVE_PYMUPDF = True
+except ImportError:
+    HAVE_PYMUPDF = False
+    logging.warning("PyMuPDF (fitz) kütüphanesi yüklü değil. Sayfa blokları ve başlık tespiti yapılamayacak.")
+
+# Paralel sayfa metni çıkarımı ayarları - ortam değişkenleri ile yapılandırılabilir
+# Her web işçisi kendi havuzunu oluşturur; varsayılan işçi sayısı sunucuyu aşırı yüklememek için küçük tutulur
+EXTRACTION_WORKERS = int(os.environ.get('EXTRACTION_WORKERS', min(2, os.cpu_count() or 1)))
+PARALLEL_EXTRACTION_MIN_PAGES = int(os.environ.get('PARALLEL_EXTRACTION_MIN_PAGES', 100))  # bu sayfa sayısından itibaren
+PARALLEL_EXTRACTION_TASKS_PER_WORKER = int(os.environ.get('PARALLEL_EXTRACTION_TASKS_PER_WORKER', 4))
+
+_extraction_pool = None
+_extraction_pool_lock = threading.Lock()
+
+
+def detect_title(blocks):
+    """
+    İlk sayfa bloklarından makale başlığını tespit et: en büyük fontlu (5 karakterden uzun)
+    metin ve ardından gelen benzer boyutlu metinler birleştirilir.
+
+    Args:
+        blocks (list): fitz get_text("dict") blokları
+
+    Returns:
+        tuple: (başlık metni, font boyutu) - başlık bulunamazsa ("", 0)
+    """
+    title_text = ""
+    title_font_size = 0
+
+    for block in blocks:
+        for line in block.get("lines", []):
+            for span in line.get("spans", []):
+                curr_size = span.get("size", 0)
+                curr_text = span.get("text", "").strip()
+
+                if len(curr_text) > 5 and curr_size > title_font_size:
+                    title_font_size = curr_size
+                    title_text = curr_text
+                # Benzer font boyutundaki metinleri başlığa ekle
+                elif title_font_size * 0.95 < curr_size <= title_font_size * 1.05 and len(curr_text) > 1:
+                    title_text += " " + curr_text
+
+    return title_text.strip(), title_font_size
+
+
+def _extract_page_range(pdf_path, page_nums, order):
+    """Süreç havuzu işçisi: belgeyi kendi tanıtıcısıyla aç ve sayfaların (metin, arka uç) çiftlerini döndür"""
+    with ParsedPdf(pdf_path) as parsed_pdf:
+        return extract_pages_text(parsed_pdf, page_nums, order)
+
+
+def _get_extraction_pool():
+    """Büyük belgelerin sayfa metni çıkarımı için süreç havuzunu ilk kullanımda oluştur"""
+    global _extraction_pool
+    with _extraction_pool_lock:
+        if _extraction_pool is None:
+            _extraction_pool = ProcessPoolExecutor(max_workers=EXTRACTION_WORKERS)
+            logging.info(f"Metin çıkarımı süreç havuzu oluşturuldu ({EXTRACTION_WORKERS} işçi)")
+        return _extraction_pool
+
+
+def _reset_extraction_pool():
+    """Bozulan süreç havuzunu kapat; sonraki paralel çıkarımda yeni bir havuz oluşturulur"""
+    global _extraction_pool
+    with _extraction_pool_lock:
+        pool, _extraction_pool = _extraction_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+        logging.info("Metin çıkarımı süreç havuzu kapatıldı")
+
+
+# Süreç sonlanırken havuzu kapat
+atexit.register(_reset_extraction_pool)
+
+
+class ParsedPdf:
+    """
+    İstek süresince paylaşılan, bir kez ayrıştırılmış PDF.
+
+    Açık fitz belgesi, pypdf okuyucusu, sayfa metinleri (bkz. extraction_backends), sayfa blokları
+    (get_text("dict")) ve başlık ilk kullanımda hesaplanır ve sonraki aşamalar (metin çıkarımı, sayfa düzeni analizi,
+    anonimleştirme) aynı nesneleri kullanır. anonymize_pdf fitz belgesine sansür uyguladığı için
+    son tüketici olmalıdır.
+
+    Bağlam yöneticisi olarak kullanılabilir; kapatıldığında açık belgeler serbest bırakılır.
+    """
+
+    def __init__(self, pdf_path):
+        """
+        Args:
+            pdf_path (str): PDF dosya yolu (dosya ilk kullanımda açılır)
+        """
+        self.path = pdf_path
+        self._fitz_doc = None
+        self._reader = None
+        self._page_texts = {}
+        self._page_backends = {}
+        self._backend_order = backend_order()
+        self._page_blocks = {}
+        self._title = None
+
+    @classmethod
+    def wrap(cls, source):
+        """
+        ParsedPdf veya dosya yolu kabul et.
+
+        Returns:
+            tuple: (ParsedPdf, çağıranın kapatması gerekiyorsa True)
+        """
+        if isinstance(source, cls):
+            return source, False
+        return cls(source), True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def fitz_doc(self):
+        """Açık fitz belgesi (PyMuPDF yoksa None)"""
+        if self._fitz_doc is None and HAVE_PYMUPDF:
+            self._fitz_doc = fitz.open(self.path)
+        return self._fitz_doc
+
+    @property
+    def reader(self):
+        """pypdf okuyucusu"""
+        if self._reader is None:
+            self._reader = PdfReader(self.path)
+        return self._reader
+
+    def __len__(self):
+        doc = self.fitz_doc
+        return len(doc) if doc is not None else len(self.reader.pages)
+
+    def page_text(self, page_num):
+        """
+        Sayfa metni (bir kez çıkarılır): varsayılan arka uç PyMuPDF, sayfa boş veya bozuk
+        çıkarsa yalnızca o sayfa için yedek arka uçlar denenir
+        """
+        text = self._page_texts.get(page_num)
+        if text is None:
+            text, backend = extract_page_text(self, page_num, self._backend_order)
+            self._page_texts[page_num] = text
+            self._page_backends[page_num] = backend
+        return text
+
+    def page_texts(self):
+        """
+        Tüm sayfaların metinleri, sayfa sırasıyla.
+
+        Henüz çıkarılmamış sayfa sayısı PARALLEL_EXTRACTION_MIN_PAGES'e ulaşırsa sayfalar ardışık
+        aralıklara bölünüp süreç havuzunda çıkarılır; her işçi belgeyi kendisi açar ve sonuçlar
+        sayfa sırasıyla önbelleğe yazılır. Aksi halde eksik sayfalar tek seferde çıkarılır (yedek
+        arka uçlar yalnızca gereken sayfalar için birer kez çalışır).
+        """
+        page_count = len(self)
+        missing = [page_num for page_num in range(page_count) if page_num not in self._page_texts]
+        if EXTRACTION_WORKERS > 1 and len(missing) >= PARALLEL_EXTRACTION_MIN_PAGES:
+            self._extract_pages_parallel(missing)
+            missing = [page_num for page_num in missing if page_num not in self._page_texts]
+        if missing:
+            for page_num, (text, backend) in zip(missing, extract_pages_text(self, missing, self._backend_order)):
+                self._page_texts[page_num] = text
+                self._page_backends[page_num] = backend
+        return [self._page_texts[page_num] for page_num in range(page_count)]
+
+    def _extract_pages_parallel(self, page_nums):
+        """Sayfaları süreç havuzunda çıkar; havuz kullanılamazsa sayfalar sırayla çıkarılır (page_text)"""
+        chunk_size = max(1, math.ceil(len(page_nums) / (EXTRACTION_WORKERS * PARALLEL_EXTRACTION_TASKS_PER_WORKER)))
+        chunks = [page_nums[i:i + chunk_size] for i in range(0, len(page_nums), chunk_size)]
+        try:
+            results = _get_extraction_pool().map(_extract_page_range, repeat(self.path), chunks,
+                                                 repeat(self._backend_order))
+            for chunk, chunk_results in zip(chunks, results):
+                for page_num, (text, backend) in zip(chunk, chunk_results):
+                    self._page_texts[page_num] = text
+                    self._page_backends[page_num] = backend
+            logging.info(f"{len(page_nums)} sayfanın metni {len(chunks)} parça halinde {EXTRACTION_WORKERS} işçili "
+                         f"süreç havuzunda çıkarıldı")
+        except Exception as e:
+            logging.warning(f"Paralel metin çıkarımı başarısız oldu, sayfalar sırayla çıkarılacak: {str(e)}")
+            _reset_extraction_pool()
+
+    def page_backend(self, page_num):
+        """Sayfa metninin çıkarıldığı arka uç (metin henüz çıkarılmadıysa None)"""
+        return self._page_backends.get(page_num)
+
+    def page_blocks(self, page_num):
+        """Sayfanın fitz get_text("dict") blokları (bir kez okunur; PyMuPDF yoksa boş liste)"""
+        blocks = self._page_blocks.get(page_num)
+        if blocks is None:
+            doc = self.fitz_doc
+            blocks = doc[page_num].get_text("dict")["blocks"] if doc is not None else []
+            self._page_blocks[page_num] = blocks
+        return blocks
+
+    def layout_pages(self):
+        """
+        Tüm sayfaların blokları ve boyutları.
+
+        Returns:
+            list: {"page", "width", "height", "blocks"} sözlükleri (PyMuPDF yoksa boş liste)
+        """
+        doc = self.fitz_doc
+        if doc is None:
+            return []
+        pages = []
+        for page in doc:
+            pages.append({
+                "page": page.number,
+                "width": page.rect.width,
+                "height": page.rect.height,
+                "blocks": self.page_blocks(page.number)
+            })
+        return pages
+
+    @property
+    def title(self):
+        """İlk sayfadaki makale başlığı ve font boyutu: (metin, boyut)"""
+        if self._title is None:
+            self._title = ("", 0)
+            if self.fitz_doc is not None and len(self.fitz_doc) > 0:
+                self._title = detect_title(self.page_blocks(0))
+        return self._title
+
+    def close(self):
+        """Açık belgeleri kapat ve önbelleğe alınmış sayfa verilerini bırak"""
+        if self._fitz_doc is not None:
+            self._fitz_doc.close()
+            self._fitz_doc = None
+        if self._reader is not None:
+            stream = getattr(self._reader, "stream", None)
+            if stream is not None and not stream.closed:
+                stream.close()
+            self._reader = None
+        self._page_texts.clear()
+        self._page_backends.clear()
+        self._page_blocks.clear()
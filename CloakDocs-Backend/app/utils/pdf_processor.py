@@ -1,12 +1,12 @@
 import os
 import re
-import PyPDF2
-import spacy
-from pdfminer.high_level import extract_text
 import yake
 import logging
 from typing import List, Dict, Union, Tuple, Optional
 import traceback
+from app.utils.nlp_models import get_nlp
+from app.utils.pdf_document import ParsedPdf
+from app.utils.extraction_cache import get_extracted_text
 
 # Logging configuration
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -18,14 +18,6 @@ class PdfProcessor:
     """
     
     def __init__(self):
-        # Load SpaCy model
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-            logger.info("SpaCy model loaded: en_core_web_sm")
-        except Exception as e:
-            logger.error(f"Error loading SpaCy model: {e}")
-            self.nlp = None
-            
         # Configure YAKE keyword extractor
         try:
             self.yake_extractor = yake.KeywordExtractor(
@@ -73,48 +65,46 @@ class PdfProcessor:
             "deep learning": ["deep", "learning"]
         }
     
-    def extract_text_from_pdf(self, pdf_path: str) -> str:
+    @property
+    def nlp(self):
+        """
+        SpaCy model shared with the entity detector, loaded lazily once per process
+        """
+        return get_nlp()
+    
+    def extract_text_from_pdf(self, pdf: Union[str, ParsedPdf]) -> str:
         """
         Extract text from a PDF file
         
         Args:
-            pdf_path: Full path to the PDF file
+            pdf: Full path to the PDF file or a ParsedPdf shared with other stages
             
         Returns:
             str: Extracted text from the PDF
         """
+        parsed_pdf, owned = ParsedPdf.wrap(pdf)
+        pdf_path = parsed_pdf.path
         try:
             logger.info(f"Extracting text from PDF: {pdf_path}")
             
-            # First try with PyPDF2
-            try:
-                text = ""
-                with open(pdf_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    for page_num in range(len(pdf_reader.pages)):
-                        page = pdf_reader.pages[page_num]
-                        text += page.extract_text() + "\n"
-                
-                if text.strip():
-                    logger.info(f"Text successfully extracted with PyPDF2 ({len(text)} characters)")
-                    return text
-            except Exception as e:
-                logger.warning(f"Error extracting text with PyPDF2: {e}")
-            
-            # If PyPDF2 fails, try with pdfminer.six
-            try:
-                text = extract_text(pdf_path)
-                if text.strip():
-                    logger.info(f"Text successfully extracted with pdfminer.six ({len(text)} characters)")
-                    return text
-            except Exception as e:
-                logger.error(f"Error extracting text with pdfminer.six: {e}")
+            # Full text shared with the anonymization endpoints: read from the extraction cache
+            # when the same file was extracted before, otherwise extracted page by page
+            # (PyMuPDF by default, see extraction_backends) and stored for later requests
+            text = get_extracted_text(parsed_pdf)["full_text"]
+            
+            if text.strip():
+                logger.info(f"Text successfully extracted ({len(text)} characters)")
+                return text
             
+            logger.warning(f"No text could be extracted from PDF: {pdf_path}")
             return ""
             
         except Exception as e:
             logger.error(f"General error extracting text from PDF: {e}")
             return ""
+        finally:
+            if owned:
+                parsed_pdf.close()
     
     def extract_keywords_section(self, text: str) -> str:
         """
@@ -0,0 +1,170 @@
+import hashlib
+import logging
+from app.utils.string_index import StringIndex
+from app.utils.indexed_document import IndexedDocument
+from app.utils.text_extractor import section_text
+from app.utils.entity_detector import (
+    detect_entities, normalize_and_filter_entities, add_keyword_sections_to_excluded_text, log_entity_stats,
+    DETECTION_STAGES
+)
+
+ENTITY_TYPES = ('author_name', 'contact_info', 'institution_info')
+
+
+def split_section_pages(section_text, offsets):
+    """
+    Bölüm metnini sayfalara ayır.
+
+    Args:
+        section_text (str): Bölüm metni (ör. main_content)
+        offsets (list): text_extractor'ın döndürdüğü (sayfa_no, başlangıç_pozisyonu) çiftleri
+
+    Returns:
+        list: (sayfa_no, sayfa_metni) çiftleri, sayfa sırasıyla
+    """
+    offsets = sorted(offsets or [], key=lambda item: item[1])
+    pages = []
+    for index, (page, start) in enumerate(offsets):
+        end = offsets[index + 1][1] if index + 1 < len(offsets) else len(section_text)
+        pages.append((page, section_text[start:end]))
+    return pages
+
+
+def compute_page_fingerprints(extracted_text):
+    """
+    Her sayfa için içerik parmak izi hesapla.
+
+    Parmak izi sayfanın ana içerik ve hariç tutulan bölüm parçalarından oluşur; ilk sayfada
+    yazar tespitinde kullanılan ilk sayfa ve başlık metinleri de dahil edilir.
+
+    Returns:
+        list: Sayfa sırasıyla SHA-256 özetleri
+    """
+    page_offsets = extracted_text.get("page_offsets", {})
+    main_pages = split_section_pages(section_text(extracted_text, "main_content"), page_offsets.get("main_content"))
+    excluded_pages = dict(split_section_pages(section_text(extracted_text, "excluded_sections"),
+                                              page_offsets.get("excluded_sections")))
+
+    fingerprints = []
+    for page, main_text in main_pages:
+        parts = [main_text, excluded_pages.get(page, "")]
+        if page == 0:
+            parts.extend([section_text(extracted_text, "first_page"), section_text(extracted_text, "header_sections")])
+        fingerprints.append(hashlib.sha256("\f".join(parts).encode("utf-8")).hexdigest())
+    return fingerprints
+
+
+def build_page_record(extracted_text, entities):
+    """
+    Sonraki revizyonlarda yeniden kullanılmak üzere sayfa parmak izlerini ve her sayfada
+    geçen varlıkları kaydet. Sayfa sınırına taşan bir geçiş, başladığı sayfaya atanır.
+
+    Returns:
+        dict: {"fingerprints": [...], "page_entities": [{varlık_tipi: [...]}, ...]}
+    """
+    main_content = section_text(extracted_text, "main_content")
+    page_offsets = extracted_text.get("page_offsets", {}).get("main_content")
+    main_pages = split_section_pages(main_content, page_offsets)
+    document = IndexedDocument(main_content, page_offsets)
+
+    # Varlıkların ana içerikteki geçişlerini tek taramada bul ve sayfalara dağıt
+    occurrences = StringIndex(value for values in entities.values() for value in values).find_all(document.text)
+    pages_by_value = {value: {document.page_of(position) for position in positions}
+                      for value, positions in occurrences.items()}
+
+    page_entities = []
+    for page, _ in main_pages:
+        page_entities.append({key: [value for value in values if page in pages_by_value.get(value, ())]
+                              for key, values in entities.items()})
+
+    return {
+        "fingerprints": compute_page_fingerprints(extracted_text),
+        "page_entities": page_entities
+    }
+
+
+def detect_entities_for_revision(extracted_text, options, previous_record, layout_blocks=None, deadline_ms=None,
+                                 stage_report=None, identity_index=None):
+    """
+    Revizyon için varlık tespiti: yalnızca yeni veya değişmiş sayfalarda tespit yapılır,
+    değişmemiş sayfaların varlıkları önceki sürümün sayfa kaydından alınır.
+
+    Sayfalar parmak izleriyle eşleştirilir; böylece araya sayfa eklenmesi veya çıkarılması
+    sonraki sayfaların yeniden işlenmesine yol açmaz. Birleştirilen varlıklar son olarak
+    revizyonun tam metni üzerinde normalize edilir ve filtrelenir.
+
+    Args:
+        extracted_text (dict): Revizyonun text_extractor çıktısı
+        options (list): Anonimleştirme seçenekleri
+        previous_record (dict): Önceki sürümün build_page_record çıktısı
+        layout_blocks (list, optional): Revizyonun sınıflandırılmış sayfa düzeni blokları
+        deadline_ms, stage_report, identity_index: detect_entities'e aynen iletilir (değişen sayfaların tespiti için)
+
+    Returns:
+        tuple: (varlıklar, değişen sayfa numaraları listesi)
+    """
+    main_content = section_text(extracted_text, "main_content")
+    page_offsets = extracted_text.get("page_offsets", {}).get("main_content")
+    main_pages = split_section_pages(main_content, page_offsets)
+    fingerprints = compute_page_fingerprints(extracted_text)
+
+    previous_pages = {}
+    for fingerprint, page_entities in zip(previous_record.get("fingerprints", []), previous_record.get("page_entities", [])):
+        previous_pages.setdefault(fingerprint, page_entities)
+
+    reused = {key: [] for key in ENTITY_TYPES}
+    changed_pages = []
+    for (page, _), fingerprint in zip(main_pages, fingerprints):
+        page_entities = previous_pages.get(fingerprint)
+        if page_entities is None:
+            changed_pages.append(page)
+            continue
+        for key in options:
+            for value in page_entities.get(key, []):
+                if value not in reused[key]:
+                    reused[key].append(value)
+
+    logging.info(f"Revizyon: {len(main_pages)} sayfanın {len(changed_pages)} tanesi yeni veya değişmiş")
+
+    merged = {key: list(values) for key, values in reused.items()}
+    excluded_sections = section_text(extracted_text, "excluded_sections")
+    if stage_report is not None:
+        stage_report.update({"deadline_ms": deadline_ms, "completed_stages": list(DETECTION_STAGES),
+                             "skipped_stages": [], "partial": False})
+    if changed_pages:
+        # Yalnızca değişen sayfaların metni üzerinde tespit yap
+        changed_set = set(changed_pages)
+        changed_text = ""
+        changed_offsets = []
+        for page, page_text in main_pages:
+            if page in changed_set:
+                changed_offsets.append((page, len(changed_text)))
+                changed_text += page_text
+
+        first_page_changed = 0 in changed_set
+        changed_blocks = [block for block in layout_blocks or [] if block.get("page") in changed_set] or None
+
+        detected = detect_entities(
+            changed_text,
+            options,
+            excluded_sections,
+            section_text(extracted_text, "first_page") if first_page_changed else "",
+            section_text(extracted_text, "header_sections") if first_page_changed else "",
+            layout_blocks=changed_blocks,
+            page_offsets=changed_offsets,
+            deadline_ms=deadline_ms,
+            stage_report=stage_report,
+            identity_index=identity_index
+        )
+
+        for key, values in detected.items():
+            existing = merged.setdefault(key, [])
+            merged[key] = list(values) + [value for value in existing if value not in values]
+
+    # Birleştirilmiş varlıkları revizyonun tam metni üzerinde filtrele
+    document = IndexedDocument(main_content, page_offsets, extracted_text.get("section_offsets"))
+    excluded_text = add_keyword_sections_to_excluded_text(document, excluded_sections)
+    entities = normalize_and_filter_entities(merged, document, excluded_text)
+    log_entity_stats(entities)
+
+    return entities, changed_pages
@@ -0,0 +1,175 @@
+import os
+import re
+import logging
+from collections import namedtuple, defaultdict
+from app.utils.text_normalizer import normalize_text
+
+# PyMuPDF (fitz) kütüphanesini import et
+try:
+    import fitz  # PyMuPDF
+    HAVE_PYMUPDF = True
+except ImportError:
+    HAVE_PYMUPDF = False
+    logging.warning("PyMuPDF (fitz) kütüphanesi yüklü değil. Kayan başlık/altbilgi tespiti yapılamayacak.")
+
+# Kayan başlık/altbilgi tespiti ayarları - ortam değişkenleri ile yapılandırılabilir
+RUNNING_BAND_RATIO = float(os.environ.get('RUNNING_BAND_RATIO', 0.1))  # sayfa üstü/altı bant yüksekliği
+RUNNING_ELEMENT_MIN_PAGES = int(os.environ.get('RUNNING_ELEMENT_MIN_PAGES', 3))
+RUNNING_ELEMENT_MIN_RATIO = float(os.environ.get('RUNNING_ELEMENT_MIN_RATIO', 0.3))  # tek/çift sayfa başlıkları için
+
+# Sayfa numaraları her sayfada değiştiği için satırlar rakamlar atılarak karşılaştırılır
+DIGITS_RE = re.compile(r"\d+")
+
+# Arama anahtarından atılan karakterler: boşluklar, tireler ve yumuşak tire
+SEARCH_KEY_STRIP_RE = re.compile(r"[\s\-\u00ad]+")
+
+# Bant satırı: metin, satır dikdörtgeni, karakter kutuları ve baskın font boyutu/rengi
+BandLine = namedtuple('BandLine', ['page', 'band', 'text', 'rect', 'char_boxes', 'size', 'color'])
+
+# Tek bir sayfadaki kayan öğe sansürü
+RunningRedaction = namedtuple('RunningRedaction', ['rect', 'entity', 'size', 'color'])
+
+
+def normalize_whitespace(text):
+    """Satır sonları ve ardışık boşlukları tek boşluğa indir"""
+    return " ".join(text.split())
+
+
+def extract_band_lines(page, band_ratio=RUNNING_BAND_RATIO):
+    """
+    Sayfanın üst ve alt bantlarındaki satırları karakter kutularıyla birlikte oku.
+
+    Args:
+        page (fitz.Page): PDF sayfası
+        band_ratio (float): Bant yüksekliğinin sayfa yüksekliğine oranı
+
+    Returns:
+        list: BandLine listesi
+    """
+    page_rect = page.rect
+    band_height = page_rect.height * band_ratio
+    bands = (
+        ("top", fitz.Rect(page_rect.x0, page_rect.y0, page_rect.x1, page_rect.y0 + band_height)),
+        ("bottom", fitz.Rect(page_rect.x0, page_rect.y1 - band_height, page_rect.x1, page_rect.y1)),
+    )
+
+    lines = []
+    for band, clip in bands:
+        for block in page.get_text("rawdict", clip=clip)["blocks"]:
+            for line in block.get("lines", []):
+                chars = []
+                size = 0
+                color = 0
+                for span in line.get("spans", []):
+                    span_chars = span.get("chars", [])
+                    if span_chars and not size:
+                        size = span.get("size", 0)
+                        color = span.get("color", 0)
+                    chars.extend((char["c"], char["bbox"]) for char in span_chars)
+                text = "".join(c for c, _ in chars)
+                if text.strip():
+                    lines.append(BandLine(page.number, band, text, fitz.Rect(line["bbox"]),
+                                          [bbox for _, bbox in chars], size, color))
+    return lines
+
+
+def find_running_elements(doc, band_ratio=RUNNING_BAND_RATIO):
+    """
+    Sayfaların üst/alt bantlarındaki satırları rakamsız metinlerine göre grupla ve birden fazla
+    sayfada tekrar edenleri (kayan başlık, altbilgi) döndür.
+
+    Args:
+        doc (fitz.Document): Açık PDF belgesi
+        band_ratio (float): Bant yüksekliğinin sayfa yüksekliğine oranı
+
+    Returns:
+        dict: {(bant, rakamsız metin): [BandLine, ...]} - yalnızca tekrar eden öğeler
+    """
+    min_pages = max(RUNNING_ELEMENT_MIN_PAGES, int(len(doc) * RUNNING_ELEMENT_MIN_RATIO))
+
+    groups = defaultdict(list)
+    for page in doc:
+        for line in extract_band_lines(page, band_ratio):
+            key = (line.band, DIGITS_RE.sub("#", normalize_whitespace(line.text)))
+            groups[key].append(line)
+
+    return {key: lines for key, lines in groups.items()
+            if len({line.page for line in lines}) >= min_pages}
+
+
+def entity_rect(line, entity):
+    """
+    Varlığın satır içindeki dikdörtgeni - karakter kutularının birleşimi.
+    Varlık satırda birebir geçmiyorsa None.
+    """
+    index = line.text.find(entity)
+    if index < 0:
+        return None
+    rect = fitz.Rect(line.char_boxes[index])
+    for bbox in line.char_boxes[index + 1:index + len(entity)]:
+        rect.include_rect(fitz.Rect(bbox))
+    return rect
+
+
+def plan_running_redactions(doc, entities, band_ratio=RUNNING_BAND_RATIO):
+    """
+    Kayan başlık ve altbilgilerde geçen varlıkların tüm sayfalardaki sansür dikdörtgenlerini
+    tek seferde hesapla.
+
+    Tekrar eden öğeler bir kez bulunur; her öğe için varlıklar öğe metninde aranır ve konumlar
+    her sayfanın karakter kutularından alınır. Böylece aynı dize her sayfada search_for ile
+    yeniden aranmaz.
+
+    Args:
+        doc (fitz.Document): Açık PDF belgesi
+        entities (iterable): Sansürlenecek varlık metinleri
+        band_ratio (float): Bant yüksekliğinin sayfa yüksekliğine oranı
+
+    Returns:
+        tuple: ({sayfa_no: [RunningRedaction, ...]}, {sayfa_no: [kayan öğe satır metinleri]})
+    """
+    redactions = defaultdict(list)
+    running_lines = defaultdict(list)
+    if not HAVE_PYMUPDF or len(doc) < RUNNING_ELEMENT_MIN_PAGES:
+        return redactions, running_lines
+
+    entities = [entity for entity in entities if entity]
+    elements = find_running_elements(doc, band_ratio)
+
+    for (band, key_text), lines in elements.items():
+        for line in lines:
+            running_lines[line.page].append(line.text)
+
+        # Rakamsız öğe metninde geçmeyen varlıklar bu öğenin hiçbir sayfasında geçmez
+        element_entities = [entity for entity in entities if DIGITS_RE.sub("#", entity) in key_text]
+        for line in lines:
+            for entity in element_entities:
+                rect = entity_rect(line, entity)
+                if rect is not None:
+                    redactions[line.page].append(RunningRedaction(rect, entity, line.size, line.color))
+
+    if elements:
+        redaction_count = sum(len(items) for items in redactions.values())
+        logging.info(f"Kayan başlık/altbilgi: {len(elements)} tekrar eden öğe, "
+                     f"{redaction_count} sansür alanı {len(redactions)} sayfa için tek seferde hesaplandı")
+
+    return redactions, running_lines
+
+
+def search_key(text):
+    """
+    page.search_for ile uyumlu karşılaştırma anahtarı: büyük/küçük harf duyarsız, bitişik
+    harfleri açılmış, boşluk ve satır sonu tirelerinden bağımsız
+    """
+    return SEARCH_KEY_STRIP_RE.sub("", normalize_text(text).text).lower()
+
+
+def remove_running_text(page_text, running_lines):
+    """
+    Sayfa metninden kayan öğe satırlarını çıkar ve kalan metnin search_key biçimini döndür.
+    Kalan metinde geçmeyen varlıklar için sayfada ayrıca arama yapılmasına gerek yoktur.
+    """
+    remaining = search_key(page_text)
+    for line_text in running_lines:
+        remaining = remaining.replace(search_key(line_text), "", 1)
+    return remaining
@@ -0,0 +1,135 @@
+import logging
+from collections import deque
+
+# pyahocorasick (C eklentisi) varsa kullan, yoksa saf Python otomatına geri dön
+try:
+    import ahocorasick
+    HAVE_PYAHOCORASICK = True
+except ImportError:
+    HAVE_PYAHOCORASICK = False
+    logging.info("pyahocorasick kütüphanesi yüklü değil. Saf Python Aho-Corasick otomatı kullanılacak.")
+
+
+class StringIndex:
+    """
+    Sabit bir metin kümesi üzerine kurulan Aho-Corasick otomatı.
+
+    Tüm aday metinlerin bir metindeki bütün (örtüşenler dahil) geçişleri tek taramada bulunur;
+    aday sayısı arttıkça tarama süresi metin uzunluğu ve eşleşme sayısıyla doğrusal kalır.
+    """
+
+    def __init__(self, patterns):
+        """
+        Args:
+            patterns (iterable): İndekslenecek metinler (boş metinler ve tekrarlar yok sayılır)
+        """
+        self.patterns = list(dict.fromkeys(p for p in patterns if p))
+        self._lengths = [len(p) for p in self.patterns]
+
+        if HAVE_PYAHOCORASICK:
+            self._automaton = ahocorasick.Automaton()
+            for index, pattern in enumerate(self.patterns):
+                self._automaton.add_word(pattern, index)
+            if self.patterns:
+                self._automaton.make_automaton()
+        else:
+            self._build()
+
+    def _build(self):
+        """Saf Python otomatı: trie, hata (failure) bağlantıları ve birleştirilmiş çıktı listeleri"""
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(index)
+
+        # Hata bağlantılarını genişlik öncelikli olarak hesapla
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def iter_matches(self, text):
+        """
+        Metindeki tüm geçişleri üret.
+
+        Yields:
+            tuple: (başlangıç_pozisyonu, metin) - bitiş pozisyonuna göre sıralı
+        """
+        if not text or not self.patterns:
+            return
+
+        if HAVE_PYAHOCORASICK:
+            for end, index in self._automaton.iter(text):
+                yield end - self._lengths[index] + 1, self.patterns[index]
+            return
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in output[state]:
+                yield position - self._lengths[index] + 1, self.patterns[index]
+
+    def find_all(self, text):
+        """
+        Her metnin tüm geçiş pozisyonlarını bul.
+
+        Returns:
+            dict: {metin: [başlangıç pozisyonları (artan sırada)]} - geçmeyen metinler yer almaz
+        """
+        occurrences = {}
+        for start, pattern in self.iter_matches(text):
+            occurrences.setdefault(pattern, []).append(start)
+        for positions in occurrences.values():
+            positions.sort()
+        return occurrences
+
+    def contained_patterns(self):
+        """
+        Kümedeki başka bir metnin içinde (kendisinden farklı olarak) geçen metinleri döndür.
+
+        Returns:
+            set: Başka bir metnin alt metni olan metinler
+        """
+        contained = set()
+        for pattern in self.patterns:
+            for start, found in self.iter_matches(pattern):
+                if found != pattern:
+                    contained.add(found)
+        return contained
+
+
+def find_contained_strings(strings):
+    """
+    Verilen metinlerden, listedeki başka bir metnin alt metni olanları bul.
+
+    Args:
+        strings (iterable): Metinler
+
+    Returns:
+        set: Daha uzun bir metnin içinde geçen metinler
+    """
+    return StringIndex(strings).contained_patterns()
@@ -1,155 +1,212 @@
 import os
-from pypdf import PdfReader
-import re
 import logging
+from app.utils.patterns import (
+    EXCLUDED_SECTION_RE, SECTION_HEADER_SCANNER_RE, HEADER_CONTEXT_RE, HEADER_CONTEXT_RES, TITLE_MARKER_RE,
+    TITLE_MARKER_RES
+)
+from app.utils.text_normalizer import normalize_text
+from app.utils.pdf_document import ParsedPdf
 
+SECTION_NAMES = ("main_content", "excluded_sections", "first_page", "header_sections")
 
-def extract_text_from_pdf(pdf_path):
-    """Extract text from PDF and separate into sections"""
-    full_text = ""
-    sections = {
-        "main_content": "",
-        "excluded_sections": "",  # References, acknowledgements, introduction, etc.
-        "first_page": "",         # First page content for author identification
-        "header_sections": ""     # Title, author info, abstract sections
-    }
-    
-    # Define sections to exclude from anonymization (English only)
-    excluded_section_patterns = [
-        r"(?i)INTRODUCTION",
-        r"(?i)RELATED\s+WORKS?",
-        r"(?i)REFERENCES",
-        r"(?i)BIBLIOGRAPHY",
-        r"(?i)ACKNOWLEDGEMENTS?",
-        r"(?i)CITED\s+REFERENCES"
-    ]
-    
-    # Daha kapsamlı referans bölümü tanımlama desenleri
-    reference_section_patterns = [
-        r"(?i)^\s*REFERENCES\s*$",
-        r"(?i)^\s*BIBLIOGRAPHY\s*$",
-        r"(?i)^\s*CITED\s+REFERENCES\s*$",
-        r"(?i)^\s*REFERANSLAR\s*$",
-        r"(?i)^\s*KAYNAKLAR\s*$",
-        r"(?i)^\s*KAYNAKÇA\s*$",
-        r"(?i)^\s*REFERENCES\s+AND\s+CITATIONS\s*$"
-    ]
-    
-    # Regex pattern to identify section headers
-    section_header_pattern = r"(?i)^\s*(?:\d+\.)*\s*([A-Za-z\s]+)$"
+# Başlık göstergesinden sonra başlık alanına alınan en fazla satır ve karakter sayısı
+TITLE_EXCERPT_LINES = 10
+TITLE_EXCERPT_CHARS = 1000
+
+
+def _add_span(section_spans, section_lengths, name, text, offset, start, end, blank_line=False):
+    """
+    Sayfa metninin [start, end) aralığını bölüme ekle.
+
+    Args:
+        section_spans (dict): {bölüm: [[başlangıç, bitiş, ek_satır_sonu], ...]} - tam metin üzerindeki aralıklar
+        section_lengths (dict): {bölüm: birleştirilmiş bölüm metninin uzunluğu}
+        text (str): Sayfa metni
+        offset (int): Sayfanın tam metindeki başlangıç pozisyonu
+        start, end (int): Sayfa metni içindeki aralık
+        blank_line (bool): Bölüm metninde aralığın ardına boş satır eklensin mi (sayfanın son
+            parçalarında; anahtar kelime bölümü gibi paragraf kalıpları sayfa sonunda biter)
+    """
+    if end <= start:
+        return
+    trailing_newlines = (0 if text[end - 1] == "\n" else 1) + (1 if blank_line else 0)
+    spans = section_spans[name]
+    # Ek satır sonu olmayan bir aralığın hemen ardından gelen aralık onunla birleştirilir
+    if spans and spans[-1][1] == offset + start and not spans[-1][2]:
+        spans[-1][1] = offset + end
+        spans[-1][2] = trailing_newlines
+    else:
+        spans.append([offset + start, offset + end, trailing_newlines])
+    section_lengths[name] += end - start + trailing_newlines
+
+
+def section_text(extracted_text, name):
+    """
+    Bölüm metnini extract_text_from_pdf çıktısındaki aralıklardan oluştur; her parçanın
+    ardına aralıkta kayıtlı sayıda satır sonu eklenir.
+
+    Args:
+        extracted_text (dict): extract_text_from_pdf çıktısı
+        name (str): SECTION_NAMES'ten bölüm adı
+
+    Returns:
+        str: Bölüm metni
+    """
+    full_text = extracted_text["full_text"]
+    parts = []
+    for start, end, trailing_newlines in extracted_text["section_spans"][name]:
+        parts.append(full_text[start:end])
+        if trailing_newlines:
+            parts.append("\n" * trailing_newlines)
+    return "".join(parts)
+
+
+def get_sections(extracted_text):
+    """Tüm bölüm metinleri: {bölüm: metin} (yalnızca gereken bölümler için section_text tercih edilmeli)"""
+    return {name: section_text(extracted_text, name) for name in SECTION_NAMES}
+
+
+def extract_text_from_pdf(pdf):
+    """
+    Extract text from PDF and separate into sections
+    pdf: PDF dosya yolu veya istek boyunca paylaşılan ParsedPdf (sayfa metinleri onda saklanır)
+
+    Bölümler kopyalanmaz; her bölüm tam metin üzerindeki [başlangıç, bitiş) aralıklarıyla
+    döndürülür (bkz. section_text). Sayfa metinleri bir listede toplanır ve sonda tek seferde
+    birleştirilir; bölüm başlıkları her sayfada birleşik tek bir kalıpla taranır.
+
+    Returns:
+        dict: {
+            "full_text": normalize edilmiş tam metin,
+            "section_spans": {bölüm: [[başlangıç, bitiş, ek_satır_sonu], ...]},
+            "page_offsets": {"main_content"/"excluded_sections": [(sayfa_no, bölüm metnindeki pozisyon)]},
+            "section_offsets": [(başlık, ana içerik metnindeki pozisyon)]
+        }
+    """
+    page_texts = []
+    position = 0
+    # main_content: ana içerik, excluded_sections: references, acknowledgements, introduction, etc.
+    # first_page: first page content for author identification, header_sections: title, author info, abstract
+    section_spans = {name: [] for name in SECTION_NAMES}
+    section_lengths = {name: 0 for name in SECTION_NAMES}
     
-    # Author context phrases - these indicate high probability of author names nearby
-    author_context_phrases = [
-        r"(?i)corresponding author",
-        r"(?i)author(s)?[:]?",
-        r"(?i)prepared by",
-        r"(?i)written by",
-        r"(?i)submitted by",
-        r"(?i)affiliation",
-        r"(?i)department of",
-        r"(?i)faculty of",
-        r"(?i)school of",
-        r"(?i)university of",
-        r"(?i)institute of",
-        r"(?i)contact[:]?"
-    ]
+    # Bölüm metinlerinde her sayfanın başladığı pozisyon: {bölüm: [(sayfa_no, pozisyon)]}
+    page_offsets = {"main_content": [], "excluded_sections": []}
+    # Ana içerikteki bölüm başlıklarının pozisyonları: [(başlık, pozisyon)]
+    section_offsets = []
     
-    # Title indicators
-    title_patterns = [
-        r"(?i)^ABSTRACT",
-        r"(?i)^TITLE[:]?",
-        r"(?i)^KEYWORDS[:]?"
-    ]
+    # Bölüm başlığı, referans ve yazar bağlamı kalıpları app.utils.patterns içinde önceden derlenmiştir
     
-    with open(pdf_path, "rb") as file:
-        reader = PdfReader(file)
+    parsed_pdf, owned = ParsedPdf.wrap(pdf)
+    try:
         current_section = "main_content"  # Default to main content
         in_reference_section = False  # Referanslar bölümünde olup olmadığımızı takip et
         
         # Process each page
-        for page_num, page in enumerate(reader.pages):
-            page_text = page.extract_text() + "\n"
-            full_text += page_text
+        for page_num, raw_page_text in enumerate(parsed_pdf.page_texts()):
+            # Bitişik harfler, yumuşak tireler, Unicode çeşitleri ve satır sonu tirelemesi çıkarımda
+            # bir kez normalize edilir; sonraki tüm aşamalar aynı biçimdeki metinle çalışır
+            page_text = normalize_text(raw_page_text).text + "\n"
+            page_start = position
+            page_texts.append(page_text)
+            position += len(page_text)
+            
+            for section_name, offsets in page_offsets.items():
+                offsets.append((page_num, section_lengths[section_name]))
             
             # First page is treated specially for author detection
             if page_num == 0:
-                sections["first_page"] = page_text
+                _add_span(section_spans, section_lengths, "first_page", page_text, page_start, 0, len(page_text))
                 
                 # Look for author context phrases on first page
-                for phrase in author_context_phrases:
-                    if re.search(phrase, page_text):
+                # Tek bir birleşik tarama ile ifade içeren satırları bul, sonra yalnızca bu satırlarda
+                # ifadeleri tek tek kontrol et (header_sections sırası korunur)
+                if HEADER_CONTEXT_RE.search(page_text):
+                    lines = page_text.split('\n')
+                    line_starts = [0]
+                    for line in lines:
+                        line_starts.append(line_starts[-1] + len(line) + 1)
+                    context_lines = [i for i, line in enumerate(lines) if HEADER_CONTEXT_RE.search(line)]
+                    for phrase in HEADER_CONTEXT_RES:
                         # Extract lines around author indicators for header_sections
-                        lines = page_text.split('\n')
-                        for i, line in enumerate(lines):
-                            if re.search(phrase, line):
+                        for i in context_lines:
+                            if phrase.search(lines[i]):
                                 # Add 3 lines before and 3 lines after to header_sections
                                 start_idx = max(0, i-3)
                                 end_idx = min(len(lines), i+4)
-                                sections["header_sections"] += "\n".join(lines[start_idx:end_idx]) + "\n"
+                                _add_span(section_spans, section_lengths, "header_sections", page_text, page_start,
+                                          line_starts[start_idx], min(line_starts[end_idx], len(page_text)),
+                                          blank_line=end_idx == len(lines))
                 
                 # Look for title indicators on first page
-                for pattern in title_patterns:
-                    if re.search(pattern, page_text):
+                if TITLE_MARKER_RE.search(page_text):
+                    for pattern in TITLE_MARKER_RES:
                         # Title area is likely followed by authors
-                        match_pos = [m.start() for m in re.finditer(pattern, page_text)]
-                        for pos in match_pos:
+                        for match in pattern.finditer(page_text):
                             # Extract ~10 lines after title marker
-                            excerpt = page_text[pos:pos+1000]  # Roughly 10 lines
-                            lines = excerpt.split('\n')[:10]
-                            sections["header_sections"] += "\n".join(lines) + "\n"
+                            excerpt_end = min(match.start() + TITLE_EXCERPT_CHARS, len(page_text))
+                            line_end = match.start()
+                            short_excerpt = False
+                            for _ in range(TITLE_EXCERPT_LINES):
+                                newline = page_text.find('\n', line_end, excerpt_end)
+                                if newline < 0:
+                                    short_excerpt = True
+                                    break
+                                line_end = newline + 1
+                            if not short_excerpt:
+                                excerpt_end = line_end
+                            _add_span(section_spans, section_lengths, "header_sections", page_text, page_start,
+                                      match.start(), excerpt_end,
+                                      blank_line=short_excerpt and page_text[excerpt_end - 1] == '\n')
             
-            # Referans bölümünü tespit et
-            for pattern in reference_section_patterns:
-                if re.search(pattern, page_text, re.MULTILINE):
+            if not in_reference_section:
+                # Sayfadaki başlık satırlarını tek taramada bul; referans başlığı varsa tüm sayfa
+                # (başlıktan önceki kısmı dahil) referans bölümüne aittir
+                headers = list(SECTION_HEADER_SCANNER_RE.finditer(page_text))
+                if any(match.group("reference") is not None for match in headers):
                     in_reference_section = True
                     current_section = "excluded_sections"
                     logging.info(f"Referans bölümü tespit edildi, sayfa {page_num+1}")
-                    break
             
             # Eğer referans bölümündeyse tüm metni excluded_sections'a ekle
             if in_reference_section:
-                sections["excluded_sections"] += page_text
+                _add_span(section_spans, section_lengths, "excluded_sections", page_text, page_start, 0, len(page_text))
                 continue
             
-            # Check each line in the page for section headers
-            lines = page_text.split('\n')
-            for line in lines:
-                # Is this a new section heading?
-                match = re.match(section_header_pattern, line.strip())
-                if match:
-                    section_title = match.group(1).strip().upper()
-                    
-                    # Referans bölümü kontrolü
-                    is_reference_section = False
-                    for pattern in reference_section_patterns:
-                        if re.search(pattern, line, re.IGNORECASE):
-                            current_section = "excluded_sections"
-                            in_reference_section = True
-                            is_reference_section = True
-                            break
-                    
-                    if is_reference_section:
-                        continue
-                    
-                    # Is this an excluded section?
-                    excluded = False
-                    for pattern in excluded_section_patterns:
-                        if re.search(pattern, section_title):
-                            current_section = "excluded_sections"
-                            excluded = True
-                            break
-                    
-                    # If not an excluded section, return to main content
-                    if not excluded:
-                        current_section = "main_content"
+            # Başlıklar arasındaki metin parçalarını geçerli bölüme ekle; başlık satırı yeni bölüme aittir
+            cursor = 0
+            for match in headers:
+                section_title = match.group("title").strip().upper()
+                _add_span(section_spans, section_lengths, current_section, page_text, page_start, cursor, match.start())
+                cursor = match.start()
                 
-                # Add to relevant section
-                sections[current_section] += line + "\n"
+                # Is this an excluded section?
+                if EXCLUDED_SECTION_RE.search(section_title):
+                    current_section = "excluded_sections"
+                else:
+                    # If not an excluded section, return to main content
+                    current_section = "main_content"
+                    section_offsets.append((section_title, section_lengths["main_content"]))
+            
+            # Add to relevant section
+            _add_span(section_spans, section_lengths, current_section, page_text, page_start, cursor, len(page_text),
+                      blank_line=True)
+    finally:
+        if owned:
+            parsed_pdf.close()
+    
+    full_text = "".join(page_texts)
     
     # Referanslar bölümü içeriğini günlüğe kaydet
-    if sections["excluded_sections"]:
-        ref_text_sample = sections["excluded_sections"][:200] + "..." if len(sections["excluded_sections"]) > 200 else sections["excluded_sections"]
-        logging.info(f"Anonimleştirmeden hariç tutulan bölümler tespit edildi: {len(sections['excluded_sections'])} karakter")
+    if section_spans["excluded_sections"]:
+        start, end, _ = section_spans["excluded_sections"][0]
+        ref_text_sample = full_text[start:min(end, start + 200)] + ("..." if section_lengths["excluded_sections"] > 200 else "")
+        logging.info(f"Anonimleştirmeden hariç tutulan bölümler tespit edildi: {section_lengths['excluded_sections']} karakter")
         logging.info(f"Örnek içerik: {ref_text_sample}")
     
-    return {"full_text": full_text, "sections": sections} 
\ No newline at end of file
+    return {
+        "full_text": full_text,
+        "section_spans": section_spans,
+        "page_offsets": page_offsets,
+        "section_offsets": section_offsets
+    }
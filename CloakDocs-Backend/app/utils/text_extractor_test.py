@@ -12,7 +12,8 @@ if root_dir not in sys.path:
     sys.path.insert(0, root_dir)
 
 # Kendi modüllerimizi import et
-from app.utils.text_extractor import extract_text_from_pdf
+from app.utils.text_extractor import get_sections
+from app.utils.extraction_cache import get_extracted_text
 
 def test_pdf_extraction(pdf_path, output_dir=None):
     """
@@ -44,8 +45,9 @@ def test_pdf_extraction(pdf_path, output_dir=None):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     try:
-        # PDF'den metin çıkar
-        result = extract_text_from_pdf(pdf_path)
+        # PDF'den metin çıkar (aynı dosya daha önce çıkarılmışsa önbellekten okunur)
+        result = get_extracted_text(pdf_path)
+        sections = get_sections(result)
         
         # Tam metni kaydet
         full_text_path = os.path.join(output_dir, f"{pdf_name}_full_text_{timestamp}.txt")
@@ -56,25 +58,25 @@ def test_pdf_extraction(pdf_path, output_dir=None):
         # Ana içeriği kaydet
         main_content_path = os.path.join(output_dir, f"{pdf_name}_main_content_{timestamp}.txt")
         with open(main_content_path, "w", encoding="utf-8") as f:
-            f.write(result["sections"]["main_content"])
+            f.write(sections["main_content"])
         print(f"Ana içerik kaydedildi: {main_content_path}")
         
         # Hariç tutulan bölümleri kaydet
         excluded_path = os.path.join(output_dir, f"{pdf_name}_excluded_{timestamp}.txt")
         with open(excluded_path, "w", encoding="utf-8") as f:
-            f.write(result["sections"]["excluded_sections"])
+            f.write(sections["excluded_sections"])
         print(f"Hariç tutulan bölümler kaydedildi: {excluded_path}")
         
         # İlk sayfayı kaydet
         first_page_path = os.path.join(output_dir, f"{pdf_name}_first_page_{timestamp}.txt")
         with open(first_page_path, "w", encoding="utf-8") as f:
-            f.write(result["sections"]["first_page"])
+            f.write(sections["first_page"])
         print(f"İlk sayfa kaydedildi: {first_page_path}")
         
         # Başlık bölümlerini kaydet
         header_path = os.path.join(output_dir, f"{pdf_name}_header_{timestamp}.txt")
         with open(header_path, "w", encoding="utf-8") as f:
-            f.write(result["sections"]["header_sections"])
+            f.write(sections["header_sections"])
         print(f"Başlık bölümleri kaydedildi: {header_path}")
         
         # Özet bilgileri JSON formatında kaydet
@@ -83,10 +85,10 @@ def test_pdf_extraction(pdf_path, output_dir=None):
             "timestamp": timestamp,
             "character_counts": {
                 "full_text": len(result["full_text"]),
-                "main_content": len(result["sections"]["main_content"]),
-                "excluded_sections": len(result["sections"]["excluded_sections"]),
-                "first_page": len(result["sections"]["first_page"]),
-                "header_sections": len(result["sections"]["header_sections"])
+                "main_content": len(sections["main_content"]),
+                "excluded_sections": len(sections["excluded_sections"]),
+                "first_page": len(sections["first_page"]),
+                "header_sections": len(sections["header_sections"])
             },
             "output_files": {
                 "full_text": full_text_path,
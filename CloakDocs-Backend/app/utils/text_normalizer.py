@@ -0,0 +1,150 @@
+import re
+import unicodedata
+from bisect import bisect_right
+
+# PDF metinlerinde varlık eşleşmesini bozan karakterlerin tek adımlık dönüşüm tablosu:
+# bitişik harfler (ligatür) açılır, görünmez karakterler silinir, Unicode boşluk ve tire
+# çeşitleri ASCII karşılıklarına indirilir
+NORMALIZATION_TABLE = str.maketrans({
+    "\ufb00": "ff", "\ufb01": "fi", "\ufb02": "fl", "\ufb03": "ffi", "\ufb04": "ffl", "\ufb05": "st", "\ufb06": "st",
+    "\u00ad": None,  # yumuşak tire
+    "\u200b": None, "\u200c": None, "\u200d": None, "\u2060": None, "\ufeff": None,  # sıfır genişlikli karakterler
+    "\u00a0": " ", "\u2002": " ", "\u2003": " ", "\u2009": " ", "\u200a": " ", "\u202f": " ", "\u3000": " ",
+    "\u2010": "-", "\u2011": "-", "\u2212": "-",
+})
+
+# Dönüştürülmesi gereken bölümler: ASCII olmayan karakterler ve birleşik işaret alan harfler (ardından
+# gelen birleşik işaretlerle birlikte, NFKC birleştirmesi için) ve küçük harfler arasındaki satır sonu
+# tirelemesi ("infor-\nmation")
+NORMALIZATION_SEGMENT_RE = re.compile(
+    r"[^\x00-\x7f][\u0300-\u036f]*|[A-Za-z][\u0300-\u036f]+|(?<=[a-zà-ÿğışçöü])-\n(?=[a-zà-ÿğışçöü])"
+)
+
+# Varlık metinlerindeki satır sonları ve ardışık boşluklar
+WHITESPACE_RUN_RE = re.compile(r"\s+")
+
+
+class NormalizedText:
+    """
+    Normalize edilmiş metin ve ham metne geri dönüş ofset haritası.
+
+    Harita yalnızca değiştirilen bölümlerin normalize ve ham metindeki [başlangıç, bitiş)
+    aralıklarını tutar; bölümler arasında karakterler birebir eşleşir. Konum sorguları ikili
+    arama ile yapılır.
+    """
+
+    __slots__ = ("text", "raw_text", "norm_starts", "norm_ends", "raw_starts", "raw_ends")
+
+    def __init__(self, text, raw_text, segments=()):
+        """
+        Args:
+            text (str): Normalize edilmiş metin
+            raw_text (str): Ham metin
+            segments (iterable): (normalize_başlangıç, normalize_bitiş, ham_başlangıç, ham_bitiş) dörtlüleri, sıralı
+        """
+        self.text = text
+        self.raw_text = raw_text
+        self.norm_starts = []
+        self.norm_ends = []
+        self.raw_starts = []
+        self.raw_ends = []
+        for norm_start, norm_end, raw_start, raw_end in segments:
+            self.norm_starts.append(norm_start)
+            self.norm_ends.append(norm_end)
+            self.raw_starts.append(raw_start)
+            self.raw_ends.append(raw_end)
+
+    @property
+    def changed(self):
+        """Metin normalizasyonla değiştiyse True"""
+        return bool(self.norm_starts)
+
+    def to_raw(self, position):
+        """
+        Normalize metindeki pozisyonun ham metindeki karşılığı.
+        Değiştirilmiş bir bölümün içindeki pozisyonlar bölümün ham başlangıcına eşlenir.
+        """
+        index = bisect_right(self.norm_starts, position) - 1
+        if index < 0:
+            return position
+        if position < self.norm_ends[index]:
+            return self.raw_starts[index]
+        return self.raw_ends[index] + position - self.norm_ends[index]
+
+    def raw_span(self, start, end):
+        """Normalize metindeki [start, end) aralığının ham metindeki karşılığı"""
+        if end <= start:
+            raw_start = self.to_raw(start)
+            return raw_start, raw_start
+
+        # Bitiş: aralığın içinde başlayan son bölümün ham bitişi veya sonrasındaki birebir kısım
+        index = bisect_right(self.norm_starts, end - 1) - 1
+        if index < 0:
+            raw_end = end
+        elif end <= self.norm_ends[index]:
+            raw_end = self.raw_ends[index]
+        else:
+            raw_end = self.raw_ends[index] + end - self.norm_ends[index]
+        return self.to_raw(start), raw_end
+
+    def raw_slice(self, start, end):
+        """Normalize metindeki [start, end) aralığına karşılık gelen ham metin"""
+        raw_start, raw_end = self.raw_span(start, end)
+        return self.raw_text[raw_start:raw_end]
+
+
+def _normalize_segment(segment):
+    if segment == "-\n":
+        return ""
+    return unicodedata.normalize("NFKC", segment.translate(NORMALIZATION_TABLE))
+
+
+def normalize_text(text):
+    """
+    Metni tek geçişte normalize et: bitişik harfler, yumuşak tire ve görünmez karakterler,
+    Unicode boşluk/tire çeşitleri (str.translate tablosu), NFKC uyumluluk biçimleri ve satır
+    sonu tirelemesi.
+
+    Yalnızca ASCII olmayan karakterler ve tirelemeler ele alınır; metnin geri kalanı parça
+    parça kopyalanır. Tamamen ASCII ve tirelemesiz metin olduğu gibi döndürülür.
+
+    Args:
+        text (str): Ham metin (ör. PDF sayfa metni)
+
+    Returns:
+        NormalizedText: Normalize metin ve ham metne ofset haritası
+    """
+    if not text or (text.isascii() and "-\n" not in text):
+        return NormalizedText(text or "", text or "")
+
+    parts = []
+    segments = []
+    raw_position = 0
+    norm_position = 0
+    for match in NORMALIZATION_SEGMENT_RE.finditer(text):
+        segment = match.group()
+        replacement = _normalize_segment(segment)
+        if replacement == segment:
+            continue
+
+        start, end = match.span()
+        parts.append(text[raw_position:start])
+        norm_position += start - raw_position
+        parts.append(replacement)
+        segments.append((norm_position, norm_position + len(replacement), start, end))
+        norm_position += len(replacement)
+        raw_position = end
+
+    if not segments:
+        return NormalizedText(text, text)
+
+    parts.append(text[raw_position:])
+    return NormalizedText("".join(parts), text, segments)
+
+
+def normalize_entity(entity):
+    """
+    Varlık metnini PDF'te aranacak biçime getir: normalize et, satır sonlarını ve ardışık
+    boşlukları tek boşluğa indir.
+    """
+    return WHITESPACE_RUN_RE.sub(" ", normalize_text(entity).text).strip()
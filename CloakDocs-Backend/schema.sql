@@ -73,6 +73,19 @@ CREATE TABLE IF NOT EXISTS paper_logs (
     FOREIGN KEY (paper_id) REFERENCES papers(id) ON DELETE CASCADE
 );
 
+-- Revizyon tespiti için sayfa kayıtları tablosu
+CREATE TABLE IF NOT EXISTS paper_page_records (
+    id SERIAL PRIMARY KEY,
+    paper_id INTEGER NOT NULL,
+    options VARCHAR(100) NOT NULL,
+    detector_version VARCHAR(255) NOT NULL,
+    record TEXT NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (paper_id, options),
+    FOREIGN KEY (paper_id) REFERENCES papers(id) ON DELETE CASCADE
+);
+
 -- İndeksler
 CREATE INDEX IF NOT EXISTS papers_tracking_number_idx ON papers(tracking_number);
 CREATE INDEX IF NOT EXISTS papers_email_idx ON papers(email);
@@ -151,3 +164,12 @@ COMMENT ON COLUMN paper_logs.event_description IS 'İşlem açıklaması';
 COMMENT ON COLUMN paper_logs.user_email IS 'İşlemi yapan kullanıcının e-posta adresi';
 COMMENT ON COLUMN paper_logs.created_at IS 'Log kaydının oluşturulma tarihi';
 COMMENT ON COLUMN paper_logs.additional_data IS 'İşlemle ilgili ek bilgiler (JSON formatında)';
+
+COMMENT ON TABLE paper_page_records IS 'Revizyonlarda artımlı varlık tespiti için sayfa kayıtları';
+COMMENT ON COLUMN paper_page_records.id IS 'Sayfa kaydı ID';
+COMMENT ON COLUMN paper_page_records.paper_id IS 'İlgili makale ID';
+COMMENT ON COLUMN paper_page_records.options IS 'Anonimleştirme seçenekleri (sıralı, virgülle ayrılmış)';
+COMMENT ON COLUMN paper_page_records.detector_version IS 'Kaydı oluşturan varlık tespiti sürümü';
+COMMENT ON COLUMN paper_page_records.record IS 'Sayfa parmak izleri ve sayfa varlıkları (JSON formatında)';
+COMMENT ON COLUMN paper_page_records.created_at IS 'Oluşturulma tarihi';
+COMMENT ON COLUMN paper_page_records.updated_at IS 'Son güncelleme tarihi';